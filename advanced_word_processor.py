@@ -7,7 +7,13 @@ Provides more sophisticated text processing and replacement capabilities
 import os
 import re
 import json
-from typing import List, Dict, Tuple, Optional, Any
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Tuple, Optional, Any, Iterator
 from pathlib import Path
 import logging
 from datetime import datetime
@@ -15,37 +21,184 @@ import subprocess
 import tempfile
 import shutil
 import platform
+import sys
+import zipfile
 
 try:
     from docx import Document
     from docx.shared import Inches, RGBColor
     from docx.enum.text import WD_COLOR_INDEX
     from docx.oxml.shared import OxmlElement, qn
+    from docx.styles import BabelFish
+    from lxml import etree
 except ImportError:
     print("python-docx library not found. Install with: pip install python-docx")
     exit(1)
 
+try:
+    import orjson  # Optional: much faster JSON export
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Case-insensitive prefilters fold oversized blocks in windows of this many characters
+SEARCH_WINDOW_CHARS = 1 << 20
+
+# ioctl request for a Linux copy-on-write file clone (Btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+def _clone_file(src: str, dst: str) -> bool:
+    """
+    Create dst as a copy-on-write clone of src (clonefile on APFS, FICLONE on Linux)
+    
+    Returns:
+        True if dst was cloned; False, leaving nothing behind, when the platform or
+        filesystem cannot clone (or dst already exists)
+    """
+    if sys.platform == 'darwin':
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+        except (OSError, AttributeError):
+            return False
+    if not sys.platform.startswith('linux'):
+        return False
+    
+    import fcntl
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except OSError:
+        os.close(src_fd)
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        os.close(dst_fd)
+        dst_fd = -1
+        os.unlink(dst)
+        return False
+    finally:
+        os.close(src_fd)
+        if dst_fd >= 0:
+            os.close(dst_fd)
+
 class AdvancedWordProcessor:
     """Enhanced Word document processor with advanced find and replace capabilities"""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 32, max_workers: Optional[int] = None, parallel_threshold: int = 8,
+                 dir_cache_ttl: float = 60.0,
+                 scan_cache_size: int = 64, scan_cache_ttl: float = 300.0):
         self.supported_extensions = ['.docx', '.doc']
         self.backup_dir = Path("backups")
         self.backup_dir.mkdir(exist_ok=True)
+        # Directory scans fan out to worker processes once enough files need parsing
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        # Parsed documents and extracted structures keyed by path, validated by (st_mtime_ns, st_size)
+        self.cache_size = cache_size
+        self._structure_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+        self._document_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Word file listings keyed by directory: (listed_at, directory st_mtime_ns, files)
+        self.dir_cache_ttl = dir_cache_ttl
+        self._dir_cache: Dict[str, Tuple[float, int, List[str]]] = {}
+        # Directory scan results keyed by (directory, term, context, case), shared by all requests:
+        # (expires_at, generation, files, file signatures, result). Every replacement bumps the generation.
+        self.scan_cache_size = scan_cache_size
+        self.scan_cache_ttl = scan_cache_ttl
+        self._scan_cache: "OrderedDict[Tuple[str, str, int, bool], Tuple]" = OrderedDict()
+        self._scan_generation = 0
+        self._textutil_available: Optional[bool] = None
+    
+    @staticmethod
+    def _cache_key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+    
+    @staticmethod
+    def _get_file_signature(file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+    
+    def _cache_get(self, cache: OrderedDict, file_path: str, signature: Optional[Tuple[int, int]], pop: bool = False):
+        """Return a cached value if it was stored for the same file signature."""
+        if signature is None:
+            return None
+        key = self._cache_key(file_path)
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] != signature:
+                del cache[key]
+                return None
+            if pop:
+                del cache[key]
+            else:
+                cache.move_to_end(key)
+            return entry[1]
+    
+    def _cache_put(self, cache: OrderedDict, file_path: str, signature: Optional[Tuple[int, int]], value: Any) -> None:
+        if signature is None or self.cache_size <= 0:
+            return
+        key = self._cache_key(file_path)
+        with self._cache_lock:
+            cache[key] = (signature, value)
+            cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+    
+    def invalidate_cache(self, file_path: Optional[str] = None) -> None:
+        """Drop cached documents and structures for one file, or for all files."""
+        with self._cache_lock:
+            if file_path is None:
+                self._structure_cache.clear()
+                self._document_cache.clear()
+                self._dir_cache.clear()
+                self._scan_cache.clear()
+                return
+            key = self._cache_key(file_path)
+            self._structure_cache.pop(key, None)
+            self._document_cache.pop(key, None)
+    
+    def _take_document(self, file_path: str):
+        """
+        Return a Document for a .docx file, reusing a cached parse when the file is unchanged.
+        
+        The cached instance is removed from the cache so the caller has exclusive use of it;
+        hand it back with _store_document once done.
+        """
+        signature = self._get_file_signature(file_path)
+        doc = self._cache_get(self._document_cache, file_path, signature, pop=True)
+        if doc is None:
+            doc = Document(file_path)
+        return doc
+    
+    def _store_document(self, file_path: str, doc) -> None:
+        self._cache_put(self._document_cache, file_path, self._get_file_signature(file_path), doc)
     
     def _is_macos(self) -> bool:
         return platform.system() == 'Darwin'
     
     def _has_textutil(self) -> bool:
-        try:
-            subprocess.run(["which", "textutil"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            return True
-        except Exception:
-            return False
+        if self._textutil_available is None:
+            try:
+                subprocess.run(["which", "textutil"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                self._textutil_available = True
+            except Exception:
+                self._textutil_available = False
+        return self._textutil_available
     
     def _convert_doc_to_docx(self, doc_path: str) -> Optional[str]:
         """Convert a .doc file to a temporary .docx using textutil on macOS."""
@@ -61,6 +214,45 @@ class AdvancedWordProcessor:
             logger.error(f"Failed to convert .doc to .docx for {doc_path}: {e}")
             return None
     
+    def _convert_docs_to_docx_batch(self, doc_paths: List[str]) -> Dict[str, str]:
+        """
+        Convert many .doc files to temporary .docx files with as few textutil runs as possible
+        
+        textutil accepts several inputs per invocation, so one process converts a whole batch
+        instead of paying process startup per file. Output files are named after the input
+        stems, so inputs sharing a stem go to separate batches.
+        
+        Returns:
+            Mapping of .doc path to converted .docx path; files that failed to convert are absent
+        """
+        if not doc_paths or not self._is_macos() or not self._has_textutil():
+            return {}
+        
+        batches: List[Dict[str, str]] = []
+        for doc_path in doc_paths:
+            stem = Path(doc_path).stem
+            for batch in batches:
+                if stem not in batch:
+                    batch[stem] = doc_path
+                    break
+            else:
+                batches.append({stem: doc_path})
+        
+        converted: Dict[str, str] = {}
+        for batch in batches:
+            temp_dir = tempfile.mkdtemp(prefix="doc_convert_")
+            try:
+                subprocess.run(["textutil", "-convert", "docx", *batch.values(), "-outputdir", temp_dir], check=True)
+            except Exception as e:
+                logger.error(f"Batch .doc conversion failed, converting files one by one: {e}")
+            for stem, doc_path in batch.items():
+                out_path = str(Path(temp_dir) / (stem + ".docx"))
+                if os.path.exists(out_path):
+                    converted[doc_path] = out_path
+            if not any(doc_path in converted for doc_path in batch.values()):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        return converted
+    
     def _convert_docx_to_doc(self, docx_path: str, dest_doc_path: str) -> bool:
         """Convert a .docx file back to .doc using textutil on macOS."""
         if not self._is_macos() or not self._has_textutil():
@@ -77,6 +269,77 @@ class AdvancedWordProcessor:
         """Check if file is a supported Word document"""
         return Path(file_path).suffix.lower() in self.supported_extensions
     
+    def list_word_files(self, directory_path: str) -> List[str]:
+        """
+        List supported Word files anywhere under a directory
+        
+        Listings are cached for dir_cache_ttl seconds, and dropped early when the
+        directory's own modification time changes.
+        
+        Args:
+            directory_path: Directory to walk recursively
+            
+        Returns:
+            Sorted list of file paths
+        """
+        try:
+            mtime_ns = os.stat(directory_path).st_mtime_ns
+        except OSError:
+            return []
+        
+        now = time.monotonic()
+        cached = self._cached_listing(directory_path, mtime_ns, now)
+        if cached is not None:
+            return list(cached)
+        
+        files = sorted(self._iter_walk(directory_path))
+        with self._cache_lock:
+            self._dir_cache[self._cache_key(directory_path)] = (now, mtime_ns, files)
+        return list(files)
+    
+    def iter_word_files(self, directory_path: str) -> Iterator[str]:
+        """
+        Yield supported Word files under a directory as they are found
+        
+        Serves a cached listing when there is one; otherwise walks lazily, so a caller that
+        only needs the first few files stops the walk early. Walk order is unsorted.
+        """
+        try:
+            mtime_ns = os.stat(directory_path).st_mtime_ns
+        except OSError:
+            return
+        cached = self._cached_listing(directory_path, mtime_ns, time.monotonic())
+        if cached is not None:
+            yield from cached
+        else:
+            yield from self._iter_walk(directory_path)
+    
+    def _cached_listing(self, directory_path: str, mtime_ns: int, now: float) -> Optional[List[str]]:
+        with self._cache_lock:
+            cached = self._dir_cache.get(self._cache_key(directory_path))
+        if cached is not None and cached[1] == mtime_ns and now - cached[0] < self.dir_cache_ttl:
+            return cached[2]
+        return None
+    
+    def _iter_walk(self, directory_path: str) -> Iterator[str]:
+        """Yield Word files from a single os.scandir walk, matching every extension at once."""
+        extensions = tuple(self.supported_extensions)
+        pending = [directory_path]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.name.lower().endswith(extensions) and entry.is_file():
+                                yield entry.path
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.warning(f"Could not list {current}: {e}")
+    
     def create_backup(self, file_path: str) -> str:
         """Create a backup of the original file"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -85,7 +348,12 @@ class AdvancedWordProcessor:
         backup_path = self.backup_dir / backup_name
         
         try:
-            shutil.copy2(file_path, backup_path)
+            # A copy-on-write clone shares the original's blocks. A hardlink would not do:
+            # python-docx saves by truncating and rewriting the same inode.
+            if _clone_file(file_path, str(backup_path)):
+                shutil.copystat(file_path, backup_path)
+            else:
+                shutil.copy2(file_path, backup_path)
             logger.info(f"Created backup: {backup_path}")
             return str(backup_path)
         except Exception as e:
@@ -102,68 +370,172 @@ class AdvancedWordProcessor:
             - tables: List of table data
             - full_text: Complete document text
         """
+        structure = self._load_structure(file_path)
+        if 'full_text' not in structure:
+            # Joined on first request only; scanning works block by block without it
+            structure['full_text'] = '\n'.join(text for _, _, text in self._structure_blocks(structure))
+        return structure
+    
+    def iter_text_blocks(self, file_path: str) -> Iterator[Tuple[str, int, str]]:
+        """
+        Iterate over the text blocks of a Word document in full_text order
+        
+        Yields:
+            (kind, index, text) tuples: every non-empty paragraph ("paragraph", paragraph
+            position), then every table cell ("table", table index)
+        """
+        yield from self._structure_blocks(self._load_structure(file_path))
+    
+    @staticmethod
+    def _structure_blocks(structure: Dict[str, Any]) -> Iterator[Tuple[str, int, str]]:
+        """Yield (kind, index, text) for each paragraph and table cell of an extracted structure."""
+        for para_idx, paragraph in enumerate(structure['paragraphs']):
+            yield "paragraph", para_idx, paragraph['text']
+        for table in structure['tables']:
+            for row in table['rows']:
+                for cell in row['cells']:
+                    yield "table", table['index'], cell['text']
+    
+    @staticmethod
+    def _docx_extract_structure(doc, file_path: str) -> Dict[str, Any]:
+        """Build the structure dictionary from a python-docx Document."""
+        result = {
+            'paragraphs': [],
+            'tables': [],
+            'file_path': file_path
+        }
+        
+        # Extract paragraphs with metadata
+        for i, paragraph in enumerate(doc.paragraphs):
+            if paragraph.text.strip():  # Only include non-empty paragraphs
+                result['paragraphs'].append({
+                    'index': i,
+                    'text': paragraph.text,
+                    'style': paragraph.style.name if paragraph.style else 'Normal'
+                })
+        
+        # Extract table data
+        for table_idx, table in enumerate(doc.tables):
+            table_data = {
+                'index': table_idx,
+                'rows': []
+            }
+            for row_idx, row in enumerate(table.rows):
+                row_data = {
+                    'index': row_idx,
+                    'cells': []
+                }
+                for cell_idx, cell in enumerate(row.cells):
+                    row_data['cells'].append({
+                        'index': cell_idx,
+                        'text': cell.text
+                    })
+                table_data['rows'].append(row_data)
+            result['tables'].append(table_data)
+        return result
+    
+    def _fast_extract_structure(self, docx_path: str, file_path: str) -> Dict[str, Any]:
+        """
+        Build the structure dictionary by streaming word/document.xml with lxml iterparse
+        
+        Produces the same paragraphs, tables and text as _docx_extract_structure without
+        building python-docx's object model. Each top-level paragraph or table is read when
+        its closing tag is parsed and then freed, so only one body block is held at a time.
+        """
+        result = {
+            'paragraphs': [],
+            'tables': [],
+            'file_path': file_path
+        }
+        with zipfile.ZipFile(docx_path) as package:
+            style_names, default_style = self._read_style_names(package)
+            paragraph_idx = 0
+            with package.open('word/document.xml') as document_xml:
+                for _event, elem in etree.iterparse(document_xml, events=('end',), tag=(_W_P, _W_TBL),
+                                                    huge_tree=True):
+                    parent = elem.getparent()
+                    if parent is None or parent.tag != _W_BODY:
+                        continue
+                    if elem.tag == _W_P:
+                        text = _paragraph_text(elem)
+                        if text.strip():
+                            style_elem = elem.find(f'{_W_PPR}/{_W_PSTYLE}')
+                            style_id = style_elem.get(_W_VAL) if style_elem is not None else None
+                            result['paragraphs'].append({
+                                'index': paragraph_idx,
+                                'text': text,
+                                'style': style_names.get(style_id, default_style)
+                            })
+                        paragraph_idx += 1
+                    else:
+                        result['tables'].append(_table_structure(elem, len(result['tables'])))
+                    # Free the processed block and everything parsed before it
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        return result
+    
+    @staticmethod
+    def _read_style_names(package: zipfile.ZipFile) -> Tuple[Dict[str, str], str]:
+        """Map paragraph style ids to their UI names, plus the default paragraph style name."""
+        try:
+            styles_root = etree.fromstring(package.read('word/styles.xml'))
+        except KeyError:
+            return {}, 'Normal'
+        names: Dict[str, str] = {}
+        default_name = 'Normal'
+        for style in styles_root.iterchildren(_W_STYLE):
+            if style.get(_W_TYPE) != 'paragraph':
+                continue
+            name_elem = style.find(_W_NAME)
+            if name_elem is None:
+                continue
+            name = BabelFish.internal2ui(name_elem.get(_W_VAL))
+            names[style.get(_W_STYLE_ID)] = name
+            if style.get(_W_DEFAULT) in ('1', 'true', 'on'):
+                default_name = name
+        return names, default_name
+    
+    def _load_structure(self, file_path: str, converted_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse paragraphs and tables of a document (cached), without joining full_text
+        
+        Args:
+            file_path: Path to Word document
+            converted_path: Already converted .docx for a .doc file; removed once read
+        """
+        signature = self._get_file_signature(file_path)
+        cached = self._cache_get(self._structure_cache, file_path, signature)
+        if cached is not None:
+            return cached
+        
         try:
             # If this is a .doc, convert to a temporary .docx for structured extraction
             working_path = file_path
             cleanup_paths: List[str] = []
-            if Path(file_path).suffix.lower() == '.doc':
-                converted = self._convert_doc_to_docx(file_path)
+            is_doc = Path(file_path).suffix.lower() == '.doc'
+            if is_doc:
+                converted = converted_path or self._convert_doc_to_docx(file_path)
                 if converted:
                     working_path = converted
                     cleanup_paths.append(converted)
                 else:
                     # Cannot process .doc without conversion
-                    return {'paragraphs': [], 'tables': [], 'full_text': '', 'file_path': file_path}
+                    return {'paragraphs': [], 'tables': [], 'file_path': file_path}
             
-            doc = Document(working_path)
-            result = {
-                'paragraphs': [],
-                'tables': [],
-                'full_text': '',
-                'file_path': file_path
-            }
-            
-            # Extract paragraphs with metadata
-            for i, paragraph in enumerate(doc.paragraphs):
-                if paragraph.text.strip():  # Only include non-empty paragraphs
-                    result['paragraphs'].append({
-                        'index': i,
-                        'text': paragraph.text,
-                        'style': paragraph.style.name if paragraph.style else 'Normal'
-                    })
-            
-            # Extract table data
-            for table_idx, table in enumerate(doc.tables):
-                table_data = {
-                    'index': table_idx,
-                    'rows': []
-                }
-                for row_idx, row in enumerate(table.rows):
-                    row_data = {
-                        'index': row_idx,
-                        'cells': []
-                    }
-                    for cell_idx, cell in enumerate(row.cells):
-                        row_data['cells'].append({
-                            'index': cell_idx,
-                            'text': cell.text
-                        })
-                    table_data['rows'].append(row_data)
-                result['tables'].append(table_data)
-            
-            # Create full text
-            all_text_parts = [p['text'] for p in result['paragraphs']]
-            for table in result['tables']:
-                for row in table['rows']:
-                    for cell in row['cells']:
-                        all_text_parts.append(cell['text'])
+            try:
+                result = self._fast_extract_structure(working_path, file_path)
+            except (KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+                # Unusual package layout; let python-docx resolve it
+                logger.debug(f"Fast extraction failed for {file_path}, using python-docx: {e}")
+                result = self._docx_extract_structure(Document(working_path), file_path)
             
-            result['full_text'] = '\n'.join(all_text_parts)
+            self._cache_put(self._structure_cache, file_path, signature, result)
             return result
             
         except Exception as e:
             logger.error(f"Error extracting text from {file_path}: {e}")
-            return {'paragraphs': [], 'tables': [], 'full_text': '', 'file_path': file_path}
+            return {'paragraphs': [], 'tables': [], 'file_path': file_path}
         finally:
             # Clean up any temporary converted files
             try:
@@ -180,98 +552,176 @@ class AdvancedWordProcessor:
             except Exception:
                 pass
     
+    @staticmethod
+    def compile_search_pattern(search_term: str, case_sensitive: bool = False) -> re.Pattern:
+        """Compile the literal search pattern used by the scanning methods."""
+        flags = 0 if case_sensitive else re.IGNORECASE
+        return re.compile(re.escape(search_term), flags)
+    
+    @staticmethod
+    def _block_offsets(texts: List[str]) -> Tuple[List[int], int]:
+        """
+        Return each block's start offset in the newline-joined full_text, and its length
+        
+        full_text itself is never materialised on the scan path; context windows are
+        sliced out of the neighbouring blocks instead.
+        """
+        starts: List[int] = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        return starts, max(offset - 1, 0)
+    
+    @staticmethod
+    def _slice_blocks(texts: List[str], starts: List[int], start: int, end: int) -> str:
+        """Return full_text[start:end] from the individual blocks without joining them."""
+        parts = []
+        i = max(bisect_right(starts, start) - 1, 0)
+        while i < len(texts) and starts[i] < end:
+            text = texts[i]
+            offset = starts[i]
+            parts.append(text[max(start - offset, 0):end - offset])
+            if end - offset > len(text) and i + 1 < len(texts):
+                parts.append("\n")
+            i += 1
+        return "".join(parts)
+    
+    @staticmethod
+    def _fold(text: str) -> str:
+        """
+        casefold() text for the prefilter, also folding the two Turkish i's to 'i'
+        
+        re.IGNORECASE matches 'i' against both 'ı' and 'İ', but casefold() keeps 'ı' and
+        turns 'İ' into 'i' plus a combining dot; with these two replacements every
+        character re matches against an ASCII needle folds to the needle's own fold.
+        """
+        return text.casefold().replace('i\u0307', 'i').replace('\u0131', 'i')
+    
+    @classmethod
+    def _prefilter_needle(cls, search_term: str, case_sensitive: bool) -> Optional[str]:
+        """
+        Needle for _block_contains, or None when a literal check could hide a match
+        
+        re.IGNORECASE folds one character at a time, which differs from casefold() for
+        non-ASCII text (casefold('İ') is two characters); such needles skip the prefilter.
+        """
+        if case_sensitive:
+            return search_term
+        needle = cls._fold(search_term)
+        return needle if needle.isascii() else None
+    
+    @classmethod
+    def _block_contains(cls, text: str, needle: str, case_sensitive: bool,
+                        window: int = SEARCH_WINDOW_CHARS) -> bool:
+        """
+        Check whether a block may contain the needle from _prefilter_needle
+        
+        Blocks longer than window are folded one window at a time, each overlapping the
+        previous by len(needle) - 1 characters, so no match is lost at a window edge and
+        at most one window-sized copy of the block exists at once.
+        """
+        if case_sensitive:
+            return needle in text
+        if len(text) <= window:
+            return needle in cls._fold(text)
+        overlap = max(len(needle) - 1, 0)
+        for start in range(0, len(text), window):
+            if needle in cls._fold(text[start:start + window + overlap]):
+                return True
+        return False
+    
     def find_occurrences_with_context(
         self,
         file_path: str,
         search_term: str,
         context_chars: int = 150,
-        case_sensitive: bool = False
+        case_sensitive: bool = False,
+        pattern: Optional[re.Pattern] = None
     ) -> List[Dict]:
         """
         Find all occurrences with enhanced context and metadata
         
+        Args:
+            pattern: Precompiled search pattern; compiled from search_term when omitted
+        
         Returns:
             List of occurrence dictionaries with detailed information
         """
-        doc_structure = self.extract_text_with_structure(file_path)
-        if not doc_structure['full_text']:
+        blocks = list(self.iter_text_blocks(file_path))
+        if not blocks:
             return []
         
         occurrences = []
-        flags = 0 if case_sensitive else re.IGNORECASE
-        search_pattern = re.compile(re.escape(search_term), flags)
+        search_pattern = pattern or self.compile_search_pattern(search_term, case_sensitive)
+        # Literal containment is far cheaper than a regex pass over blocks without the term
+        needle = self._prefilter_needle(search_term, case_sensitive)
         
-        for match in search_pattern.finditer(doc_structure['full_text']):
-            start_pos = match.start()
-            end_pos = match.end()
-            
-            # Get context around the match
-            context_start = max(0, start_pos - context_chars)
-            context_end = min(len(doc_structure['full_text']), end_pos + context_chars)
-            
-            context_before = doc_structure['full_text'][context_start:start_pos]
-            context_after = doc_structure['full_text'][end_pos:context_end]
-            full_context = doc_structure['full_text'][context_start:context_end]
-            
-            # Determine if match is in a table or paragraph
-            location_type = "paragraph"
-            location_index = 0
-            
-            # Check if match is in a table
-            current_pos = 0
-            for table_idx, table in enumerate(doc_structure['tables']):
-                table_text = ""
-                for row in table['rows']:
-                    for cell in row['cells']:
-                        cell_text = cell['text'] + "\n"
-                        if current_pos <= start_pos < current_pos + len(cell_text):
-                            location_type = "table"
-                            location_index = table_idx
-                            break
-                        table_text += cell_text
-                        current_pos += len(cell_text)
-                    if location_type == "table":
-                        break
-                if location_type == "table":
-                    break
-            
-            # If not in table, find paragraph
-            if location_type == "paragraph":
-                current_pos = 0
-                for para_idx, paragraph in enumerate(doc_structure['paragraphs']):
-                    para_text = paragraph['text'] + "\n"
-                    if current_pos <= start_pos < current_pos + len(para_text):
-                        location_index = para_idx
-                        break
-                    current_pos += len(para_text)
-            
-            occurrences.append({
-                'file_path': file_path,
-                'match_text': match.group(),
-                'context_before': context_before,
-                'context_after': context_after,
-                'full_context': full_context,
-                'context': full_context,
-                'start_pos': start_pos,
-                'end_pos': end_pos,
-                'location_type': location_type,
-                'location_index': location_index,
-                'replacement_text': match.group().replace(search_term, search_term),  # Placeholder
-                'unique_id': f"{Path(file_path).name}_{start_pos}_{end_pos}"
-            })
+        texts = [text for _, _, text in blocks]
+        block_starts, total_length = self._block_offsets(texts)
+        
+        for block_idx, (location_type, location_index, text) in enumerate(blocks):
+            if needle is not None and not self._block_contains(text, needle, case_sensitive):
+                continue
+            for match in search_pattern.finditer(text):
+                start_pos = block_starts[block_idx] + match.start()
+                end_pos = block_starts[block_idx] + match.end()
+                
+                # Get context around the match
+                context_start = max(0, start_pos - context_chars)
+                context_end = min(total_length, end_pos + context_chars)
+                
+                # Only the two flanks the results table renders; the joined context is
+                # available on demand through get_context
+                occurrences.append({
+                    'file_path': file_path,
+                    'match_text': match.group(),
+                    'context_before': self._slice_blocks(texts, block_starts, context_start, start_pos),
+                    'context_after': self._slice_blocks(texts, block_starts, end_pos, context_end),
+                    'start_pos': start_pos,
+                    'end_pos': end_pos,
+                    'location_type': location_type,
+                    'location_index': location_index
+                })
         
         return occurrences
     
-    def replace_text_advanced(self, file_path: str, old_text: str, new_text: str, 
-                            occurrence_id: Optional[str] = None) -> Dict[str, Any]:
+    def get_context(self, file_path: str, start_pos: int, end_pos: int,
+                    context_chars: int = 150) -> Dict[str, str]:
         """
-        Advanced text replacement with specific occurrence targeting
+        Slice the context around a match on demand from the cached document structure
         
         Args:
             file_path: Path to Word document
-            old_text: Text to find
-            new_text: Text to replace with
-            occurrence_id: Specific occurrence ID to replace (if None, replaces all)
+            start_pos: Match start offset, as reported by find_occurrences_with_context
+            end_pos: Match end offset
+            context_chars: Characters of context on each side
+            
+        Returns:
+            Dictionary with context_before, match_text, context_after and full_context
+        """
+        texts = [text for _, _, text in self.iter_text_blocks(file_path)]
+        starts, total_length = self._block_offsets(texts)
+        start_pos = min(max(start_pos, 0), total_length)
+        end_pos = min(max(end_pos, start_pos), total_length)
+        context_before = self._slice_blocks(texts, starts, max(0, start_pos - context_chars), start_pos)
+        match_text = self._slice_blocks(texts, starts, start_pos, end_pos)
+        context_after = self._slice_blocks(texts, starts, end_pos, min(total_length, end_pos + context_chars))
+        return {
+            'context_before': context_before,
+            'match_text': match_text,
+            'context_after': context_after,
+            'full_context': context_before + match_text + context_after
+        }
+    
+    def _apply_document_edits(self, file_path: str, edit, not_found_error: str) -> Dict[str, Any]:
+        """
+        Open a document once, apply an edit callback, and save it if anything changed
+        
+        Args:
+            file_path: Path to Word document
+            edit: Callable receiving the Document and returning the number of replacements made
+            not_found_error: Error message reported when the callback made no replacements
             
         Returns:
             Dictionary with replacement results
@@ -300,39 +750,17 @@ class AdvancedWordProcessor:
                     return result
                 working_path = temp_converted
             
-            doc = Document(working_path)
-            replacements_made = 0
-            
-            replacement_done = False
-
-            # Replace in paragraphs
-            for paragraph in doc.paragraphs:
-                if old_text in paragraph.text:
-                    paragraph.text = paragraph.text.replace(old_text, new_text, 1)
-                    replacements_made += 1
-                    replacement_done = True
-                    break
-
-            # Replace in tables only if not already replaced
-            if not replacement_done:
-                for table in doc.tables:
-                    table_replaced = False
-                    for row in table.rows:
-                        for cell in row.cells:
-                            if old_text in cell.text:
-                                cell.text = cell.text.replace(old_text, new_text, 1)
-                                replacements_made += 1
-                                replacement_done = True
-                                table_replaced = True
-                                break
-                        if table_replaced:
-                            break
-                    if table_replaced:
-                        break
+            doc = Document(working_path) if temp_converted else self._take_document(working_path)
+            replacements_made = edit(doc)
             
             if replacements_made > 0:
                 # Save the edited document
                 doc.save(working_path)
+                self.invalidate_cache(file_path)
+                with self._cache_lock:
+                    # Cached scans may include this file; signatures alone can miss a same-size
+                    # save within the filesystem's timestamp granularity
+                    self._scan_generation += 1
                 
                 if original_suffix == '.doc':
                     # Convert back to .doc, overwriting original
@@ -340,12 +768,17 @@ class AdvancedWordProcessor:
                     if not success:
                         result['error'] = "Failed to convert updated .docx back to .doc."
                         return result
+                else:
+                    # The in-memory document now matches the saved file; keep it for follow-up replacements
+                    self._store_document(file_path, doc)
                 
                 result['success'] = True
                 result['replacements_made'] = replacements_made
                 logger.info(f"Made {replacements_made} replacements in {file_path}")
             else:
-                result['error'] = f"No occurrences of '{old_text}' found"
+                if not temp_converted:
+                    self._store_document(file_path, doc)
+                result['error'] = not_found_error
                 logger.warning(result['error'])
                 
         except Exception as e:
@@ -365,6 +798,166 @@ class AdvancedWordProcessor:
         
         return result
     
+    @staticmethod
+    def _replace_in_paragraph(paragraph, pattern: re.Pattern, repl, count: int = 0) -> int:
+        """
+        Replace pattern matches inside a paragraph by editing only the affected runs
+        
+        Assigning paragraph.text drops every run and its formatting; here a match inside a
+        single run rewrites that run's text, and a match spanning runs is written into its
+        first run while the runs it fully consumes are removed.
+        
+        Args:
+            paragraph: python-docx Paragraph
+            pattern: Compiled pattern to replace
+            repl: Replacement string, or a callable receiving the match (as with re.sub)
+            count: Maximum number of matches to replace; 0 replaces all
+            
+        Returns:
+            Number of matches replaced
+        """
+        runs = paragraph.runs
+        run_texts = [run.text for run in runs]
+        joined = "".join(run_texts)
+        if joined != paragraph.text:
+            # Text outside plain runs (e.g. hyperlinks); fall back to rewriting the paragraph
+            text, made = pattern.subn(repl, paragraph.text, count=count)
+            if made:
+                paragraph.text = text
+            return made
+        
+        edits = []
+        for match in pattern.finditer(joined):
+            replacement = repl(match) if callable(repl) else repl
+            edits.append((match.start(), match.end(), replacement, match.group()))
+            if count and len(edits) == count:
+                break
+        if not edits:
+            return 0
+        
+        run_starts = []
+        offset = 0
+        for text in run_texts:
+            run_starts.append(offset)
+            offset += len(text)
+        
+        # Apply from the end so earlier offsets stay valid
+        for start, end, replacement, original in reversed(edits):
+            if replacement == original:
+                continue
+            first = bisect_right(run_starts, start) - 1
+            last = bisect_right(run_starts, end - 1) - 1 if end > start else first
+            first_text = runs[first].text
+            if first == last:
+                local_start = start - run_starts[first]
+                local_end = end - run_starts[first]
+                runs[first].text = first_text[:local_start] + replacement + first_text[local_end:]
+                continue
+            runs[first].text = first_text[:start - run_starts[first]] + replacement
+            for run in runs[first + 1:last]:
+                run._r.getparent().remove(run._r)
+            last_text = runs[last].text[end - run_starts[last]:]
+            if last_text:
+                runs[last].text = last_text
+            else:
+                runs[last]._r.getparent().remove(runs[last]._r)
+        return len(edits)
+    
+    def replace_text_advanced(self, file_path: str, old_text: str, new_text: str, 
+                            occurrence_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Advanced text replacement with specific occurrence targeting
+        
+        Args:
+            file_path: Path to Word document
+            old_text: Text to find
+            new_text: Text to replace with
+            occurrence_id: Specific occurrence ID to replace (if None, replaces all)
+            
+        Returns:
+            Dictionary with replacement results
+        """
+        pattern = re.compile(re.escape(old_text))
+        
+        def edit(doc) -> int:
+            # Replace in paragraphs
+            for paragraph in doc.paragraphs:
+                if self._replace_in_paragraph(paragraph, pattern, new_text, count=1):
+                    return 1
+
+            # Replace in tables only if not already replaced
+            for table in doc.tables:
+                for row in table.rows:
+                    for cell in row.cells:
+                        for paragraph in cell.paragraphs:
+                            if self._replace_in_paragraph(paragraph, pattern, new_text, count=1):
+                                return 1
+            return 0
+        
+        return self._apply_document_edits(file_path, edit, f"No occurrences of '{old_text}' found")
+    
+    def replace_many(self, file_path: str, pairs: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Apply several replacements to one document with a single open, backup and save
+        
+        The n-th pair for a given old text is applied to the n-th occurrence of that text in
+        document order (paragraphs first, then tables), matching what issuing the pairs one
+        by one through replace_text_advanced would do.
+        
+        Args:
+            file_path: Path to Word document
+            pairs: List of (old_text, new_text) tuples
+            
+        Returns:
+            Dictionary with replacement results plus an 'applied' flag for each pair
+        """
+        applied = [False] * len(pairs)
+        pending: Dict[str, List[int]] = {}
+        for index, (old_text, _new_text) in enumerate(pairs):
+            if old_text:
+                pending.setdefault(old_text, []).append(index)
+        
+        if not pending:
+            return {
+                'success': False,
+                'replacements_made': 0,
+                'backup_path': '',
+                'error': 'No replacements provided',
+                'applied': applied
+            }
+        
+        # Longest alternatives first so a term never loses to one of its own prefixes
+        pattern = re.compile('|'.join(
+            re.escape(old_text) for old_text in sorted(pending, key=len, reverse=True)
+        ))
+        queues = {old_text: iter(indices) for old_text, indices in pending.items()}
+        
+        def substitute(match) -> str:
+            index = next(queues[match.group()], None)
+            if index is None:
+                return match.group()
+            applied[index] = True
+            return pairs[index][1]
+        
+        def edit(doc) -> int:
+            for paragraph in doc.paragraphs:
+                self._replace_in_paragraph(paragraph, pattern, substitute)
+            # Merged cells are reported once per grid position; edit each underlying cell once
+            seen_cells = set()
+            for table in doc.tables:
+                for row in table.rows:
+                    for cell in row.cells:
+                        if cell._tc in seen_cells:
+                            continue
+                        seen_cells.add(cell._tc)
+                        for paragraph in cell.paragraphs:
+                            self._replace_in_paragraph(paragraph, pattern, substitute)
+            return sum(applied)
+        
+        result = self._apply_document_edits(file_path, edit, "No occurrences of the requested text found")
+        result['applied'] = applied
+        return result
+    
     def scan_document_advanced(
         self,
         file_path: str,
@@ -406,6 +999,70 @@ class AdvancedWordProcessor:
             result['case_sensitive'] = case_sensitive
             return result
 
+    def _scan_files(
+        self,
+        file_paths: List[str],
+        search_term: str,
+        context_chars: int,
+        case_sensitive: bool,
+        pattern: re.Pattern
+    ) -> List[List[Dict]]:
+        """
+        Find occurrences in several files, returning one occurrence list per path in order
+        
+        Files with a cached structure are scanned in-process. When enough of the remaining
+        files need a full parse they are spread over a process pool, since python-docx
+        parsing is CPU-bound and keeps the GIL between lxml calls.
+        """
+        results: List[Optional[List[Dict]]] = [None] * len(file_paths)
+        uncached: List[int] = []
+        for index, file_path in enumerate(file_paths):
+            signature = self._get_file_signature(file_path)
+            if self._cache_get(self._structure_cache, file_path, signature) is not None:
+                results[index] = self.find_occurrences_with_context(
+                    file_path, search_term, context_chars, case_sensitive=case_sensitive, pattern=pattern
+                )
+            else:
+                uncached.append(index)
+        
+        # Convert all uncached .doc files up front in batched textutil runs
+        doc_paths = [file_paths[index] for index in uncached if Path(file_paths[index]).suffix.lower() == '.doc']
+        converted = self._convert_docs_to_docx_batch(doc_paths)
+        if converted:
+            for index in uncached:
+                converted_path = converted.get(file_paths[index])
+                if converted_path:
+                    self._load_structure(file_paths[index], converted_path=converted_path)
+                    results[index] = self.find_occurrences_with_context(
+                        file_paths[index], search_term, context_chars, case_sensitive=case_sensitive, pattern=pattern
+                    )
+            uncached = [index for index in uncached if results[index] is None]
+        
+        workers = min(self.max_workers, len(uncached))
+        if workers > 1 and len(uncached) >= self.parallel_threshold:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_scan_worker,
+                    initargs=(search_term, case_sensitive)
+                ) as executor:
+                    paths = [file_paths[index] for index in uncached]
+                    scanned = executor.map(
+                        _scan_one, paths, repeat(search_term), repeat(context_chars), repeat(case_sensitive),
+                        chunksize=4
+                    )
+                    for index, occurrences in zip(uncached, scanned):
+                        results[index] = occurrences
+            except Exception as e:
+                logger.warning(f"Parallel scan failed, continuing serially: {e}")
+        
+        for index in uncached:
+            if results[index] is None:
+                results[index] = self.find_occurrences_with_context(
+                    file_paths[index], search_term, context_chars, case_sensitive=case_sensitive, pattern=pattern
+                )
+        return results
+    
     def scan_directory_advanced(
         self,
         directory_path: str,
@@ -433,29 +1090,40 @@ class AdvancedWordProcessor:
             }
         
         # Find all Word files
-        word_files = []
-        for ext in self.supported_extensions:
-            word_files.extend(directory.rglob(f"*{ext}"))
+        word_files = self.list_word_files(directory_path)
+        
+        # Repeat queries are answered from the shared cache while no file has changed
+        cache_key = (self._cache_key(directory_path), search_term, context_chars, case_sensitive)
+        files = tuple(word_files)
+        signatures = tuple(self._get_file_signature(file_path) for file_path in word_files)
+        with self._cache_lock:
+            generation = self._scan_generation
+            cached = self._scan_cache.get(cache_key)
+            if (cached is not None and cached[0] > time.monotonic() and cached[1] == generation
+                    and cached[2] == files and cached[3] == signatures):
+                self._scan_cache.move_to_end(cache_key)
+                cached_result = cached[4]
+            else:
+                cached_result = None
+        if cached_result is not None:
+            # Callers annotate occurrences, so hand out copies
+            return dict(cached_result, occurrences=[dict(occ) for occ in cached_result['occurrences']])
         
         all_occurrences = []
         files_with_matches = 0
+        # Compile once for the whole directory instead of once per file
+        search_pattern = self.compile_search_pattern(search_term, case_sensitive)
         
         logger.info(f"Scanning {len(word_files)} Word files in {directory_path}")
         
-        for file_path in word_files:
-            if self.is_word_file(str(file_path)):
-                occurrences = self.find_occurrences_with_context(
-                    str(file_path),
-                    search_term,
-                    context_chars,
-                    case_sensitive=case_sensitive
-                )
-                if occurrences:
-                    files_with_matches += 1
-                    all_occurrences.extend(occurrences)
-                logger.info(f"Found {len(occurrences)} occurrences in {file_path}")
+        file_results = self._scan_files(word_files, search_term, context_chars, case_sensitive, search_pattern)
+        for file_path, occurrences in zip(word_files, file_results):
+            if occurrences:
+                files_with_matches += 1
+                all_occurrences.extend(occurrences)
+            logger.info(f"Found {len(occurrences)} occurrences in {file_path}")
         
-        return {
+        result = {
             'success': True,
             'files_scanned': len(word_files),
             'files_processed': len(word_files),
@@ -466,16 +1134,152 @@ class AdvancedWordProcessor:
             'directory': str(directory),
             'case_sensitive': case_sensitive
         }
+        if self.scan_cache_size > 0:
+            with self._cache_lock:
+                self._scan_cache[cache_key] = (
+                    time.monotonic() + self.scan_cache_ttl, generation, files, signatures,
+                    dict(result, occurrences=[dict(occ) for occ in all_occurrences])
+                )
+                self._scan_cache.move_to_end(cache_key)
+                while len(self._scan_cache) > self.scan_cache_size:
+                    self._scan_cache.popitem(last=False)
+        return result
     
-    def export_results(self, results: Dict[str, Any], output_file: str = "search_results.json"):
-        """Export search results to JSON file"""
+    def export_results(self, results: Dict[str, Any], output_file: str = "search_results.json",
+                       ndjson: bool = False):
+        """
+        Export search results to JSON file
+        
+        Uses orjson when it is installed and falls back to the standard library otherwise.
+        
+        Args:
+            results: Scan results to export
+            output_file: Destination path
+            ndjson: Write newline-delimited JSON instead: a summary line without the
+                occurrences, then one line per occurrence. Suited to very large result sets.
+        """
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            if ndjson:
+                def encode(obj) -> bytes:
+                    if orjson is not None:
+                        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+                    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+                summary = {key: value for key, value in results.items() if key != 'occurrences'}
+                with open(output_file, 'wb') as f:
+                    f.write(encode(summary) + b"\n")
+                    for occurrence in results.get('occurrences', []):
+                        f.write(encode(occurrence) + b"\n")
+            elif orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2, ensure_ascii=False)
             logger.info(f"Results exported to {output_file}")
         except Exception as e:
             logger.error(f"Failed to export results: {e}")
 
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = f'{_W_NS}body'
+_W_P = f'{_W_NS}p'
+_W_R = f'{_W_NS}r'
+_W_HYPERLINK = f'{_W_NS}hyperlink'
+_W_TBL = f'{_W_NS}tbl'
+_W_TR = f'{_W_NS}tr'
+_W_TC = f'{_W_NS}tc'
+_W_PPR = f'{_W_NS}pPr'
+_W_PSTYLE = f'{_W_NS}pStyle'
+_W_STYLE = f'{_W_NS}style'
+_W_NAME = f'{_W_NS}name'
+_W_VAL = f'{_W_NS}val'
+_W_TYPE = f'{_W_NS}type'
+_W_STYLE_ID = f'{_W_NS}styleId'
+_W_DEFAULT = f'{_W_NS}default'
+_W_T = f'{_W_NS}t'
+_W_BR = f'{_W_NS}br'
+# Run children that python-docx renders as fixed text (w:br depends on its break type)
+_W_RUN_TEXT = {
+    f'{_W_NS}tab': '\t',
+    f'{_W_NS}ptab': '\t',
+    f'{_W_NS}cr': '\n',
+    f'{_W_NS}noBreakHyphen': '-',
+}
+
+def _run_text(run) -> str:
+    """Text of a w:r element, mirroring python-docx's Run.text."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or '')
+        elif tag == _W_BR:
+            if child.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in _W_RUN_TEXT:
+            parts.append(_W_RUN_TEXT[tag])
+    return ''.join(parts)
+
+def _paragraph_text(paragraph) -> str:
+    """Text of a w:p element including hyperlink runs, mirroring python-docx's Paragraph.text."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child.iterchildren(_W_R))
+    return ''.join(parts)
+
+def _table_structure(table, table_idx: int) -> Dict[str, Any]:
+    """
+    Structure of a w:tbl element, mirroring python-docx's Table.rows / _Row.cells
+    
+    A cell spanning several grid columns is repeated once per column, and vertically
+    merged continuation cells repeat the text of the cell they continue.
+    """
+    table_data = {'index': table_idx, 'rows': []}
+    texts_above: Dict[int, str] = {}
+    for row_idx, row in enumerate(table.iterchildren(_W_TR)):
+        row_data = {'index': row_idx, 'cells': []}
+        grid_before = row.find(f'{_W_NS}trPr/{_W_NS}gridBefore')
+        column = int(grid_before.get(_W_VAL, 0)) if grid_before is not None else 0
+        texts_here: Dict[int, str] = {}
+        for cell in row.iterchildren(_W_TC):
+            grid_span = cell.find(f'{_W_NS}tcPr/{_W_NS}gridSpan')
+            span = int(grid_span.get(_W_VAL, 1)) if grid_span is not None else 1
+            v_merge = cell.find(f'{_W_NS}tcPr/{_W_NS}vMerge')
+            if v_merge is not None and v_merge.get(_W_VAL, 'continue') == 'continue':
+                text = texts_above.get(column, '')
+            else:
+                text = '\n'.join(_paragraph_text(p) for p in cell.iterchildren(_W_P))
+            for offset in range(span):
+                texts_here[column + offset] = text
+                row_data['cells'].append({'index': len(row_data['cells']), 'text': text})
+            column += span
+        texts_above = texts_here
+        table_data['rows'].append(row_data)
+    return table_data
+
+_worker_processor: Optional[AdvancedWordProcessor] = None
+_worker_pattern: Optional[re.Pattern] = None
+
+def _init_scan_worker(search_term: str, case_sensitive: bool) -> None:
+    """Set up the per-process processor and compiled pattern used by _scan_one."""
+    global _worker_processor, _worker_pattern
+    _worker_processor = AdvancedWordProcessor(cache_size=0)
+    _worker_pattern = AdvancedWordProcessor.compile_search_pattern(search_term, case_sensitive)
+
+def _scan_one(file_path: str, search_term: str, context_chars: int, case_sensitive: bool) -> List[Dict]:
+    """Scan a single file inside a worker process."""
+    if _worker_processor is None:
+        _init_scan_worker(search_term, case_sensitive)
+    return _worker_processor.find_occurrences_with_context(
+        file_path,
+        search_term,
+        context_chars,
+        case_sensitive=case_sensitive,
+        pattern=_worker_pattern
+    )
+
 def main():
     """Test the AdvancedWordProcessor functionality"""
     processor = AdvancedWordProcessor()
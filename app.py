@@ -9,11 +9,12 @@ import sys
 import json
 import subprocess
 import threading
+from itertools import islice
 from flask import Flask, render_template, request, jsonify, send_from_directory
 from pathlib import Path
 import logging
 from advanced_word_processor import AdvancedWordProcessor
-from config import DEFAULT_HOST, DEFAULT_PORT
+from config import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_REPO_URL, WEBHOOK_SECRET
 import shutil
 
 try:
@@ -100,6 +101,17 @@ APP_VERSION = _load_app_version()
 # Initialize the word processor
 word_processor = AdvancedWordProcessor()
 
+# Number of file paths returned by /api/validate_directory
+VALIDATE_PREVIEW_LIMIT = 10
+
+# Receive GitHub push notifications instead of polling, when a webhook secret is configured
+if WEBHOOK_SECRET:
+    from auto_updater import AutoUpdater, create_webhook_blueprint
+    app.register_blueprint(create_webhook_blueprint(
+        AutoUpdater(DEFAULT_REPO_URL, os.path.dirname(os.path.abspath(__file__))),
+        WEBHOOK_SECRET
+    ))
+
 @app.route('/')
 def index():
     """Main page with the find and replace interface"""
@@ -138,9 +150,9 @@ def search_documents():
         results['case_sensitive'] = case_sensitive
         
         if results['success']:
-            # Add unique IDs to each occurrence for tracking
+            # Add unique IDs to each occurrence for tracking; the position in the result set is unique
             for i, occurrence in enumerate(results['occurrences']):
-                occurrence['id'] = f"occ_{i}_{hash(occurrence['file_path'] + str(occurrence['start_pos']))}"
+                occurrence['id'] = f"occ_{i}"
                 occurrence['replacement_text'] = occurrence['match_text']  # Initialize with original text
                 occurrence['original_match_text'] = occurrence['match_text']
         
@@ -153,6 +165,34 @@ def search_documents():
             'error': str(e)
         }), 500
 
+@app.route('/api/context', methods=['POST'])
+def get_context():
+    """API endpoint to fetch the context around a single occurrence on demand"""
+    try:
+        data = request.get_json() or {}
+        file_path = data.get('file_path')
+        
+        if not file_path or data.get('start_pos') is None or data.get('end_pos') is None:
+            return jsonify({
+                'success': False,
+                'error': 'file_path, start_pos, and end_pos are required'
+            }), 400
+        
+        context = word_processor.get_context(
+            file_path,
+            int(data['start_pos']),
+            int(data['end_pos']),
+            int(data.get('context_chars', 150))
+        )
+        return jsonify({'success': True, **context})
+        
+    except Exception as e:
+        logger.error(f"Error in get_context: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/replace', methods=['POST'])
 def replace_text():
     """API endpoint to replace text in a specific occurrence"""
@@ -194,18 +234,32 @@ def replace_all():
                 'error': 'No occurrences provided'
             }), 400
         
-        results = []
-        successful_replacements = 0
-        
+        # Group occurrences per file so each document is opened, backed up and saved once
+        grouped = {}
         for occurrence in occurrences:
             file_path = occurrence.get('file_path')
             old_text = occurrence.get('original_match_text') or occurrence.get('match_text')
             new_text = occurrence.get('replacement_text')
             
             if file_path and old_text and new_text:
-                result = word_processor.replace_text_advanced(file_path, old_text, new_text)
+                grouped.setdefault(file_path, []).append((occurrence.get('id'), old_text, new_text))
+        
+        results = []
+        successful_replacements = 0
+        
+        for file_path, file_occurrences in grouped.items():
+            pairs = [(old_text, new_text) for _, old_text, new_text in file_occurrences]
+            file_result = word_processor.replace_many(file_path, pairs)
+            applied = file_result.pop('applied', [])
+            
+            for (occurrence_id, _, _), was_applied in zip(file_occurrences, applied):
+                result = dict(file_result)
+                result['success'] = bool(file_result['success'] and was_applied)
+                result['replacements_made'] = 1 if result['success'] else 0
+                if file_result['success'] and not was_applied:
+                    result['error'] = 'Occurrence no longer found in document'
                 results.append({
-                    'occurrence_id': occurrence.get('id'),
+                    'occurrence_id': occurrence_id,
                     'result': result
                 })
                 
@@ -278,15 +332,23 @@ def validate_directory():
                 'error': f'{directory} is not a directory'
             })
         
-        # Count Word files
-        word_files = []
-        for ext in word_processor.supported_extensions:
-            word_files.extend(directory_path.rglob(f"*{ext}"))
+        if not data.get('count', True):
+            # Preview only: stop walking as soon as one file past the preview is found
+            preview = list(islice(word_processor.iter_word_files(directory), VALIDATE_PREVIEW_LIMIT + 1))
+            return jsonify({
+                'valid': True,
+                'word_files': preview[:VALIDATE_PREVIEW_LIMIT],
+                'has_more': len(preview) > VALIDATE_PREVIEW_LIMIT
+            })
+        
+        # Count Word files (listing is shared with, and cached for, the following scan)
+        word_files = word_processor.list_word_files(directory)
         
         return jsonify({
             'valid': True,
             'word_files_count': len(word_files),
-            'word_files': [str(f) for f in word_files[:10]]  # Return first 10 files
+            'word_files': word_files[:VALIDATE_PREVIEW_LIMIT],
+            'has_more': len(word_files) > VALIDATE_PREVIEW_LIMIT
         })
         
     except Exception as e:
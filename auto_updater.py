@@ -4,18 +4,21 @@ Auto-updater for WordGlobalReplace application
 Checks GitHub for new commits and updates the application automatically
 """
 
+import errno
+import functools
 import os
 import sys
 import subprocess
 import shutil
-import tempfile
-from pathlib import Path
+from collections import deque
 from datetime import datetime
 import logging
+import urllib.error
 import urllib.request
-import urllib.parse
 import re
-from typing import List, Optional, Tuple, Union
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from config import DEFAULT_REPO_URL
 
@@ -30,6 +33,25 @@ SEMVER_RE = re.compile(
 
 PrereleasePart = Tuple[bool, Union[int, str]]
 
+# Lines of a subprocess's output kept for the error message when it fails
+OUTPUT_TAIL_LINES = 20
+
+# Bytes requested per copy_file_range call
+COPY_CHUNK = 1 << 20
+
+# The remote .version is a few bytes; cap how long and how much we wait for it
+VERSION_TIMEOUT = 3
+VERSION_MAX_BYTES = 256
+
+# Seconds to wait on the source tarball download before giving up
+DOWNLOAD_TIMEOUT = 30
+
+# Threads used to copy updated files; copies are bound by per-file syscall latency, not CPU
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# While webhooks have arrived this recently, a check without a pending push skips the network
+WEBHOOK_FRESHNESS = 6 * 60 * 60
+
 
 def _split_prerelease(value: Optional[str]) -> List[PrereleasePart]:
     if not value:
@@ -44,8 +66,14 @@ def _split_prerelease(value: Optional[str]) -> List[PrereleasePart]:
     return result
 
 
-def _parse_semver(value: str) -> Optional[Tuple[int, int, int, List[PrereleasePart]]]:
-    match = SEMVER_RE.fullmatch(value.strip())
+@functools.lru_cache(maxsize=128)
+def _parse_semver(value: str) -> Optional[Tuple[int, int, int, Tuple[PrereleasePart, ...]]]:
+    value = value.strip()
+    # Plain X.Y.Z is by far the common case; only prerelease/build versions need the regex
+    parts = value.split('.')
+    if len(parts) == 3 and all(part.isdecimal() for part in parts):
+        return int(parts[0]), int(parts[1]), int(parts[2]), ()
+    match = SEMVER_RE.fullmatch(value)
     if not match:
         return None
     major, minor, patch, prerelease, _build = match.groups()
@@ -53,11 +81,14 @@ def _parse_semver(value: str) -> Optional[Tuple[int, int, int, List[PrereleasePa
         int(major),
         int(minor),
         int(patch),
-        _split_prerelease(prerelease),
+        tuple(_split_prerelease(prerelease)),
     )
 
 
 def _compare_semver(a: str, b: str) -> int:
+    # Equal strings are the usual "already up to date" answer; no parsing needed
+    if a == b:
+        return 0
     parsed_a = _parse_semver(a)
     parsed_b = _parse_semver(b)
     if not parsed_a or not parsed_b:
@@ -90,6 +121,85 @@ def _compare_semver(a: str, b: str) -> int:
     return (len(pre_a) > len(pre_b)) - (len(pre_a) < len(pre_b))
 
 
+def _run_streaming(cmd: List[str], cwd: Optional[str] = None) -> Tuple[int, str]:
+    """
+    Run a command, logging its combined output line by line as it is produced
+    
+    Returns:
+        The exit code and the last OUTPUT_TAIL_LINES lines of output, for error reporting
+    """
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            line = line.rstrip()
+            logger.info(line)
+            tail.append(line)
+        returncode = proc.wait()
+    return returncode, '\n'.join(tail)
+
+
+def _fastcopy(src: str, dst: str) -> None:
+    """
+    Copy a file's contents and metadata, keeping the data inside the kernel
+
+    Uses copy_file_range on Linux, which also lets filesystems that support it share
+    blocks instead of copying them. Elsewhere, or when the kernel refuses, falls back to
+    shutil.copyfile, which already uses fcopyfile on macOS and sendfile on Linux.
+    """
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            copied = 0
+            try:
+                while True:
+                    sent = copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK)
+                    if not sent:
+                        break
+                    copied += sent
+            except OSError as exc:
+                if copied or exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                                               errno.EOPNOTSUPP, errno.EBADF, errno.EPERM):
+                    raise
+                copy_file_range = None
+    if copy_file_range is None:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _hardlink_tree(src: str, dst: str) -> None:
+    """
+    Snapshot src into dst by hard-linking files instead of copying their bytes
+    
+    Files that cannot be linked (another filesystem, or a filesystem without hard
+    links) are copied. Linked files share their inode with the live tree, so anything
+    that later replaces a live file must write a new file rather than truncate the old one.
+    """
+    if not os.path.isdir(src):
+        try:
+            os.link(src, dst)
+        except OSError:
+            _fastcopy(src, dst)
+        return
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) or entry.is_file():
+                _hardlink_tree(entry.path, os.path.join(dst, entry.name))
+
+
+def _install_file(src: str, dst: str) -> None:
+    """Copy src over dst through a temporary file, leaving any hard links to dst untouched."""
+    tmp_path = f"{dst}.{os.getpid()}.tmp"
+    try:
+        _fastcopy(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
 class AutoUpdater:
     def __init__(self, repo_url=DEFAULT_REPO_URL, 
                  current_dir=None, branch="main"):
@@ -106,6 +216,13 @@ class AutoUpdater:
         self.branch = branch
         self.version_file = os.path.join(self.current_dir, ".version")
         self.update_log = os.path.join(self.current_dir, ".update_log")
+        # Last remote .version body and its ETag, for conditional requests
+        self.version_cache_file = os.path.join(self.current_dir, ".version_cache")
+        self.etag_file = os.path.join(self.current_dir, ".version_etag")
+        # Written by the GitHub webhook: when one last arrived and the pushed commit, if unhandled
+        self.webhook_state_file = self.version_file + ".pending"
+        # Latest version seen by the last remote check, reused when applying the update
+        self._cached_latest = None
         
     def get_current_version(self):
         """Return the installed semantic version string."""
@@ -118,47 +235,230 @@ class AutoUpdater:
             logger.error(f"Error getting current version: {e}")
             return "0.0.0"
     
-    def _get_remote_version_url(self) -> Optional[str]:
+    def _github_owner_repo(self) -> Optional[Tuple[str, str]]:
+        if "github.com" not in self.repo_url:
+            return None
+        parts = self.repo_url.replace("https://github.com/", "").replace(".git", "")
+        owner, repo = parts.split("/")
+        return owner, repo
+
+    def _iter_tarball_files(self):
+        """
+        Stream the branch tarball from codeload.github.com
+        
+        Yields (relative_path, member, tar) for each regular file, with the archive's
+        top-level directory stripped. Nothing is written to disk and no git process is
+        spawned; the archive is read sequentially straight off the HTTP response.
+        """
+        owner_repo = self._github_owner_repo()
+        if not owner_repo:
+            return
+        owner, repo = owner_repo
+        url = f"https://codeload.github.com/{owner}/{repo}/tar.gz/{self.branch}"
+        import tarfile
+
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            with tarfile.open(fileobj=response, mode='r|gz') as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    parts = member.name.split('/')[1:]
+                    if not parts or any(part in ('', '.', '..') for part in parts):
+                        continue
+                    yield '/'.join(parts), member, tar
+
+    def _walk_update_tree(self, path: str, exclude_dirs, exclude_files):
+        """
+        Yield the path of every file to install under path
+        
+        Uses os.scandir so the entry type comes from the directory listing itself rather
+        than a stat per entry. Excluded directories are pruned without being opened, and
+        symlinks to directories are not followed, matching os.walk's defaults.
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_dirs:
+                        yield from self._walk_update_tree(entry.path, exclude_dirs, exclude_files)
+                elif entry.name not in exclude_files and entry.is_file():
+                    yield entry.path
+
+    def _extract_tarball(self, dest_dir: str, exclude_dirs=frozenset(), exclude_files=frozenset()) -> bool:
+        """Download the branch tarball into dest_dir, skipping excluded names. Returns success."""
+        if not self._github_owner_repo():
+            return False
+        created_dirs = set()
+        try:
+            os.makedirs(dest_dir, exist_ok=True)
+            for rel_path, member, tar in self._iter_tarball_files():
+                parts = rel_path.split('/')
+                if parts[-1] in exclude_files or any(part in exclude_dirs for part in parts[:-1]):
+                    continue
+                dst_path = os.path.join(dest_dir, *parts)
+                parent = os.path.dirname(dst_path)
+                if parent not in created_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    created_dirs.add(parent)
+                with tar.extractfile(member) as src, open(dst_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                os.chmod(dst_path, member.mode & 0o777)
+            return True
+        except Exception as exc:
+            logger.warning(f"Failed to download source tarball: {exc}")
+            return False
+
+    def _get_remote_version_url(self, commit: Optional[str] = None) -> Optional[str]:
+        """
+        Fetch .version from raw.githubusercontent.com
+        
+        Args:
+            commit: Read .version at this commit instead of the branch head. The branch URL
+                is cached by GitHub for minutes after a push; a commit's file never changes.
+        """
         try:
-            if "github.com" not in self.repo_url:
+            owner_repo = self._github_owner_repo()
+            if not owner_repo:
+                return None
+            owner, repo = owner_repo
+            raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{commit or self.branch}/.version"
+            request = urllib.request.Request(raw_url, headers={"Accept-Encoding": "identity"})
+            cached_etag, cached_version = self._read_version_cache()
+            if cached_etag and cached_version and not commit:
+                request.add_header("If-None-Match", cached_etag)
+            try:
+                with urllib.request.urlopen(request, timeout=VERSION_TIMEOUT) as response:
+                    version = response.read(VERSION_MAX_BYTES).decode("utf-8").strip()
+                    etag = response.headers.get("ETag")
+            except urllib.error.HTTPError as exc:
+                if exc.code == 304 and cached_version:
+                    # Unchanged since the last check; GitHub sends no body
+                    return cached_version
+                raise
+            except TimeoutError:
+                logger.warning(f"Timed out fetching .version after {VERSION_TIMEOUT}s")
                 return None
-            parts = self.repo_url.replace("https://github.com/", "").replace(".git", "")
-            owner, repo = parts.split("/")
-            raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{self.branch}/.version"
-            with urllib.request.urlopen(raw_url) as response:
-                return response.read().decode("utf-8").strip()
+            if isinstance(etag, str) and version:
+                self._write_version_cache(etag, version)
+            return version
         except Exception as exc:
             logger.warning(f"Failed to fetch .version via raw URL: {exc}")
             return None
 
+    def _read_version_cache(self) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            with open(self.etag_file, 'r', encoding='utf-8') as f:
+                etag = f.read().strip()
+            with open(self.version_cache_file, 'r', encoding='utf-8') as f:
+                version = f.read().strip()
+            return etag or None, version or None
+        except OSError:
+            return None, None
+
+    def _write_version_cache(self, etag: str, version: str) -> None:
+        try:
+            with open(self.version_cache_file, 'w', encoding='utf-8') as f:
+                f.write(version)
+            with open(self.etag_file, 'w', encoding='utf-8') as f:
+                f.write(etag)
+        except OSError as exc:
+            logger.debug(f"Could not cache remote version: {exc}")
+
     def _get_latest_via_git(self) -> Optional[str]:
-        """Fallback method to get latest version via git clone"""
+        """Fallback method to get latest version from the source tarball, or via git clone"""
+        try:
+            for rel_path, member, tar in self._iter_tarball_files():
+                if rel_path == ".version":
+                    with tar.extractfile(member) as version_file:
+                        return version_file.read().decode("utf-8").strip()
+        except Exception as exc:
+            logger.warning(f"Failed to read .version from source tarball: {exc}")
+
+        import tempfile
+
         try:
             with tempfile.TemporaryDirectory() as temp_dir:
-                result = subprocess.run(['git', 'clone', '--depth', '1', 
+                # Partial clone without a checkout: only the .version blob is ever downloaded
+                result = subprocess.run(['git', 'clone', '--depth', '1', '--single-branch',
+                                       '--no-tags', '--filter=blob:none', '--no-checkout',
                                        '--branch', self.branch, 
                                        self.repo_url, temp_dir], 
                                       capture_output=True, text=True)
                 if result.returncode == 0:
-                    version_path = Path(temp_dir) / ".version"
-                    if version_path.exists():
-                        return version_path.read_text(encoding="utf-8").strip()
+                    result = subprocess.run(['git', '-C', temp_dir, 'show', 'HEAD:.version'],
+                                            capture_output=True, text=True)
+                    if result.returncode == 0:
+                        return result.stdout.strip()
         except Exception as e:
             logger.error(f"Error in git fallback: {e}")
         return None
     
     def get_latest_version(self):
         """Fetch the most recent available semantic version."""
-        version = self._get_remote_version_url()
-        if version:
-            return version
-        return self._get_latest_via_git()
+        self._cached_latest = self._get_remote_version_url() or self._get_latest_via_git()
+        return self._cached_latest
     
+    def record_webhook(self, pushed_commit: Optional[str] = None) -> None:
+        """
+        Record a GitHub webhook delivery
+        
+        Args:
+            pushed_commit: Head commit of a push to the tracked branch; None for deliveries
+                that only show the webhook is alive (e.g. ping)
+        """
+        state = self._read_webhook_state()
+        state['received_at'] = time.time()
+        if pushed_commit:
+            state['pending'] = pushed_commit
+        self._write_webhook_state(state)
+
+    def _read_webhook_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.webhook_state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_webhook_state(self, state: Dict[str, Any]) -> None:
+        try:
+            with open(self.webhook_state_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError as exc:
+            logger.warning(f"Could not record webhook state: {exc}")
+
+    def _clear_pending_push(self, webhook_state: Dict[str, Any]) -> None:
+        webhook_state['pending'] = None
+        self._write_webhook_state(webhook_state)
+
     def check_for_updates(self):
         """Check if there are updates available"""
         try:
             current_version = self.get_current_version()
-            latest_version = self.get_latest_version()
+            
+            # GitHub tells us about pushes; without one, recent webhook traffic means nothing changed
+            webhook_state = self._read_webhook_state()
+            received_at = webhook_state.get('received_at') or 0
+            if not webhook_state.get('pending') and time.time() - received_at < WEBHOOK_FRESHNESS:
+                known_version = self._read_version_cache()[1] or current_version
+                logger.info("No push received since the last check; skipping remote check")
+                return _compare_semver(known_version, current_version) > 0, current_version, known_version
+            
+            pending = webhook_state.get('pending')
+            latest_version = known_version = None
+            if pending:
+                # The pushed commit's .version is exact, where the branch may still be stale
+                latest_version = self._get_remote_version_url(commit=pending)
+                if latest_version:
+                    self._cached_latest = latest_version
+                    self._clear_pending_push(webhook_state)
+                else:
+                    known_version = self._read_version_cache()[1]
+            if not latest_version:
+                latest_version = self.get_latest_version()
+                # Without the commit's own file, only a version other than the one already
+                # seen shows the push has been picked up; otherwise keep checking
+                if pending and latest_version and latest_version != known_version:
+                    self._clear_pending_push(webhook_state)
             
             if not latest_version:
                 logger.warning("Could not determine latest version")
@@ -175,8 +475,18 @@ class AutoUpdater:
             logger.error(f"Error checking for updates: {e}")
             return False, None, None
     
-    def update_application(self):
-        """Update the application to the latest version"""
+    def update_application(self, latest_version=None):
+        """
+        Update the application to the latest version
+        
+        Args:
+            latest_version: Version reported by check_for_updates; when omitted, the one
+                cached by the last remote check is used before asking the network again
+        """
+        # Only needed when an update is actually applied
+        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
+
         try:
             logger.info("Starting application update...")
             
@@ -184,55 +494,53 @@ class AutoUpdater:
             backup_dir = os.path.join(self.current_dir, "backups", f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
             os.makedirs(backup_dir, exist_ok=True)
             
-            # Backup important files
+            # Backup important files as hard links; updated files are swapped in, not overwritten
             important_files = ['app.py', 'run.py', 'word_processor.py', 'advanced_word_processor.py', 
                              'templates', 'static', 'requirements.txt']
             
             for item in important_files:
                 src = os.path.join(self.current_dir, item)
                 if os.path.exists(src):
-                    dst = os.path.join(backup_dir, item)
-                    if os.path.isdir(src):
-                        shutil.copytree(src, dst)
-                    else:
-                        shutil.copy2(src, dst)
+                    _hardlink_tree(src, os.path.join(backup_dir, item))
+            
+            # Copy new files (excluding .git, backups, and other non-essential directories)
+            exclude_dirs = {'.git', 'backups', '__pycache__', '.DS_Store'}
+            exclude_files = {'.update_log'}
             
             # Create temporary directory for update
             with tempfile.TemporaryDirectory() as temp_dir:
-                # Clone the latest version
-                result = subprocess.run(['git', 'clone', '--depth', '1', 
-                                       '--branch', self.branch, 
-                                       self.repo_url, temp_dir], 
-                                      capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    logger.error(f"Failed to clone repository: {result.stderr}")
-                    return False
+                # Download the latest tree as a tarball; clone only when that is unavailable.
+                # Either way the new files are staged before anything in current_dir is touched.
+                # The clone gets a fresh directory, since a failed download may leave files behind.
+                source_dir = os.path.join(temp_dir, 'tarball')
+                if not self._extract_tarball(source_dir, exclude_dirs, exclude_files):
+                    source_dir = os.path.join(temp_dir, 'clone')
+                    returncode, output = _run_streaming(['git', 'clone', '--depth', '1',
+                                                         '--single-branch', '--no-tags',
+                                                         '--filter=blob:none',
+                                                         '--branch', self.branch,
+                                                         self.repo_url, source_dir])
+                    
+                    if returncode != 0:
+                        logger.error(f"Failed to clone repository: {output}")
+                        return False
                 
-                # Copy new files (excluding .git, backups, and other non-essential directories)
-                exclude_dirs = {'.git', 'backups', '__pycache__', '.DS_Store'}
-                exclude_files = {'.update_log'}
+                src_paths = []
+                dst_paths = []
+                prefix_len = len(os.path.join(source_dir, ''))
+                for src_path in self._walk_update_tree(source_dir, exclude_dirs, exclude_files):
+                    src_paths.append(src_path)
+                    dst_paths.append(os.path.join(self.current_dir, src_path[prefix_len:]))
                 
-                for root, dirs, files in os.walk(temp_dir):
-                    # Skip excluded directories
-                    dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                    
-                    for file in files:
-                        if file in exclude_files:
-                            continue
-                            
-                        src_path = os.path.join(root, file)
-                        rel_path = os.path.relpath(src_path, temp_dir)
-                        dst_path = os.path.join(self.current_dir, rel_path)
-                        
-                        # Create destination directory if needed
-                        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                        
-                        # Copy file
-                        shutil.copy2(src_path, dst_path)
+                # Create each destination directory once, then overlap the copies across threads
+                for parent in sorted({os.path.dirname(dst_path) for dst_path in dst_paths}):
+                    os.makedirs(parent, exist_ok=True)
+                with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                    list(executor.map(_install_file, src_paths, dst_paths))
             
-            # Update version file
-            latest_version = self.get_latest_version()
+            # Update version file with the version that was checked, not a second lookup
+            latest_version = latest_version or self._cached_latest or self.get_latest_version()
+            self._cached_latest = None
             if latest_version:
                 with open(self.version_file, 'w') as f:
                     f.write(latest_version)
@@ -265,18 +573,62 @@ class AutoUpdater:
                 if not in_virtual_env:
                     cmd.insert(-1, '--user')
 
-                result = subprocess.run(cmd, cwd=self.current_dir, capture_output=True, text=True)
-                if result.returncode == 0:
+                returncode, output = _run_streaming(cmd, cwd=self.current_dir)
+                if returncode == 0:
                     logger.info("Dependencies updated successfully")
                     return True
                 else:
-                    logger.error(f"Failed to install dependencies: {result.stderr}")
+                    logger.error(f"Failed to install dependencies: {output}")
                     return False
             return True
         except Exception as e:
             logger.error(f"Error installing dependencies: {e}")
             return False
 
+def create_webhook_blueprint(updater: AutoUpdater, secret: str):
+    """
+    Build a Flask blueprint receiving GitHub push webhooks for the updater
+    
+    POST /github-webhook verifies X-Hub-Signature-256 against secret, then records the
+    delivery so check_for_updates only goes to the network after a push to the tracked
+    branch. Point a repository webhook (either content type) at this URL.
+    """
+    import hashlib
+    import hmac
+
+    from flask import Blueprint, abort, jsonify, request
+
+    blueprint = Blueprint('github_webhook', __name__)
+    key = secret.encode('utf-8')
+
+    @blueprint.route('/github-webhook', methods=['POST'])
+    def github_webhook():
+        body = request.get_data()
+        expected = 'sha256=' + hmac.new(key, body, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, request.headers.get('X-Hub-Signature-256', '')):
+            abort(403)
+
+        event = request.headers.get('X-GitHub-Event', '')
+        pushed_commit = None
+        if event == 'push':
+            # GitHub's default content type is form-encoded, with the JSON in a payload field
+            if request.mimetype == 'application/x-www-form-urlencoded':
+                raw_payload = request.form.get('payload', '')
+            else:
+                raw_payload = body
+            try:
+                payload = json.loads(raw_payload or '{}')
+            except ValueError:
+                abort(400)
+            if not isinstance(payload, dict):
+                abort(400)
+            if payload.get('ref') == f"refs/heads/{updater.branch}":
+                pushed_commit = payload.get('after')
+        updater.record_webhook(pushed_commit)
+        return jsonify({'success': True, 'event': event})
+
+    return blueprint
+
 def main():
     """Main function for testing the auto-updater"""
     updater = AutoUpdater()
@@ -288,7 +640,7 @@ def main():
         print(f"Update available: {current} -> {latest}")
         response = input("Do you want to update? (y/n): ")
         if response.lower() == 'y':
-            if updater.update_application():
+            if updater.update_application(latest):
                 print("Update completed successfully!")
                 updater.install_dependencies()
             else:
@@ -9,8 +9,6 @@ import sys
 import subprocess
 import shutil
 import tempfile
-import json
-import zipfile
 from pathlib import Path
 import logging
 from datetime import datetime
@@ -23,6 +21,9 @@ logger = logging.getLogger(__name__)
 class BuildSystem:
     def __init__(self, project_root=None, build_dir="build", dist_dir="dist"):
         self.project_root = project_root or os.path.dirname(os.path.abspath(__file__))
+        # create_distribution is imported lazily from the project root
+        if self.project_root not in sys.path:
+            sys.path.insert(0, self.project_root)
         self.build_dir = os.path.join(self.project_root, build_dir)
         self.dist_dir = os.path.join(self.project_root, dist_dir)
         self.version = self.get_version()
@@ -135,12 +136,13 @@ class BuildSystem:
         
         try:
             # Import and run the distribution creator
-            sys.path.insert(0, self.project_root)
             from create_distribution import DistributionCreator
             
             creator = DistributionCreator(
                 source_dir=self.project_root,
-                output_dir=self.dist_dir
+                output_dir=self.dist_dir,
+                # create_release_package zips the .app itself, with version.json
+                archive_format=None
             )
             
             success = creator.create_distribution(repo_url=repo_url)
@@ -161,16 +163,8 @@ class BuildSystem:
         logger.info("Creating release package...")
         
         try:
-            # Create versioned release directory
-            release_dir = os.path.join(self.dist_dir, f"WordGlobalReplace-{self.version}")
-            if os.path.exists(release_dir):
-                shutil.rmtree(release_dir)
-            
-            # Copy distribution files
             dist_app_dir = os.path.join(self.dist_dir, "WordGlobalReplace.app")
-            if os.path.exists(dist_app_dir):
-                shutil.copytree(dist_app_dir, release_dir)
-            else:
+            if not os.path.exists(dist_app_dir):
                 logger.error("Distribution not found. Run build_distribution first.")
                 return False
             
@@ -182,18 +176,10 @@ class BuildSystem:
                 "python_version": sys.version
             }
             
-            version_file = os.path.join(release_dir, "version.json")
-            with open(version_file, 'w') as f:
-                json.dump(version_info, f, indent=2)
-            
-            # Create zip package
+            from create_distribution import write_release_zip
+
             zip_path = os.path.join(self.dist_dir, f"WordGlobalReplace-{self.version}.zip")
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(release_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arc_path = os.path.relpath(file_path, release_dir)
-                        zipf.write(file_path, arc_path)
+            write_release_zip(dist_app_dir, zip_path, version_info)
             
             logger.info(f"Release package created: {zip_path}")
             return zip_path
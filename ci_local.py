@@ -4,45 +4,86 @@ Local CI script for WordGlobalReplace
 Runs tests, builds distribution, and publishes to GitHub releases
 """
 
+import functools
+import glob
 import os
 import sys
 import subprocess
 import shutil
 import tempfile
-import json
-import zipfile
+import threading
 from pathlib import Path
 import logging
 from datetime import datetime
 import argparse
+from collections import deque
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Imported after logging is configured so create_distribution's basicConfig is a no-op
+from create_distribution import DistributionCreator, write_release_zip
+
+@functools.lru_cache(maxsize=None)
+def _git_output(project_root, *args):
+    """Run a read-only git query once per project root; None when git is missing or fails"""
+    try:
+        result = subprocess.run(['git', *args], cwd=project_root, capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode == 0:
+        return result.stdout.strip()
+    return None
+
+@functools.lru_cache(maxsize=1)
+def _gh_status():
+    """'ready', 'missing' or 'unauthenticated' from a single `gh auth status` probe"""
+    try:
+        result = subprocess.run(['gh', 'auth', 'status'], capture_output=True, text=True)
+    except FileNotFoundError:
+        return 'missing'
+    return 'ready' if result.returncode == 0 else 'unauthenticated'
+
+def _run_streaming(cmd, cwd=None, tail_lines=20):
+    """Run a command, logging its merged stdout/stderr live; returns (returncode, last lines)"""
+    tail = deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            line = line.rstrip()
+            logger.info(f"   {line}")
+            tail.append(line)
+        returncode = proc.wait()
+    return returncode, '\n'.join(tail)
+
 class LocalCI:
     def __init__(self, project_root=None):
         self.project_root = project_root or os.path.dirname(os.path.abspath(__file__))
         self.build_dir = os.path.join(self.project_root, "build")
         self.dist_dir = os.path.join(self.project_root, "dist")
-        self.version = self.get_version()
+        self._version = None
+    
+    @property
+    def version(self):
+        """Build version, resolved on first use so constructing LocalCI does not run git"""
+        if self._version is None:
+            self._version = self.get_version()
+        return self._version
         
     def get_version(self):
         """Get current version from git or version file"""
-        try:
-            # Try to get version from git
-            result = subprocess.run(['git', 'describe', '--tags', '--always'], 
-                                 cwd=self.project_root, capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            pass
+        # Try to get version from git
+        version = _git_output(self.project_root, 'describe', '--tags', '--always')
+        if version is not None:
+            return version
         
         # Fallback to version file or timestamp
         version_file = os.path.join(self.project_root, 'VERSION')
-        if os.path.exists(version_file):
-            with open(version_file, 'r') as f:
-                return f.read().strip()
+        try:
+            return Path(version_file).read_text(encoding='utf-8').strip()
+        except FileNotFoundError:
+            pass
         
         return datetime.now().strftime('%Y%m%d_%H%M%S')
     
@@ -50,33 +91,63 @@ class LocalCI:
         """Clean build and distribution directories"""
         logger.info("🧹 Cleaning build directories...")
         
+        # Old trees are moved next to the project, not inside it, so tests, coverage and
+        # flake8 never see them while they are being deleted
+        parent = os.path.dirname(os.path.abspath(self.project_root))
+        trash_prefix = f".{os.path.basename(os.path.abspath(self.project_root))}.ci-trash-"
+        # Leftovers from an earlier run that exited before its delete finished
+        trash = glob.glob(os.path.join(glob.escape(parent), glob.escape(trash_prefix) + '*'))
         for dir_path in [self.build_dir, self.dist_dir]:
-            if os.path.exists(dir_path):
+            trash.extend(glob.glob(f"{glob.escape(dir_path)}.old.*"))
+        
+        trash_dir = None
+        for dir_path in [self.build_dir, self.dist_dir]:
+            if not os.path.exists(dir_path):
+                continue
+            try:
+                if trash_dir is None:
+                    trash_dir = tempfile.mkdtemp(prefix=trash_prefix, dir=parent)
+                    trash.append(trash_dir)
+                # Renaming is instant; the slow delete runs while the rest of CI proceeds
+                os.rename(dir_path, os.path.join(trash_dir, os.path.basename(dir_path)))
+            except OSError:
+                # Parent not writable or on another filesystem: delete in place
                 shutil.rmtree(dir_path)
-                logger.info(f"   Cleaned {dir_path}")
+            logger.info(f"   Cleaned {dir_path}")
+        
+        if trash:
+            # Not a daemon thread, so the interpreter waits for the delete before exiting
+            threading.Thread(target=self._remove_trees, args=(trash,), name="clean-build-dirs").start()
         
         os.makedirs(self.build_dir, exist_ok=True)
         os.makedirs(self.dist_dir, exist_ok=True)
     
+    @staticmethod
+    def _remove_trees(paths):
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+    
     def install_dependencies(self):
         """Install build dependencies"""
         logger.info("📦 Installing dependencies...")
         
         try:
-            # Install requirements
-            result = subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
-                                 cwd=self.project_root, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"Failed to install dependencies: {result.stderr}")
-                return False
-            
-            # Install test dependencies
+            pip_install = [sys.executable, "-m", "pip", "install"]
+            requirements = ["-r", "requirements.txt"]
             test_deps = ["pytest", "pytest-cov", "coverage", "flake8"]
-            for dep in test_deps:
-                result = subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                                     capture_output=True, text=True)
-                if result.returncode != 0:
-                    logger.warning(f"Failed to install {dep}: {result.stderr}")
+            
+            # Resolve and install everything in one pip run
+            returncode, _ = _run_streaming(pip_install + requirements + test_deps, cwd=self.project_root)
+            if returncode != 0:
+                # Retry separately so a broken test dependency only warns, as before
+                returncode, output = _run_streaming(pip_install + requirements, cwd=self.project_root)
+                if returncode != 0:
+                    logger.error(f"Failed to install dependencies: {output}")
+                    return False
+                
+                returncode, output = _run_streaming(pip_install + test_deps)
+                if returncode != 0:
+                    logger.warning(f"Failed to install test dependencies: {output}")
             
             logger.info("✅ Dependencies installed successfully")
             return True
@@ -92,16 +163,15 @@ class LocalCI:
         try:
             # Run tests with pytest
             test_cmd = [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short", "--cov=.", "--cov-report=html"]
-            result = subprocess.run(test_cmd, cwd=self.project_root, capture_output=True, text=True)
+            # Output is logged as pytest produces it; only the summary is repeated at the end
+            returncode, output = _run_streaming(test_cmd, cwd=self.project_root)
             
-            if result.returncode != 0:
+            if returncode != 0:
                 logger.error("❌ Tests failed!")
-                logger.error(f"Test output: {result.stdout}")
-                logger.error(f"Test errors: {result.stderr}")
+                logger.error(f"Test output: {output}")
                 return False
             
             logger.info("✅ All tests passed!")
-            logger.info(f"Test output: {result.stdout}")
             return True
             
         except Exception as e:
@@ -114,11 +184,10 @@ class LocalCI:
         
         try:
             # Run flake8 if available
-            result = subprocess.run([sys.executable, "-m", "flake8", "."], 
-                                 cwd=self.project_root, capture_output=True, text=True)
+            returncode, _ = _run_streaming([sys.executable, "-m", "flake8", "."], cwd=self.project_root)
             
-            if result.returncode != 0:
-                logger.warning(f"⚠️  Linting issues found: {result.stdout}")
+            if returncode != 0:
+                logger.warning("⚠️  Linting issues found (see output above)")
                 # Don't fail build for linting issues, just warn
             else:
                 logger.info("✅ Linting passed!")
@@ -134,13 +203,11 @@ class LocalCI:
         logger.info("📦 Building distribution...")
         
         try:
-            # Import and run the distribution creator
-            sys.path.insert(0, self.project_root)
-            from create_distribution import DistributionCreator
-            
             creator = DistributionCreator(
                 source_dir=self.project_root,
-                output_dir=self.dist_dir
+                output_dir=self.dist_dir,
+                # create_release_package zips the .app itself, with version.json
+                archive_format=None
             )
             
             success = creator.create_distribution(repo_url=repo_url)
@@ -161,16 +228,8 @@ class LocalCI:
         logger.info("📋 Creating release package...")
         
         try:
-            # Create versioned release directory
-            release_dir = os.path.join(self.dist_dir, f"WordGlobalReplace-{self.version}")
-            if os.path.exists(release_dir):
-                shutil.rmtree(release_dir)
-            
-            # Copy distribution files
             dist_app_dir = os.path.join(self.dist_dir, "WordGlobalReplace.app")
-            if os.path.exists(dist_app_dir):
-                shutil.copytree(dist_app_dir, release_dir)
-            else:
+            if not os.path.exists(dist_app_dir):
                 logger.error("Distribution not found. Run build_distribution first.")
                 return False
             
@@ -183,18 +242,8 @@ class LocalCI:
                 "build_type": "local_ci"
             }
             
-            version_file = os.path.join(release_dir, "version.json")
-            with open(version_file, 'w') as f:
-                json.dump(version_info, f, indent=2)
-            
-            # Create zip package
             zip_path = os.path.join(self.dist_dir, f"WordGlobalReplace-{self.version}.zip")
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(release_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arc_path = os.path.relpath(file_path, release_dir)
-                        zipf.write(file_path, arc_path)
+            write_release_zip(dist_app_dir, zip_path, version_info)
             
             logger.info(f"✅ Release package created: {zip_path}")
             return zip_path
@@ -205,30 +254,24 @@ class LocalCI:
     
     def get_git_commit(self):
         """Get current git commit hash"""
-        try:
-            result = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                                 cwd=self.project_root, capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            pass
-        return "unknown"
+        commit = _git_output(self.project_root, 'rev-parse', 'HEAD')
+        return commit if commit is not None else "unknown"
     
     def publish_to_github(self, zip_path, github_token=None, repo=None):
         """Publish release to GitHub"""
         logger.info("🚀 Publishing to GitHub...")
         
         try:
-            # Check if GitHub CLI is available
-            result = subprocess.run(['gh', '--version'], capture_output=True, text=True)
-            if result.returncode != 0:
+            # Check the GitHub CLI is installed and authenticated (cached once it is)
+            status = _gh_status()
+            if status != 'ready':
+                # Don't cache failures: the user may install or log in before a retry
+                _gh_status.cache_clear()
+            if status == 'missing':
                 logger.error("❌ GitHub CLI (gh) not found. Please install it first.")
                 logger.info("Install with: brew install gh")
                 return False
-            
-            # Check authentication
-            auth_result = subprocess.run(['gh', 'auth', 'status'], capture_output=True, text=True)
-            if auth_result.returncode != 0:
+            if status == 'unauthenticated':
                 logger.error("❌ Not authenticated with GitHub CLI")
                 logger.info("Authenticate with: gh auth login")
                 return False
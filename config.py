@@ -6,6 +6,8 @@ import os
 DEFAULT_HOST = os.getenv("WORD_GLOBAL_REPLACE_HOST", "0.0.0.0")
 DEFAULT_PORT = int(os.getenv("WORD_GLOBAL_REPLACE_PORT", "5130"))
 DEFAULT_REPO_URL = os.getenv("WORD_GLOBAL_REPLACE_REPO_URL", "https://github.com/abd3/WordGlobalReplace.git")
+# Shared secret of the GitHub push webhook; the /github-webhook endpoint is disabled when empty
+WEBHOOK_SECRET = os.getenv("WORD_GLOBAL_REPLACE_WEBHOOK_SECRET", "")
 
 DEFAULT_LOCAL_URL = f"http://localhost:{DEFAULT_PORT}"
 CF_BUNDLE_IDENTIFIER = "io.andrewdavis.WordGlobalReplace"
\ No newline at end of file
@@ -4,171 +4,637 @@ Distribution creator for WordGlobalReplace application
 Creates a lightweight, distributable package for macOS
 """
 
+import contextlib
+import errno
+import functools
+import hashlib
 import os
 import sys
 import shutil
+import stat
 import subprocess
+import tarfile
 import zipfile
 from pathlib import Path
 import logging
 import sysconfig
 import json
 import tempfile
-import textwrap
+import time
+import venv
+import zlib
 import platform
-from typing import Optional
+import string
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import zstandard  # Optional: needed only for --format tar.zst
+except ImportError:
+    zstandard = None
+
+try:
+    from isal import isal_zlib  # Optional: ISA-L SIMD deflate for fast (level 1-3) zips
+except ImportError:
+    isal_zlib = None
+
+try:
+    from zlib_ng import zlib_ng  # Optional: SIMD zlib drop-in for the other zip levels
+except ImportError:
+    zlib_ng = None
 
 from config import DEFAULT_LOCAL_URL, DEFAULT_REPO_URL, CF_BUNDLE_IDENTIFIER
 
 MIN_MACOS_VERSION = os.getenv("WORD_GLOBAL_REPLACE_MIN_MACOS_VERSION", "11.0")
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# DEFLATE level for release zips. --fast builds use level 1, several times quicker to
+# produce for a slightly larger archive; compressed formats are stored either way.
+# --compress-level picks any level, with 0 storing every entry.
+ZIP_COMPRESSLEVEL = 6
+ZIP_FAST_COMPRESSLEVEL = 1
 
-class DistributionCreator:
-    def __init__(self, source_dir=None, output_dir="dist", python_executable=None):
-        self.source_dir = source_dir or os.path.dirname(os.path.abspath(__file__))
-        self.output_dir = output_dir
-        self.app_name = "WordGlobalReplace"
-        self.requested_python = python_executable or os.environ.get("WORD_GLOBAL_REPLACE_BUILD_PYTHON")
-        self.python_context = None
-        
-    def create_distribution(self, repo_url=None):
-        """Create a distributable package"""
-        try:
-            # Create output directory
-            os.makedirs(self.output_dir, exist_ok=True)
-            
-            # Create app directory
-            app_dir = os.path.join(self.output_dir, f"{self.app_name}.app")
-            if os.path.exists(app_dir):
-                shutil.rmtree(app_dir)
+# Archive formats create_distribution can emit, and the zstd level for tar.zst
+ARCHIVE_FORMATS = ('zip', 'tar.zst')
+ZSTD_LEVEL = 3
 
-            contents_dir = os.path.join(app_dir, "Contents")
-            macos_dir = os.path.join(contents_dir, "MacOS")
-            resources_dir = os.path.join(contents_dir, "Resources")
+# Standard library packages left out of the bundled framework: CPython's own test suite
+# (the bulk of the stdlib's files) and the IDLE/turtle demos; tkinter itself is kept
+FRAMEWORK_PRUNED_STDLIB = ('test', 'idlelib', 'turtledemo')
 
-            os.makedirs(macos_dir, exist_ok=True)
-            os.makedirs(resources_dir, exist_ok=True)
+# Wheels for the bundled venv, kept in the source tree between builds
+WHEELHOUSE_DIR = '.wheelhouse'
 
-            # Copy application files
-            self._copy_application_files(resources_dir)
-            self._prepare_app_icon(resources_dir)
+# Hash of the inputs the bundled venv and framework were last built from, in the output
+# directory next to the .app; a matching hash lets the next build reuse them as they are
+VENV_BUILD_KEY_FILE = '.venv-buildkey'
 
-            # Create Info.plist metadata
-            self._create_info_plist(contents_dir)
+# Output buffer for zips, so many small compressed chunks become a few large writes
+ZIP_WRITE_BUFFER = 8 << 20
 
-            # Create launcher scripts
-            self._create_launcher_script(macos_dir, resources_dir, repo_url)
+# Formats that are already compressed; deflating them again costs CPU and saves nothing
+STORED_EXTENSIONS = frozenset({
+    '.docx', '.xlsx', '.pptx', '.png', '.jpg', '.jpeg', '.gif', '.icns',
+    '.woff', '.woff2', '.zip', '.gz', '.bz2', '.xz', '.whl',
+})
 
-            # Create requirements file
-            self._create_requirements_file(resources_dir)
+# Compiled payloads (the bundled framework and venv) still deflate to about 40%, so
+# only --fast builds store them, trading archive size for most of the deflate time
+FAST_STORED_EXTENSIONS = STORED_EXTENSIONS | frozenset({'.dylib', '.so', '.a', '.pyc'})
 
-            # Create bundled virtual environment
-            self._create_virtual_environment(resources_dir)
+# Files up to this size are read and compressed ahead on worker threads; larger ones
+# are streamed into the archive in ZIP_STREAM_CHUNK pieces
+ZIP_PREFETCH_MAX_BYTES = 1 << 20
+ZIP_STREAM_CHUNK = 1 << 20
+ZIP_WORKERS = max(4, os.cpu_count() or 1)
 
-            # Create README for distribution
-            self._create_distribution_readme(resources_dir, repo_url)
+# Threads copying application files into the bundle; the work is per-file syscall latency
+COPY_WORKERS = 8
 
-            # Create installer script
-            self._create_installer_script(resources_dir)
-            self._create_cli_launcher_script(resources_dir)
+# ioctl request for a Linux copy-on-write file clone (Btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
 
-            # Apply ad-hoc code signature so executables survive Gatekeeper checks
-            self._codesign_app(app_dir)
+# clonefile(2) flag: clone a symlink at src itself rather than its target
+CLONE_NOFOLLOW = 0x0001
 
-            # Create zip package
-            self._create_zip_package(app_dir)
-            
-            logger.info(f"Distribution created successfully in {self.output_dir}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error creating distribution: {e}")
+# Bytes requested per copy_file_range call when a file cannot be cloned
+COPY_CHUNK = 64 << 20
+
+# Mach-O header magics (fat headers are big-endian) and the CPU types a bundle can target
+MACHO_FAT_MAGICS = (0xcafebabe, 0xcafebabf)
+MACHO_MAGICS = (0xfeedface, 0xfeedfacf)
+MACHO_CPU_TYPES = {0x01000007: 'x86_64', 0x0100000c: 'arm64'}
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Errors meaning the filesystem pair cannot clone at all, as opposed to a per-file failure
+_CLONE_UNSUPPORTED = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL, errno.ENOTTY}
+
+# (source device, destination device) pairs that already refused to clone
+_no_clone_devices = set()
+
+@functools.lru_cache(maxsize=1)
+def _clonefile_function():
+    """libSystem's clonefile(2), looked up once; None where it does not exist"""
+    try:
+        import ctypes
+        libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+        clonefile = libsystem.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+def _clone_devices(src: str, dst: str) -> Tuple[int, int]:
+    return (os.stat(src).st_dev, os.stat(os.path.dirname(dst) or '.').st_dev)
+
+def _clone(src: str, dst: str) -> bool:
+    """Create dst as an APFS clone of src with clonefile(2); False, leaving nothing behind, if unsupported."""
+    if sys.platform != 'darwin':
+        return False
+    devices = None
+    if _no_clone_devices:
+        # Once a volume pair has refused, skip straight to copying for the rest of the build
+        try:
+            devices = _clone_devices(src, dst)
+        except OSError:
             return False
+        if devices in _no_clone_devices:
+            return False
+
+    clonefile = _clonefile_function()
+    if clonefile is None:
+        return False
+    if clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+        return True
+    import ctypes
+    if ctypes.get_errno() in _CLONE_UNSUPPORTED:
+        try:
+            _no_clone_devices.add(devices or _clone_devices(src, dst))
+        except OSError:
+            pass
+    return False
+
+def _linux_copy(src: str, dst: str):
+    """
+    Copy src's contents to dst through a single pair of descriptors
     
-    def _copy_application_files(self, resources_dir):
-        """Copy essential application files"""
-        essential_files = [
-            'app.py',
-            'word_processor.py', 
-            'advanced_word_processor.py',
-            'auto_updater.py',
-            'launcher.py',
-            'config.py',
-            '.version',
-            'templates/',
-            'static/',
-            'Samples/'
-        ]
-        
-        for item in essential_files:
-            src = os.path.join(self.source_dir, item)
-            dst = os.path.join(resources_dir, item)
-            
-            if os.path.exists(src):
-                if os.path.isdir(src):
-                    shutil.copytree(src, dst)
-                else:
-                    shutil.copy2(src, dst)
-                logger.info(f"Copied {item}")
+    Tries a FICLONE reflink first, then copy_file_range, which keeps the data in the
+    kernel (and lets NFS/SMB copy server-side); only if both are refused does it fall
+    back to shutil's userspace copy on the same open files.
+    """
+    import fcntl
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        devices = (os.fstat(src_fd).st_dev, os.fstat(dst_fd).st_dev)
+        if devices not in _no_clone_devices:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                return
+            except OSError as exc:
+                if exc.errno in _CLONE_UNSUPPORTED:
+                    _no_clone_devices.add(devices)
 
-    def _prepare_app_icon(self, resources_dir: str):
-        """Ensure the application icon (.icns) is available in the bundle."""
-        icon_name = "AppIcon.icns"
-        destination = Path(resources_dir) / icon_name
-        assets_dir = Path(self.source_dir) / "assets"
-        iconset = assets_dir / "AppIcon.iconset"
-        existing_icns = assets_dir / icon_name
+        copied = 0
+        try:
+            while True:
+                sent = os.copy_file_range(src_fd, dst_fd, COPY_CHUNK)
+                if not sent:
+                    return
+                copied += sent
+        except OSError as exc:
+            if copied or exc.errno not in _CLONE_UNSUPPORTED | {errno.ENOSYS, errno.EBADF, errno.EPERM}:
+                raise
+        shutil.copyfileobj(fsrc, fdst, COPY_CHUNK)
+
+def fast_copy(src: str, dst: str) -> str:
+    """
+    shutil.copy2 replacement for copytree that clones files when the filesystem allows
+    
+    APFS clonefile and Linux FICLONE share blocks copy-on-write, so the copy is
+    near-instant and later writes to either side never affect the other (unlike hard
+    links, which would also carry codesign extended attributes back to the source).
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if sys.platform.startswith('linux') and hasattr(os, 'copy_file_range'):
+        _linux_copy(src, dst)
+        shutil.copystat(src, dst)
+        return dst
+    if _clone(src, dst):
+        # clonefile keeps metadata itself
+        return dst
+    return shutil.copy2(src, dst)
+
+def _user_cache_dir(name: str) -> Optional[Path]:
+    """Per-user directory for build caches that outlive a single build, or None if unavailable"""
+    path = Path.home() / "Library" / "Caches" / "WordGlobalReplace" / name
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return path
+
+def _write_fd(fd: int, data: bytes):
+    """os.write all of data to fd, with no file object or buffer in between"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _write_bundle_file(path: str, content, executable: bool = False):
+    """Write a generated bundle file through one descriptor, setting its mode up front."""
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755 if executable else 0o644)
+    try:
+        if executable:
+            # Also covers a pre-existing file and a restrictive umask, as chmod did
+            os.fchmod(fd, 0o755)
+        _write_fd(fd, data)
+    finally:
+        os.close(fd)
+
+def _macho_architectures(path) -> Optional[set]:
+    """
+    Architectures listed in a Mach-O header, read directly instead of running file(1)
+    
+    Returns None if path is not a Mach-O binary.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        magic, count = struct.unpack('>II', header)
+        if magic in MACHO_FAT_MAGICS:
+            # Java class files share 0xcafebabe, with a class version (45+) where the count is
+            if not 0 < count < 45:
+                return None
+            entry_size = 20 if magic == 0xcafebabe else 32
+            table = f.read(count * entry_size)
+            cpu_types = [struct.unpack_from('>I', table, offset)[0]
+                         for offset in range(0, len(table) - entry_size + 1, entry_size)]
+        elif struct.unpack('<I', header[:4])[0] in MACHO_MAGICS:
+            cpu_types = [struct.unpack('<I', header[4:])[0]]
+        elif magic in MACHO_MAGICS:
+            cpu_types = [count]
+        else:
+            return None
+    return {MACHO_CPU_TYPES[cpu_type] for cpu_type in cpu_types if cpu_type in MACHO_CPU_TYPES}
 
-        if destination.exists():
-            destination.unlink()
+def iter_files(root: str, follow_symlinks: bool = False) -> Iterator[str]:
+    """
+    Yield every file under root, like os.walk but from a single os.scandir per directory
+    
+    Symlinked directories are only descended when follow_symlinks is set; otherwise
+    they are skipped, as os.walk lists them as directories it does not enter.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=follow_symlinks):
+                yield from iter_files(entry.path, follow_symlinks)
+            elif not entry.is_dir():
+                yield entry.path
+
+def _parallel_copytree(src: str, dst: str, executor: ThreadPoolExecutor, symlinks: bool = False):
+    """
+    Recreate src's directory tree under dst and queue every file copy on executor
+    
+    Directories are created here, on the calling thread, so workers only copy files.
+    Symlinks are followed, as shutil.copytree does by default; with symlinks set they
+    are recreated as links instead, judged from the DirEntry type without resolving them.
+    
+    Returns:
+        (futures, directories): the queued copies, and (src_dir, dst_dir) pairs whose
+        metadata should be copied once the files are in place
+    """
+    futures = []
+    directories = []
+    pending = [(src, dst)]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        directories.append((src_dir, dst_dir))
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if symlinks and entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), target)
+                elif entry.is_dir(follow_symlinks=not symlinks):
+                    pending.append((entry.path, target))
+                else:
+                    futures.append(executor.submit(fast_copy, entry.path, target))
+    return futures, directories
 
-        if iconset.exists():
-            iconutil = shutil.which("iconutil")
-            if iconutil:
-                try:
-                    subprocess.run(
-                        [
-                            iconutil,
-                            "--convert",
-                            "icns",
-                            "--output",
-                            str(destination),
-                            str(iconset),
-                        ],
-                        check=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                    )
-                    logger.info("Converted iconset to AppIcon.icns")
-                    return
-                except subprocess.CalledProcessError as exc:
-                    logger.warning("iconutil failed to convert iconset: %s", exc)
+def _remove_path(path: str):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.unlink(path)
 
-        if existing_icns.exists():
-            shutil.copy2(existing_icns, destination)
-            logger.info("Copied existing AppIcon.icns")
+def _needs_copy(src_stat: os.stat_result, dst: str) -> bool:
+    """
+    True if dst is not already an up-to-date copy of a file with src_stat
+    
+    Copies keep the source's size and mtime (copy2, clonefile, cp -p), so matching
+    values mean the file is unchanged. An outdated dst is removed, so the copy that
+    follows starts from a clean path.
+    """
+    try:
+        dst_stat = os.lstat(dst)
+    except FileNotFoundError:
+        return True
+    if (stat.S_ISREG(dst_stat.st_mode) and dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime_ns == src_stat.st_mtime_ns):
+        return False
+    _remove_path(dst)
+    return True
+
+def _sync_tree(src: str, dst: str, executor: ThreadPoolExecutor):
+    """
+    Update an existing copy of src at dst, queueing only the files that changed
+    
+    Like _parallel_copytree, but unchanged files are left in place and entries that
+    are no longer in src are removed. Returns the same (futures, directories) pair.
+    """
+    futures = []
+    directories = []
+    pending = [(src, dst)]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        if os.path.lexists(dst_dir) and not os.path.isdir(dst_dir):
+            os.unlink(dst_dir)
+        os.makedirs(dst_dir, exist_ok=True)
+        directories.append((src_dir, dst_dir))
+        with os.scandir(dst_dir) as entries:
+            stale = {entry.name for entry in entries}
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                stale.discard(entry.name)
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, target))
+                elif _needs_copy(entry.stat(), target):
+                    futures.append(executor.submit(fast_copy, entry.path, target))
+        for name in stale:
+            _remove_path(os.path.join(dst_dir, name))
+    return futures, directories
+
+def _platform_copytree(src: str, dst: str, executor: ThreadPoolExecutor):
+    """
+    Copy a directory tree into the bundle, as _parallel_copytree but fastest per platform
+    
+    On macOS a single `cp -Rcp` clones the whole tree with clonefile from native code,
+    keeping timestamps so a later _sync_tree can tell the files are unchanged.
+    If cp refuses (for example across volumes, where -c cannot clone), the partial copy
+    is removed and the per-file thread pool copy is used instead.
+    """
+    if sys.platform == 'darwin':
+        src_path = os.path.normpath(src)
+        dst_path = os.path.normpath(dst)
+        result = subprocess.run(['/bin/cp', '-Rcp', src_path, dst_path], capture_output=True, text=True)
+        if result.returncode == 0:
+            return [], []
+        logger.debug("cp -Rc failed for %s (%s); copying file by file", src_path, result.stderr.strip())
+        shutil.rmtree(dst_path, ignore_errors=True)
+    return _parallel_copytree(src, dst, executor)
+
+def _copytree_keep_links(src: str, dst: str):
+    """
+    shutil.copytree(src, dst, symlinks=True), done natively on macOS
+    
+    On APFS a single clonefile(2) of the directory clones the whole hierarchy
+    copy-on-write, so later edits to the bundled copy (install_name_tool, codesign)
+    never reach src. Otherwise ditto copies the tree from native code and keeps the
+    extended attributes, ACLs and resource forks a framework may carry. If that fails
+    too, the partial copy is removed and the tree is copied file by file in parallel,
+    recreating the framework's Versions/Current style symlinks without resolving them.
+    """
+    clonefile = _clonefile_function() if sys.platform == 'darwin' else None
+    if clonefile is not None:
+        if clonefile(os.fsencode(src), os.fsencode(dst), CLONE_NOFOLLOW) == 0:
             return
-
-        fallback_png = assets_dir / "AppIcon-1024.png"
-        if fallback_png.exists():
-            shutil.copy2(fallback_png, destination)
-            logger.warning("Using PNG icon as fallback; consider generating AppIcon.icns")
+        import ctypes
+        logger.debug("clonefile failed for %s (%s); copying instead", src, os.strerror(ctypes.get_errno()))
+    if sys.platform == 'darwin' and os.path.exists('/usr/bin/ditto'):
+        result = subprocess.run(['/usr/bin/ditto', str(src), str(dst)], capture_output=True, text=True)
+        if result.returncode == 0:
+            return
+        logger.debug("ditto failed for %s (%s); copying with shutil", src, result.stderr.strip())
+        shutil.rmtree(dst, ignore_errors=True)
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        futures, directories = _parallel_copytree(src, dst, executor, symlinks=True)
+        for future in futures:
+            future.result()
+    for src_dir, dst_dir in reversed(directories):
+        shutil.copystat(src_dir, dst_dir)
+
+def _stage_tree(src: str, dst: str, executor: ThreadPoolExecutor):
+    """Copy src to dst, or sync dst if an earlier build left a copy there"""
+    if os.path.isdir(dst):
+        return _sync_tree(src, dst, executor)
+    return _platform_copytree(src, dst, executor)
+
+def write_zip_entry(zipf: zipfile.ZipFile, file_path: str, arc_path: str,
+                    stored_extensions: frozenset = STORED_EXTENSIONS):
+    """Add a file to a distribution zip, storing already-compressed formats as-is."""
+    zipf.write(file_path, arc_path, compress_type=_entry_compress_type(zipf, file_path, stored_extensions))
+
+def _entry_compress_type(zipf: zipfile.ZipFile, file_path: str,
+                         stored_extensions: frozenset = STORED_EXTENSIONS) -> int:
+    extension = os.path.splitext(file_path)[1].lower()
+    return zipfile.ZIP_STORED if extension in stored_extensions else zipf.compression
+
+def _prepare_entry(file_path: str, compress_type: int, compresslevel: Optional[int]):
+    """
+    Read, checksum and compress one file on a worker thread
+    
+    zlib releases the GIL while deflating, so entries compress in parallel. Returns
+    ((mtime, mode, size), data, crc, payload); data is None for files too big to hold in
+    memory, and payload is None when the compression method is not one prepared here.
+    Big stored files still get their crc, so the writer can copy them in the kernel.
+    """
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        meta = (st.st_mtime, st.st_mode, st.st_size)
+        if st.st_size > ZIP_PREFETCH_MAX_BYTES:
+            if compress_type != zipfile.ZIP_STORED:
+                return meta, None, None, None
+            crc = size = 0
+            for chunk in iter(functools.partial(f.read, ZIP_STREAM_CHUNK), b''):
+                crc = _crc32(chunk, crc)
+                size += len(chunk)
+            return (st.st_mtime, st.st_mode, size), None, crc, None
+        data = f.read()
+    return _compress_entry(meta, data, compress_type, compresslevel)
+
+def _prepare_preloaded_entry(entry: Tuple[bytes, int, float], compress_type: int, compresslevel: Optional[int]):
+    """As _prepare_entry, for a (data, mode, mtime) file already in memory; nothing touches the disk"""
+    data, mode, mtime = entry
+    return _compress_entry((mtime, mode, len(data)), data, compress_type, compresslevel)
+
+def _deflate_backend(compresslevel: Optional[int]):
+    """
+    zlib-compatible module to deflate entries with at compresslevel
+    
+    ISA-L only has levels 0-3 (its 1 is several times faster than zlib's 1 and packs
+    tighter), so it takes the fast levels when installed; other levels use zlib-ng,
+    which matches zlib's ratios at each level, before falling back to stdlib zlib.
+    """
+    if isal_zlib is not None and compresslevel is not None and 1 <= compresslevel <= isal_zlib.ISAL_BEST_COMPRESSION:
+        return isal_zlib
+    return zlib_ng or zlib
+
+# CRC-32 of zip entries, from whichever installed module has a SIMD implementation
+_crc32 = (zlib_ng or isal_zlib or zlib).crc32
+
+def _compress_entry(meta: Tuple[float, int, int], data: bytes, compress_type: int, compresslevel: Optional[int]):
+    crc = _crc32(data)
+    if compress_type == zipfile.ZIP_STORED:
+        return meta, data, crc, data
+    if compress_type == zipfile.ZIP_DEFLATED:
+        # Raw DEFLATE stream, as zipfile's own compressor produces it; any backend's
+        # output is standard DEFLATE that every unzip reads
+        level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+        backend = _deflate_backend(compresslevel)
+        compressor = backend.compressobj(level, backend.DEFLATED, -15)
+        return meta, data, crc, compressor.compress(data) + compressor.flush()
+    return meta, data, crc, None
+
+def _copy_file_into(fp, file_path: str, size: int):
+    """
+    Append exactly size bytes of file_path to the archive's file object
+    
+    Uses copy_file_range on the archive's descriptor where the kernel supports it, so
+    the bytes never pass through Python; otherwise copies in ZIP_STREAM_CHUNK pieces.
+    """
+    with open(file_path, 'rb') as src:
+        remaining = size
+        if hasattr(os, 'copy_file_range') and hasattr(fp, 'raw'):
+            fp.flush()
+            out_fd = fp.fileno()
+            try:
+                while remaining:
+                    sent = os.copy_file_range(src.fileno(), out_fd, remaining)
+                    if not sent:
+                        break
+                    remaining -= sent
+            except OSError as exc:
+                if remaining != size or exc.errno not in _CLONE_UNSUPPORTED | {errno.ENOSYS, errno.EBADF}:
+                    raise
+            # The buffered writer tracks its own position; resync it with the descriptor
+            fp.seek(os.lseek(out_fd, 0, os.SEEK_CUR))
+        while remaining:
+            chunk = src.read(min(remaining, ZIP_STREAM_CHUNK))
+            if not chunk:
+                break
+            fp.write(chunk)
+            remaining -= len(chunk)
+    if remaining:
+        raise OSError(f"{file_path} changed size while it was being archived")
+
+def _append_precompressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload: bytes,
+                          source_path: Optional[str] = None):
+    """
+    Append an entry whose CRC, sizes and compressed bytes are already known
+    
+    Follows ZipFile._open_to_write and _ZipWriteFile.close for a seekable archive, but
+    as the header is final up front it is written once, with no seek back to patch it.
+    With source_path, the (stored) entry's bytes are copied from that file instead.
+    """
+    with zipf._lock:
+        if zipf._writing:
+            raise ValueError("Can't write to the ZIP file while another write handle is open")
+        if zipf.fp.tell() != zipf.start_dir:
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zipf.fp.write(zinfo.FileHeader())
+        if source_path is not None:
+            _copy_file_into(zipf.fp, source_path, zinfo.compress_size)
         else:
-            logger.warning("Application icon assets not found; Dock icon may be generic.")
+            zipf.fp.write(payload)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+
+def _can_append_precompressed(zipf: zipfile.ZipFile) -> bool:
+    # Relies on zipfile internals; anything unexpected falls back to writestr
+    return (getattr(zipf, '_seekable', False)
+            and all(hasattr(zipf, name) for name in ('_lock', '_writing', '_writecheck', 'start_dir')))
+
+def _write_prepared_entry(zipf: zipfile.ZipFile, file_path: str, arc_path: str,
+                          compress_type: int, prepared, precompressed_ok: bool):
+    meta, data, crc, payload = prepared
+    # Same header ZipInfo.from_file would build, from the stat taken while reading (or
+    # the mode and write time recorded for a generated file)
+    mtime, mode, size = meta
+    zinfo = zipfile.ZipInfo(arc_path, time.localtime(mtime)[:6])
+    zinfo.external_attr = (mode & 0xFFFF) << 16
+    zinfo.compress_type = compress_type
+    if data is None:
+        zinfo.file_size = size
+        if crc is not None and precompressed_ok and size * 1.05 <= zipfile.ZIP64_LIMIT:
+            # Big stored file, already checksummed: copy its bytes straight in
+            zinfo.compress_size = size
+            zinfo.CRC = crc
+            _append_precompressed(zipf, zinfo, None, source_path=file_path)
+            return
+        # Too big to hold in memory: stream it, as ZipFile.write would but without its stat
+        zinfo._compresslevel = zipf.compresslevel
+        with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dest:
+            shutil.copyfileobj(src, dest, ZIP_STREAM_CHUNK)
+        return
+    if payload is not None and precompressed_ok and len(data) * 1.05 <= zipfile.ZIP64_LIMIT:
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(payload)
+        zinfo.CRC = crc
+        _append_precompressed(zipf, zinfo, payload)
+    else:
+        zipf.writestr(zinfo, data, compress_type=compress_type, compresslevel=zipf.compresslevel)
 
-    def _create_info_plist(self, contents_dir):
-        """Create the macOS Info.plist metadata file"""
-        plist_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+def write_zip_entries(zipf: zipfile.ZipFile, entries: Iterable[Tuple[str, str]],
+                      preloaded: Optional[Dict[str, Tuple[bytes, int, float]]] = None,
+                      stored_extensions: frozenset = STORED_EXTENSIONS):
+    """
+    Add (file_path, arc_path) pairs to a distribution zip, in order
+    
+    Files up to ZIP_PREFETCH_MAX_BYTES are read and compressed on a thread pool a
+    bounded window ahead of the writer, which only appends the finished entries. Larger
+    files are streamed by zipfile as usual. Files whose normalized path is a key of
+    preloaded are built from its (data, st_mode, mtime) value without any disk access.
+    Extensions in stored_extensions are written uncompressed.
+    """
+    precompressed_ok = _can_append_precompressed(zipf)
+    window = deque()
+
+    def write_oldest():
+        file_path, arc_path, compress_type, future = window.popleft()
+        _write_prepared_entry(zipf, file_path, arc_path, compress_type, future.result(), precompressed_ok)
+
+    with ThreadPoolExecutor(max_workers=ZIP_WORKERS) as executor:
+        for file_path, arc_path in entries:
+            compress_type = _entry_compress_type(zipf, file_path, stored_extensions)
+            preloaded_entry = preloaded.get(os.path.normpath(file_path)) if preloaded else None
+            if preloaded_entry is not None:
+                future = executor.submit(_prepare_preloaded_entry, preloaded_entry, compress_type, zipf.compresslevel)
+            else:
+                future = executor.submit(_prepare_entry, file_path, compress_type, zipf.compresslevel)
+            window.append((file_path, arc_path, compress_type, future))
+            if len(window) > ZIP_WORKERS * 2:
+                write_oldest()
+        while window:
+            write_oldest()
+
+def write_release_zip(app_dir: str, zip_path: str, version_info: dict):
+    """
+    Zip the contents of a built .app as a release package, with version_info as version.json
+    
+    Symlinks are followed, matching the dereferencing copy release zips used to be made
+    from. version.json only ever exists inside the zip.
+    """
+    prefix_len = len(os.path.join(app_dir, ''))
+    entries = (
+        (file_path, file_path[prefix_len:])
+        for file_path in iter_files(app_dir, follow_symlinks=True)
+    )
+    with open(zip_path, 'wb', buffering=ZIP_WRITE_BUFFER) as raw, \
+            zipfile.ZipFile(raw, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zipf:
+        write_zip_entries(zipf, entries)
+        zipf.writestr("version.json", json.dumps(version_info, indent=2))
+
+# Bundle file contents, built once at import instead of on every distribution build.
+# Shell scripts are plain bytes since their $VARIABLES would clash with string.Template.
+_PLIST_TEMPLATE = string.Template('''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
     <key>CFBundleName</key>
-    <string>{self.app_name}</string>
+    <string>${app_name}</string>
     <key>CFBundleIdentifier</key>
-    <string>{CF_BUNDLE_IDENTIFIER}</string>
+    <string>${bundle_id}</string>
     <key>CFBundleVersion</key>
     <string>1.0</string>
     <key>CFBundleShortVersionString</key>
@@ -182,21 +648,14 @@ class DistributionCreator:
     <key>NSHighResolutionCapable</key>
     <true/>
     <key>CFBundleExecutable</key>
-    <string>{self.app_name}</string>
+    <string>${app_name}</string>
     <key>LSMinimumSystemVersion</key>
-    <string>{MIN_MACOS_VERSION}</string>
+    <string>${min_macos}</string>
 </dict>
 </plist>
-'''
+''')
 
-        plist_path = os.path.join(contents_dir, "Info.plist")
-        with open(plist_path, 'w') as f:
-            f.write(plist_content)
-        logger.info("Created Info.plist")
-    
-    def _create_launcher_script(self, macos_dir, resources_dir, repo_url):
-        """Create the main launcher scripts for the bundle"""
-        run_launcher_content = f'''#!/usr/bin/env python3
+_RUN_LAUNCHER_TEMPLATE = string.Template('''#!/usr/bin/env python3
 """WordGlobalReplace - Auto-updating launcher"""
 
 import os
@@ -241,15 +700,15 @@ def main():
         from config import DEFAULT_REPO_URL
 
         launcher = WordGlobalReplaceLauncher()
-        distribution_repo_url = "{repo_url or ''}"
+        distribution_repo_url = "${repo_url}"
         launcher.run(repo_url=distribution_repo_url or DEFAULT_REPO_URL, auto_update=True)
 
     except ImportError as exc:
-        print(f"Error importing launcher: {{exc}}")
+        print(f"Error importing launcher: {exc}")
         print("Please ensure all files are present in the application directory.")
         return 1
     except Exception as exc:
-        print(f"Error running application: {{exc}}")
+        print(f"Error running application: {exc}")
         return 1
 
     return 0
@@ -257,75 +716,579 @@ def main():
 
 if __name__ == "__main__":
     sys.exit(main())
+''')
+
+_MAC_LAUNCHER_BYTES = """#!/bin/bash
+APP_DIR=\"$(cd \"$(dirname \"$0\")/..\" && pwd)\"
+RESOURCE_DIR=\"$APP_DIR/Resources\"
+LOG_DIR=\"${HOME}/Library/Logs/WordGlobalReplace\"
+LOG_FILE=\"$LOG_DIR/launcher.log\"
+VENV_PY=\"$RESOURCE_DIR/venv/bin/python3\"
+FALLBACK_PY=\"$RESOURCE_DIR/venv/bin/python\"
+
+mkdir -p \"$LOG_DIR\"
+
+if [ ! -t 1 ]; then
+    exec >>\"$LOG_FILE\" 2>&1
+fi
+
+timestamp() {
+    date '+%Y-%m-%d %H:%M:%S'
+}
+
+echo \"[$(timestamp)] Starting WordGlobalReplace launcher\"
+
+export PYTHONUNBUFFERED=1
+export WORD_GLOBAL_REPLACE_SKIP_BROWSER=1
+export PYTHONPATH=\"$RESOURCE_DIR:${PYTHONPATH:-}\"
+export DYLD_FRAMEWORK_PATH=\"$RESOURCE_DIR:${DYLD_FRAMEWORK_PATH:-}\"
+
+cd \"$RESOURCE_DIR\"
+
+run_with_interpreter() {
+    local interpreter=\"$1\"
+    shift
+    if [ ! -x \"$interpreter\" ]; then
+        return 127
+    fi
+
+    echo \"[$(timestamp)] Launching with interpreter: $interpreter\"
+    PYTHONEXECUTABLE=\"$interpreter\" \"$interpreter\" run.py \"$@\"
+}
+
+if run_with_interpreter \"$VENV_PY\" \"$@\"; then
+    exit 0
+fi
+
+if run_with_interpreter \"$FALLBACK_PY\" \"$@\"; then
+    exit 0
+fi
+
+echo \"[$(timestamp)] Bundled interpreter failed; falling back to system python\" 1>&2
+unset DYLD_FRAMEWORK_PATH
+unset PYTHONEXECUTABLE
+
+exec /usr/bin/env python3 run.py \"$@\"
+""".encode('utf-8')
+
+_REQUIREMENTS_BYTES = b'''# WordGlobalReplace - Python Dependencies
+# Core web framework
+Flask==2.3.3
+
+# Word document processing
+python-docx>=1.0
+
+# Additional utilities
+pathlib2==2.3.7; python_version < "3.4"
 '''
 
-        python_launcher_path = os.path.join(resources_dir, "run.py")
-        with open(python_launcher_path, 'w') as f:
-            f.write(run_launcher_content)
-        os.chmod(python_launcher_path, 0o755)
-        logger.info("Created Python launcher script")
+_README_TEMPLATE = string.Template('''# WordGlobalReplace
+
+A lightweight application for finding and replacing text across multiple Word documents.
+
+## Features
+
+- Web-based interface for easy use
+- Support for multiple Word document formats (.doc, .docx)
+- Advanced search with context preview
+- Batch replacement capabilities
+- Auto-updating from GitHub (if repository URL is configured)
+- Backup creation before replacements
+
+## Installation
+
+1. Extract the archive and copy `WordGlobalReplace.app` to your Applications folder (or preferred location)
+2. Double-click the app to launch it
+3. Optionally run `./install.sh` for quick usage instructions
+
+## Usage
+
+1. Launch the application by opening `WordGlobalReplace.app`
+2. Open your browser to: ${local_url}
+3. Select a directory containing Word documents
+4. Enter search and replacement text
+5. Review matches and apply replacements
+
+## Auto-Updates
+
+${auto_update_note}
+
+The application will automatically check for updates when launched and update itself if new versions are available.
+
+## Requirements
+
+- macOS (tested on macOS 10.14+)
+- Internet connection (for auto-updates)
+
+## Troubleshooting
+
+If you encounter issues:
+
+1. Verify the app bundle has write permissions (needed for backups/updates)
+2. Check the console output for error messages (`open -a Terminal WordGlobalReplace.app`)
+3. Ensure you have an active internet connection for auto-updates
+
+## Support
+
+For issues and support, please check the GitHub repository or contact the developer.
+''')
+
+_INSTALLER_BYTES = f'''#!/bin/bash
+# WordGlobalReplace Quick Launch Script
+
+echo "WordGlobalReplace"
+echo "=================="
+
+cd "$(dirname "$0")"
+
+echo "All dependencies are bundled with the application."
+echo ""
+echo "To launch the app now, run:"
+echo "  open ../.."
+echo ""
+echo "When running, open your browser to: {DEFAULT_LOCAL_URL}"
+echo ""
+echo "Tip: You can place WordGlobalReplace.app in /Applications for easy access."
+'''.encode('utf-8')
+
+_CLI_LAUNCHER_BYTES = """#!/bin/bash
+# WordGlobalReplace CLI launcher
+
+set -e
+
+RESOURCE_DIR=\"$(cd \"$(dirname \"$0\")\" && pwd)\"
+PYTHON_BIN=\"$RESOURCE_DIR/venv/bin/python3\"
+RUN_SCRIPT=\"$RESOURCE_DIR/run.py\"
+
+if [ ! -x \"$PYTHON_BIN\" ]; then
+    echo \"Bundled Python interpreter not found; falling back to system python\" >&2
+    exec /usr/bin/env python3 \"$RUN_SCRIPT\" \"$@\"
+fi
+
+exec \"$PYTHON_BIN\" \"$RUN_SCRIPT\" \"$@\"
+""".encode('utf-8')
+
+# Swift source for the native launcher; only the URLs vary between builds
+_SWIFT_LAUNCHER_TEMPLATE = string.Template('''\
+import Cocoa
+import Darwin
+
+@main
+class AppDelegate: NSObject, NSApplicationDelegate {
+    var task: Process?
+    var logHandle: FileHandle?
+    let defaultURL = "$default_url"
+    let repoURL = "$repo_url"
+    var isShuttingDown = false
+
+    static func main() {
+        let app = NSApplication.shared
+        let delegate = AppDelegate()
+        app.delegate = delegate
+        app.run()
+    }
+
+    func applicationDidFinishLaunching(_ notification: Notification) {
+        NSApp.setActivationPolicy(.regular)
+        setupMenus()
+        setupLogging()
+        launchServer()
+        NSApp.activate(ignoringOtherApps: true)
+        DispatchQueue.main.asyncAfter(deadline: .now() + 1.0) {
+            self.openWebApp(nil)
+        }
+    }
+
+    func applicationWillTerminate(_ notification: Notification) {
+        isShuttingDown = true
+        stopServer(forceKill: true)
+        try? logHandle?.close()
+        logHandle = nil
+    }
+
+    func setupMenus() {
+        let mainMenu = NSMenu()
+        let appMenuItem = NSMenuItem()
+        mainMenu.addItem(appMenuItem)
+
+        let appMenu = NSMenu(title: "WordGlobalReplace")
+        let openItem = NSMenuItem(title: "Open Web App", action: #selector(openWebApp(_:)), keyEquivalent: "o")
+        openItem.target = self
+        appMenu.addItem(openItem)
+        appMenu.addItem(NSMenuItem.separator())
+        let quitItem = NSMenuItem(title: "Quit WordGlobalReplace", action: #selector(quitApp(_:)), keyEquivalent: "q")
+        quitItem.target = self
+        appMenu.addItem(quitItem)
+        appMenuItem.submenu = appMenu
+
+        NSApp.mainMenu = mainMenu
+    }
+
+    func setupLogging() {
+        let fm = FileManager.default
+        let logDir = fm.homeDirectoryForCurrentUser.appendingPathComponent("Library/Logs/WordGlobalReplace", isDirectory: true)
+        try? fm.createDirectory(at: logDir, withIntermediateDirectories: true)
+        let logURL = logDir.appendingPathComponent("launcher.log")
+        if !fm.fileExists(atPath: logURL.path) {
+            fm.createFile(atPath: logURL.path, contents: nil, attributes: nil)
+        }
+        logHandle = try? FileHandle(forWritingTo: logURL)
+        logHandle?.seekToEndOfFile()
+        log("Launcher started")
+    }
+
+    func log(_ message: String) {
+        let formatter = ISO8601DateFormatter()
+        let timestamp = formatter.string(from: Date())
+        let line = "[\\(timestamp)] \\(message)\\n"
+        if let data = line.data(using: .utf8) {
+            logHandle?.write(data)
+        }
+        fputs(line, stderr)
+    }
+
+    func launchServer() {
+        guard let resourcePath = Bundle.main.resourcePath else {
+            log("Missing resources path")
+            showCriticalAlert(title: "Launcher Error", message: "Unable to locate application resources.")
+            NSApp.terminate(nil)
+            return
+        }
+
+        let pythonPath = (resourcePath as NSString).appendingPathComponent("venv/bin/python3")
+        let runScriptPath = (resourcePath as NSString).appendingPathComponent("run.py")
+        if !FileManager.default.isExecutableFile(atPath: pythonPath) {
+            log("Bundled interpreter not found at \\(pythonPath)")
+            showCriticalAlert(title: "Launcher Error", message: "Bundled Python interpreter is missing.")
+            NSApp.terminate(nil)
+            return
+        }
+
+        let process = Process()
+        process.executableURL = URL(fileURLWithPath: pythonPath)
+        process.arguments = [runScriptPath]
+        process.currentDirectoryURL = URL(fileURLWithPath: resourcePath)
+
+        var environment = ProcessInfo.processInfo.environment
+        environment["PYTHONUNBUFFERED"] = "1"
+        environment["WORD_GLOBAL_REPLACE_SKIP_BROWSER"] = "1"
+        environment["WORD_GLOBAL_REPLACE_PARENT_PID"] = String(ProcessInfo.processInfo.processIdentifier)
+        if !repoURL.isEmpty {
+            environment["WORD_GLOBAL_REPLACE_REPO_URL"] = repoURL
+        }
+        process.environment = environment
+
+        if let handle = logHandle {
+            process.standardOutput = handle
+            process.standardError = handle
+        }
+
+        do {
+            try process.run()
+            log("Launched Python backend (pid: \\(process.processIdentifier))")
+            task = process
+            process.terminationHandler = { [weak self] proc in
+                DispatchQueue.main.async {
+                    self?.handleTermination(status: proc.terminationStatus)
+                }
+            }
+        } catch {
+            log("Failed to launch backend: \\(error.localizedDescription)")
+            showCriticalAlert(title: "Unable to start application", message: error.localizedDescription)
+            NSApp.terminate(nil)
+        }
+    }
+
+    func stopServer(forceKill: Bool) {
+        guard let process = task else {
+            task = nil
+            return
+        }
+
+        if !process.isRunning {
+            task = nil
+            return
+        }
+
+        log("Stopping backend (forceKill: \\(forceKill))")
+        process.terminate()
+        if !waitForExit(process, timeout: 2.0) || forceKill {
+            if process.isRunning {
+                log("Backend still running; sending SIGKILL")
+                kill(process.processIdentifier, SIGKILL)
+                _ = waitForExit(process, timeout: 1.0)
+            }
+        }
+        task = nil
+    }
+
+    func waitForExit(_ process: Process, timeout: TimeInterval) -> Bool {
+        let deadline = Date().addingTimeInterval(timeout)
+        while process.isRunning && Date() < deadline {
+            Thread.sleep(forTimeInterval: 0.1)
+        }
+        return !process.isRunning
+    }
+
+    func handleTermination(status: Int32) {
+        task = nil
+        if isShuttingDown {
+            log("Backend exited with status \\(status) during shutdown")
+            return
+        }
+        log("Backend exited unexpectedly with status \\(status)")
+        let alert = NSAlert()
+        alert.alertStyle = .warning
+        alert.messageText = "WordGlobalReplace backend stopped"
+        alert.informativeText = "The embedded server exited with status code \\(status)."
+        alert.addButton(withTitle: "Quit")
+        alert.runModal()
+        NSApp.terminate(nil)
+    }
+
+    func showCriticalAlert(title: String, message: String) {
+        let alert = NSAlert()
+        alert.alertStyle = .critical
+        alert.messageText = title
+        alert.informativeText = message
+        alert.addButton(withTitle: "Quit")
+        alert.runModal()
+    }
+
+    @objc func openWebApp(_ sender: Any?) {
+        guard let url = URL(string: defaultURL) else {
+            log("Invalid URL: \\(defaultURL)")
+            return
+        }
+        NSWorkspace.shared.open(url)
+    }
+
+    @objc func quitApp(_ sender: Any?) {
+        isShuttingDown = true
+        stopServer(forceKill: true)
+        NSApp.terminate(nil)
+    }
+}
+''')
+
+class DistributionCreator:
+    def __init__(self, source_dir=None, output_dir="dist", python_executable=None, fast=False,
+                 archive_format="zip", compresslevel=None):
+        if archive_format is not None and archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unsupported archive format: {archive_format}")
+        if compresslevel is not None and not 0 <= compresslevel <= 9:
+            raise ValueError(f"Unsupported compression level: {compresslevel}")
+        self.source_dir = source_dir or os.path.dirname(os.path.abspath(__file__))
+        self.output_dir = output_dir
+        self.archive_format = archive_format
+        self.zip_compresslevel = ZIP_FAST_COMPRESSLEVEL if fast else ZIP_COMPRESSLEVEL
+        if compresslevel is not None:
+            self.zip_compresslevel = compresslevel
+        self.zip_stored_extensions = FAST_STORED_EXTENSIONS if fast else STORED_EXTENSIONS
+        self.app_name = "WordGlobalReplace"
+        self.requested_python = python_executable or os.environ.get("WORD_GLOBAL_REPLACE_BUILD_PYTHON")
+        self.python_context = None
+        self._framework_info_cache = {}
+        # Values shared by the bundle templates
+        self._format_ctx = {
+            'app_name': self.app_name,
+            'bundle_id': CF_BUNDLE_IDENTIFIER,
+            'min_macos': MIN_MACOS_VERSION,
+            'local_url': DEFAULT_LOCAL_URL,
+        }
+        # Files that do not depend on the repo URL, encoded once per creator
+        self._plist_bytes = _PLIST_TEMPLATE.substitute(self._format_ctx).encode('utf-8')
+        self._requirements_bytes = _REQUIREMENTS_BYTES
+        # (data, st_mode, mtime) of the files generated into the current bundle, by normalized path
+        self._generated_files: Dict[str, Tuple[bytes, int, float]] = {}
+        
+    def create_distribution(self, repo_url=None):
+        """Create a distributable package"""
+        try:
+            self._generated_files = {}
+            self._framework_info_cache = {}
+
+            # Create app directory, or update an existing one in place so unchanged application
+            # files are not re-copied; creating its MacOS folder also creates the output directory
+            app_dir = os.path.join(self.output_dir, f"{self.app_name}.app")
+
+            contents_dir = os.path.join(app_dir, "Contents")
+            macos_dir = os.path.join(contents_dir, "MacOS")
+            resources_dir = os.path.join(contents_dir, "Resources")
+
+            os.makedirs(macos_dir, exist_ok=True)
+            os.makedirs(resources_dir, exist_ok=True)
+
+            # Copy application files
+            self._copy_application_files(resources_dir)
+            self._prepare_app_icon(resources_dir)
+
+            # Create requirements file; the virtual environment installs from it
+            self._create_requirements_file(resources_dir)
 
-        if self._create_swift_launcher(macos_dir, resources_dir, repo_url):
-            logger.info("Created native Swift launcher executable")
-            return
+            # Metadata, launchers (including the swiftc build) and helper scripts
+            # are independent of the venv, so they run while it is being built
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = [
+                    executor.submit(self._create_info_plist, contents_dir),
+                    executor.submit(self._create_launcher_script, macos_dir, resources_dir, repo_url),
+                    executor.submit(self._create_distribution_readme, resources_dir, repo_url),
+                    executor.submit(self._create_installer_script, resources_dir),
+                    executor.submit(self._create_cli_launcher_script, resources_dir),
+                ]
 
-        mac_launcher_content = """#!/bin/bash
-APP_DIR=\"$(cd \"$(dirname \"$0\")/..\" && pwd)\"
-RESOURCE_DIR=\"$APP_DIR/Resources\"
-LOG_DIR=\"${HOME}/Library/Logs/WordGlobalReplace\"
-LOG_FILE=\"$LOG_DIR/launcher.log\"
-VENV_PY=\"$RESOURCE_DIR/venv/bin/python3\"
-FALLBACK_PY=\"$RESOURCE_DIR/venv/bin/python\"
+                # Create bundled virtual environment
+                self._create_virtual_environment(resources_dir)
 
-mkdir -p \"$LOG_DIR\"
+                for future in futures:
+                    future.result()
 
-if [ ! -t 1 ]; then
-    exec >>\"$LOG_FILE\" 2>&1
-fi
+            # Apply ad-hoc code signature so executables survive Gatekeeper checks
+            self._codesign_app(app_dir)
 
-timestamp() {
-    date '+%Y-%m-%d %H:%M:%S'
-}
+            # Create the distribution archive, unless the caller only wants the .app
+            if self.archive_format is None:
+                logger.info("Skipping distribution archive; the app bundle is in %s", app_dir)
+            elif self.archive_format == 'tar.zst' and zstandard is not None:
+                self._create_tar_zst_package(app_dir)
+            else:
+                if self.archive_format == 'tar.zst':
+                    logger.warning("zstandard is not installed (pip install zstandard); creating a zip instead")
+                self._create_zip_package(app_dir)
+            
+            logger.info(f"Distribution created successfully in {self.output_dir}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error creating distribution: {e}")
+            return False
+    
+    def _copy_application_files(self, resources_dir):
+        """Copy essential application files"""
+        essential_files = [
+            'app.py',
+            'word_processor.py', 
+            'advanced_word_processor.py',
+            'auto_updater.py',
+            'launcher.py',
+            'config.py',
+            '.version',
+            'templates/',
+            'static/',
+            'Samples/'
+        ]
+        
+        copied = []
+        futures = []
+        tree_futures = []
+        directories = []
+        # Directory items are walked (or cloned by cp on macOS) concurrently, each feeding
+        # its file copies to the shared copy pool
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor, \
+                ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(essential_files))) as walkers:
+            for item in essential_files:
+                src = os.path.join(self.source_dir, item)
+                dst = os.path.join(resources_dir, item)
+                
+                # One stat answers exists, isdir and the _needs_copy check together
+                try:
+                    src_stat = os.stat(src)
+                except FileNotFoundError:
+                    continue
+                if stat.S_ISDIR(src_stat.st_mode):
+                    tree_futures.append(walkers.submit(_stage_tree, src, dst, executor))
+                elif _needs_copy(src_stat, dst):
+                    futures.append(executor.submit(fast_copy, src, dst))
+                copied.append(item)
+
+            for tree_future in tree_futures:
+                item_futures, item_directories = tree_future.result()
+                futures.extend(item_futures)
+                directories.extend(item_directories)
+            
+            # Surface the first copy error, as the serial copy did
+            for future in futures:
+                future.result()
+        
+        # Directory times last, since copying files into them changes their mtime
+        for src_dir, dst_dir in reversed(directories):
+            shutil.copystat(src_dir, dst_dir)
+        for item in copied:
+            logger.info(f"Copied {item}")
 
-echo \"[$(timestamp)] Starting WordGlobalReplace launcher\"
+    def _prepare_app_icon(self, resources_dir: str):
+        """Ensure the application icon (.icns) is available in the bundle."""
+        icon_name = "AppIcon.icns"
+        destination = Path(resources_dir) / icon_name
+        assets_dir = Path(self.source_dir) / "assets"
+        iconset = assets_dir / "AppIcon.iconset"
+        existing_icns = assets_dir / icon_name
 
-export PYTHONUNBUFFERED=1
-export WORD_GLOBAL_REPLACE_SKIP_BROWSER=1
-export PYTHONPATH=\"$RESOURCE_DIR:${PYTHONPATH:-}\"
-export DYLD_FRAMEWORK_PATH=\"$RESOURCE_DIR:${DYLD_FRAMEWORK_PATH:-}\"
+        if destination.exists():
+            destination.unlink()
 
-cd \"$RESOURCE_DIR\"
+        if iconset.exists():
+            iconutil = shutil.which("iconutil")
+            if iconutil:
+                try:
+                    subprocess.run(
+                        [
+                            iconutil,
+                            "--convert",
+                            "icns",
+                            "--output",
+                            str(destination),
+                            str(iconset),
+                        ],
+                        check=True,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                    )
+                    logger.info("Converted iconset to AppIcon.icns")
+                    return
+                except subprocess.CalledProcessError as exc:
+                    logger.warning("iconutil failed to convert iconset: %s", exc)
 
-run_with_interpreter() {
-    local interpreter=\"$1\"
-    shift
-    if [ ! -x \"$interpreter\" ]; then
-        return 127
-    fi
+        if existing_icns.exists():
+            shutil.copy2(existing_icns, destination)
+            logger.info("Copied existing AppIcon.icns")
+            return
 
-    echo \"[$(timestamp)] Launching with interpreter: $interpreter\"
-    PYTHONEXECUTABLE=\"$interpreter\" \"$interpreter\" run.py \"$@\"
-}
+        fallback_png = assets_dir / "AppIcon-1024.png"
+        if fallback_png.exists():
+            shutil.copy2(fallback_png, destination)
+            logger.warning("Using PNG icon as fallback; consider generating AppIcon.icns")
+        else:
+            logger.warning("Application icon assets not found; Dock icon may be generic.")
 
-if run_with_interpreter \"$VENV_PY\" \"$@\"; then
-    exit 0
-fi
+    def _write_generated_file(self, path: str, content, executable: bool = False):
+        """Write a generated bundle file and keep its bytes so the archive need not re-read it"""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        _write_bundle_file(path, data, executable=executable)
+        mode = stat.S_IFREG | (0o755 if executable else 0o644)
+        self._generated_files[os.path.normpath(path)] = (data, mode, time.time())
 
-if run_with_interpreter \"$FALLBACK_PY\" \"$@\"; then
-    exit 0
-fi
+    def _create_info_plist(self, contents_dir):
+        """Create the macOS Info.plist metadata file"""
+        plist_path = os.path.join(contents_dir, "Info.plist")
+        self._write_generated_file(plist_path, self._plist_bytes)
+        logger.info("Created Info.plist")
+    
+    def _create_launcher_script(self, macos_dir, resources_dir, repo_url):
+        """Create the main launcher scripts for the bundle"""
+        run_launcher_content = _RUN_LAUNCHER_TEMPLATE.substitute(repo_url=repo_url or '')
 
-echo \"[$(timestamp)] Bundled interpreter failed; falling back to system python\" 1>&2
-unset DYLD_FRAMEWORK_PATH
-unset PYTHONEXECUTABLE
+        python_launcher_path = os.path.join(resources_dir, "run.py")
+        self._write_generated_file(python_launcher_path, run_launcher_content, executable=True)
+        logger.info("Created Python launcher script")
 
-exec /usr/bin/env python3 run.py \"$@\"
-"""
+        if self._create_swift_launcher(macos_dir, resources_dir, repo_url):
+            logger.info("Created native Swift launcher executable")
+            return
 
         mac_launcher_path = os.path.join(macos_dir, self.app_name)
-        with open(mac_launcher_path, 'w') as f:
-            f.write(mac_launcher_content)
-        os.chmod(mac_launcher_path, 0o755)
+        self._write_generated_file(mac_launcher_path, _MAC_LAUNCHER_BYTES, executable=True)
         logger.info("Created macOS launcher executable")
 
     def _create_swift_launcher(self, macos_dir: str, resources_dir: str, repo_url: Optional[str]) -> bool:
@@ -341,221 +1304,26 @@ exec /usr/bin/env python3 run.py \"$@\"
         swift_targets = self._determine_swift_targets()
         sdk_path = self._resolve_macos_sdk()
 
-        swift_source = textwrap.dedent(
-            f"""\
-            import Cocoa
-            import Darwin
-
-            @main
-            class AppDelegate: NSObject, NSApplicationDelegate {{
-                var task: Process?
-                var logHandle: FileHandle?
-                let defaultURL = "{DEFAULT_LOCAL_URL}"
-                let repoURL = "{repo_url or ''}"
-                var isShuttingDown = false
-
-                static func main() {{
-                    let app = NSApplication.shared
-                    let delegate = AppDelegate()
-                    app.delegate = delegate
-                    app.run()
-                }}
-
-                func applicationDidFinishLaunching(_ notification: Notification) {{
-                    NSApp.setActivationPolicy(.regular)
-                    setupMenus()
-                    setupLogging()
-                    launchServer()
-                    NSApp.activate(ignoringOtherApps: true)
-                    DispatchQueue.main.asyncAfter(deadline: .now() + 1.0) {{
-                        self.openWebApp(nil)
-                    }}
-                }}
-
-                func applicationWillTerminate(_ notification: Notification) {{
-                    isShuttingDown = true
-                    stopServer(forceKill: true)
-                    try? logHandle?.close()
-                    logHandle = nil
-                }}
-
-                func setupMenus() {{
-                    let mainMenu = NSMenu()
-                    let appMenuItem = NSMenuItem()
-                    mainMenu.addItem(appMenuItem)
-
-                    let appMenu = NSMenu(title: "WordGlobalReplace")
-                    let openItem = NSMenuItem(title: "Open Web App", action: #selector(openWebApp(_:)), keyEquivalent: "o")
-                    openItem.target = self
-                    appMenu.addItem(openItem)
-                    appMenu.addItem(NSMenuItem.separator())
-                    let quitItem = NSMenuItem(title: "Quit WordGlobalReplace", action: #selector(quitApp(_:)), keyEquivalent: "q")
-                    quitItem.target = self
-                    appMenu.addItem(quitItem)
-                    appMenuItem.submenu = appMenu
-
-                    NSApp.mainMenu = mainMenu
-                }}
-
-                func setupLogging() {{
-                    let fm = FileManager.default
-                    let logDir = fm.homeDirectoryForCurrentUser.appendingPathComponent("Library/Logs/WordGlobalReplace", isDirectory: true)
-                    try? fm.createDirectory(at: logDir, withIntermediateDirectories: true)
-                    let logURL = logDir.appendingPathComponent("launcher.log")
-                    if !fm.fileExists(atPath: logURL.path) {{
-                        fm.createFile(atPath: logURL.path, contents: nil, attributes: nil)
-                    }}
-                    logHandle = try? FileHandle(forWritingTo: logURL)
-                    logHandle?.seekToEndOfFile()
-                    log("Launcher started")
-                }}
-
-                func log(_ message: String) {{
-                    let formatter = ISO8601DateFormatter()
-                    let timestamp = formatter.string(from: Date())
-                    let line = "[\\(timestamp)] \\(message)\\n"
-                    if let data = line.data(using: .utf8) {{
-                        logHandle?.write(data)
-                    }}
-                    fputs(line, stderr)
-                }}
-
-                func launchServer() {{
-                    guard let resourcePath = Bundle.main.resourcePath else {{
-                        log("Missing resources path")
-                        showCriticalAlert(title: "Launcher Error", message: "Unable to locate application resources.")
-                        NSApp.terminate(nil)
-                        return
-                    }}
-
-                    let pythonPath = (resourcePath as NSString).appendingPathComponent("venv/bin/python3")
-                    let runScriptPath = (resourcePath as NSString).appendingPathComponent("run.py")
-                    if !FileManager.default.isExecutableFile(atPath: pythonPath) {{
-                        log("Bundled interpreter not found at \\(pythonPath)")
-                        showCriticalAlert(title: "Launcher Error", message: "Bundled Python interpreter is missing.")
-                        NSApp.terminate(nil)
-                        return
-                    }}
-
-                    let process = Process()
-                    process.executableURL = URL(fileURLWithPath: pythonPath)
-                    process.arguments = [runScriptPath]
-                    process.currentDirectoryURL = URL(fileURLWithPath: resourcePath)
-
-                    var environment = ProcessInfo.processInfo.environment
-                    environment["PYTHONUNBUFFERED"] = "1"
-                    environment["WORD_GLOBAL_REPLACE_SKIP_BROWSER"] = "1"
-                    environment["WORD_GLOBAL_REPLACE_PARENT_PID"] = String(ProcessInfo.processInfo.processIdentifier)
-                    if !repoURL.isEmpty {{
-                        environment["WORD_GLOBAL_REPLACE_REPO_URL"] = repoURL
-                    }}
-                    process.environment = environment
-
-                    if let handle = logHandle {{
-                        process.standardOutput = handle
-                        process.standardError = handle
-                    }}
-
-                    do {{
-                        try process.run()
-                        log("Launched Python backend (pid: \\(process.processIdentifier))")
-                        task = process
-                        process.terminationHandler = {{ [weak self] proc in
-                            DispatchQueue.main.async {{
-                                self?.handleTermination(status: proc.terminationStatus)
-                            }}
-                        }}
-                    }} catch {{
-                        log("Failed to launch backend: \\(error.localizedDescription)")
-                        showCriticalAlert(title: "Unable to start application", message: error.localizedDescription)
-                        NSApp.terminate(nil)
-                    }}
-                }}
-
-                func stopServer(forceKill: Bool) {{
-                    guard let process = task else {{
-                        task = nil
-                        return
-                    }}
-
-                    if !process.isRunning {{
-                        task = nil
-                        return
-                    }}
-
-                    log("Stopping backend (forceKill: \\(forceKill))")
-                    process.terminate()
-                    if !waitForExit(process, timeout: 2.0) || forceKill {{
-                        if process.isRunning {{
-                            log("Backend still running; sending SIGKILL")
-                            kill(process.processIdentifier, SIGKILL)
-                            _ = waitForExit(process, timeout: 1.0)
-                        }}
-                    }}
-                    task = nil
-                }}
-
-                func waitForExit(_ process: Process, timeout: TimeInterval) -> Bool {{
-                    let deadline = Date().addingTimeInterval(timeout)
-                    while process.isRunning && Date() < deadline {{
-                        Thread.sleep(forTimeInterval: 0.1)
-                    }}
-                    return !process.isRunning
-                }}
-
-                func handleTermination(status: Int32) {{
-                    task = nil
-                    if isShuttingDown {{
-                        log("Backend exited with status \\(status) during shutdown")
-                        return
-                    }}
-                    log("Backend exited unexpectedly with status \\(status)")
-                    let alert = NSAlert()
-                    alert.alertStyle = .warning
-                    alert.messageText = "WordGlobalReplace backend stopped"
-                    alert.informativeText = "The embedded server exited with status code \\(status)."
-                    alert.addButton(withTitle: "Quit")
-                    alert.runModal()
-                    NSApp.terminate(nil)
-                }}
-
-                func showCriticalAlert(title: String, message: String) {{
-                    let alert = NSAlert()
-                    alert.alertStyle = .critical
-                    alert.messageText = title
-                    alert.informativeText = message
-                    alert.addButton(withTitle: "Quit")
-                    alert.runModal()
-                }}
-
-                @objc func openWebApp(_ sender: Any?) {{
-                    guard let url = URL(string: defaultURL) else {{
-                        log("Invalid URL: \\(defaultURL)")
-                        return
-                    }}
-                    NSWorkspace.shared.open(url)
-                }}
-
-                @objc func quitApp(_ sender: Any?) {{
-                    isShuttingDown = true
-                    stopServer(forceKill: true)
-                    NSApp.terminate(nil)
-                }}
-            }}
-            """
-        )
+        swift_source = _SWIFT_LAUNCHER_TEMPLATE.substitute(default_url=DEFAULT_LOCAL_URL, repo_url=repo_url or '')
 
         launcher_path = Path(macos_dir) / self.app_name
         env = os.environ.copy()
         env.setdefault("MACOSX_DEPLOYMENT_TARGET", MIN_MACOS_VERSION)
 
-        with tempfile.NamedTemporaryFile('w', suffix='.swift', delete=False) as temp_file:
-            temp_file.write(swift_source)
-            temp_path = Path(temp_file.name)
+        fd, temp_name = tempfile.mkstemp(suffix='.swift')
+        try:
+            _write_fd(fd, swift_source.encode('utf-8'))
+        finally:
+            os.close(fd)
+        temp_path = Path(temp_name)
 
         build_outputs = []
         try:
-            with tempfile.TemporaryDirectory(prefix="swift-module-cache-") as module_cache_dir:
+            # Prebuilt Cocoa/Darwin modules are reused from the user's cache on later builds;
+            # a throwaway directory is only used when that cache cannot be created
+            cached_modules = _user_cache_dir("SwiftModuleCache")
+            with (contextlib.nullcontext(str(cached_modules)) if cached_modules
+                  else tempfile.TemporaryDirectory(prefix="swift-module-cache-")) as module_cache_dir:
                 module_cache_path = Path(module_cache_dir)
                 env["SWIFT_MODULE_CACHE_PATH"] = str(module_cache_path)
 
@@ -675,20 +1443,8 @@ exec /usr/bin/env python3 run.py \"$@\"
     
     def _create_requirements_file(self, resources_dir):
         """Create a requirements file for the distribution"""
-        requirements_content = '''# WordGlobalReplace - Python Dependencies
-# Core web framework
-Flask==2.3.3
-
-# Word document processing
-python-docx==0.8.11
-
-# Additional utilities
-pathlib2==2.3.7; python_version < "3.4"
-'''
-        
         req_path = os.path.join(resources_dir, "requirements.txt")
-        with open(req_path, 'w') as f:
-            f.write(requirements_content)
+        self._write_generated_file(req_path, self._requirements_bytes)
         logger.info("Created requirements file")
 
     def _ensure_python_context(self):
@@ -699,8 +1455,12 @@ pathlib2==2.3.7; python_version < "3.4"
     def _prepare_python_context(self) -> dict:
         """Select a Python interpreter (prefer universal) and gather metadata."""
         best_target = None
-        for candidate in self._iter_python_candidates():
-            details = self._inspect_python(candidate)
+        # Each inspection starts the interpreter and runs `file` on it; do them all at once.
+        # map keeps preference order, so ties still go to the earlier candidate.
+        candidates = list(self._iter_python_candidates())
+        with ThreadPoolExecutor(max_workers=max(1, len(candidates))) as executor:
+            inspected = list(executor.map(self._inspect_python, candidates))
+        for details in inspected:
             if not details:
                 continue
 
@@ -827,6 +1587,14 @@ pathlib2==2.3.7; python_version < "3.4"
 
     def _mach_architectures(self, path: Path) -> set:
         """Return the set of CPU architectures supported by a Mach-O binary."""
+        try:
+            archs = _macho_architectures(path)
+        except OSError:
+            archs = None
+        if archs is not None:
+            return archs
+
+        # Not Mach-O (or unreadable): let file(1) describe it
         try:
             output = subprocess.check_output(["file", str(path)], text=True).lower()
         except (subprocess.CalledProcessError, FileNotFoundError):
@@ -840,6 +1608,13 @@ pathlib2==2.3.7; python_version < "3.4"
         return archs
 
     def _resolve_framework_info(self, resources_dir: str, python_info: dict) -> Optional[dict]:
+        """Locate the bundled framework; looked up once per bundle, after it has been copied in"""
+        key = (os.path.normpath(resources_dir), python_info.get('framework_name'), python_info.get('version_str'))
+        if key not in self._framework_info_cache:
+            self._framework_info_cache[key] = self._find_framework_info(resources_dir, python_info)
+        return self._framework_info_cache[key]
+
+    def _find_framework_info(self, resources_dir: str, python_info: dict) -> Optional[dict]:
         configured_name = python_info.get('framework_name')
         candidate_names = [name for name in [configured_name, "Python", "Python3"] if name]
 
@@ -893,11 +1668,25 @@ pathlib2==2.3.7; python_version < "3.4"
     def _create_virtual_environment(self, resources_dir):
         """Create a self-contained virtual environment with dependencies"""
         venv_path = Path(resources_dir) / 'venv'
+        python_info = self._ensure_python_context()
+
+        build_key = self._venv_build_key(python_info)
+        key_path = os.path.join(self.output_dir, VENV_BUILD_KEY_FILE)
+        try:
+            with open(key_path, encoding='utf-8') as f:
+                previous_key = f.read()
+        except FileNotFoundError:
+            previous_key = None
+        if previous_key == build_key and (venv_path / 'bin').is_dir():
+            logger.info("Bundled virtual environment is up to date; reusing it")
+            return
+        # Forget the old key first, so a build that fails part way is never reused
+        if previous_key is not None:
+            os.unlink(key_path)
         if venv_path.exists():
             shutil.rmtree(venv_path)
 
         logger.info("Creating bundled virtual environment")
-        python_info = self._ensure_python_context()
         python_executable = python_info['executable']
         architectures = python_info.get('architectures', [])
         if architectures:
@@ -911,57 +1700,86 @@ pathlib2==2.3.7; python_version < "3.4"
         created_with_copies = True
         try:
             try:
-                subprocess.run(
-                    [python_executable, '-m', 'venv', '--copies', str(venv_path)],
-                    check=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-            except subprocess.CalledProcessError as exc:
-                err_output = exc.stderr
+                self._run_venv(python_executable, venv_path, copies=True)
+            except (subprocess.CalledProcessError, OSError) as exc:
+                err_output = getattr(exc, 'stderr', None)
                 logger.warning(
                     "Creating venv with --copies failed; attempting standard venv. Details: %s",
                     err_output.strip() if err_output else exc
                 )
-                subprocess.run(
-                    [python_executable, '-m', 'venv', str(venv_path)],
-                    check=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+                shutil.rmtree(venv_path, ignore_errors=True)
+                self._run_venv(python_executable, venv_path, copies=False)
                 created_with_copies = False
-        except subprocess.CalledProcessError as exc:
+        except (subprocess.CalledProcessError, OSError) as exc:
             raise RuntimeError(f"Failed to create virtual environment: {exc}") from exc
 
         if os.name == 'nt':
             scripts_dir = venv_path / 'Scripts'
-            python_bin = scripts_dir / 'python.exe'
             pip_bin = scripts_dir / 'pip.exe'
         else:
             scripts_dir = venv_path / 'bin'
-            python_bin = scripts_dir / 'python'
             pip_bin = scripts_dir / 'pip'
 
+        # Install offline from the local wheelhouse; only when it lacks something is it
+        # refilled from the index, so repeat builds skip resolving against PyPI entirely
+        requirements_path = str(Path(resources_dir) / 'requirements.txt')
+        wheelhouse = os.path.join(self.source_dir, WHEELHOUSE_DIR)
+        offline_install = [str(pip_bin), 'install', '--no-index', '--find-links', wheelhouse, '-r', requirements_path]
         try:
-            subprocess.run([str(python_bin), '-m', 'pip', 'install', '--upgrade', 'pip'], check=True)
-            subprocess.run(
-                [str(pip_bin), 'install', '--no-cache-dir', '-r', str(Path(resources_dir) / 'requirements.txt')],
-                check=True
-            )
+            # With no wheelhouse yet the offline attempt cannot succeed, so skip that pip start
+            have_wheels = os.path.isdir(wheelhouse) and bool(os.listdir(wheelhouse))
+            if not have_wheels or subprocess.run(offline_install, stdout=subprocess.PIPE,
+                                                 stderr=subprocess.PIPE, text=True).returncode != 0:
+                logger.info("Filling wheelhouse %s", wheelhouse)
+                subprocess.run([str(pip_bin), 'wheel', '--wheel-dir', wheelhouse, '-r', requirements_path], check=True)
+                subprocess.run(offline_install, check=True)
         except subprocess.CalledProcessError as exc:
             raise RuntimeError(f"Failed to install dependencies into bundled environment: {exc}")
 
+        # --copies already produced real interpreter files; only a symlink-based venv needs them copied
         if not created_with_copies:
             logger.info("Ensuring interpreter binaries are copied after symlink-based venv creation")
-        self._solidify_python_binaries(venv_path)
+            self._solidify_python_binaries(venv_path)
 
         self._bundle_python_runtime(venv_path, resources_dir, python_info)
         self._relink_python_binaries(venv_path, resources_dir, python_info)
         self._normalize_deployment_targets(venv_path, resources_dir, python_info)
+        _write_bundle_file(key_path, build_key)
         logger.info("Bundled virtual environment ready")
 
+    def _venv_build_key(self, python_info: dict) -> str:
+        """Hash of everything the bundled venv and Python framework are built from"""
+        executable = python_info.get('real_executable') or python_info['executable']
+        try:
+            st = os.stat(executable)
+            interpreter_stat = [st.st_size, st.st_mtime_ns]
+        except OSError:
+            interpreter_stat = None
+        inputs = {
+            'requirements': self._requirements_bytes.decode('utf-8'),
+            'interpreter': {key: python_info.get(key) for key in (
+                'executable', 'real_executable', 'version', 'framework_name',
+                'framework_prefix', 'base_prefix', 'deployment_target')},
+            # An upgraded interpreter in the same location changes size or mtime
+            'interpreter_stat': interpreter_stat,
+            'architectures': sorted(python_info.get('architectures', ())),
+            'pruned_stdlib': list(FRAMEWORK_PRUNED_STDLIB),
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _run_venv(self, python_executable: str, venv_path: Path, copies: bool):
+        """`python -m venv [--copies]`, run in this process when it is the selected interpreter"""
+        try:
+            in_process = os.path.samefile(python_executable, sys.executable)
+        except OSError:
+            in_process = False
+        if in_process:
+            # Saves starting another interpreter; pip is still installed for the app's updater
+            venv.EnvBuilder(symlinks=not copies, with_pip=True).create(str(venv_path))
+            return
+        command = [python_executable, '-m', 'venv'] + (['--copies'] if copies else []) + [str(venv_path)]
+        subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
     def _bundle_python_runtime(self, venv_path: Path, resources_dir: str, python_info: dict):
         """Copy the Python framework into the bundle so the app runs without a system Python"""
         if sys.platform != "darwin":
@@ -1014,26 +1832,37 @@ pathlib2==2.3.7; python_version < "3.4"
             shutil.rmtree(destination)
 
         logger.info(f"Copying Python framework to bundle: {source_framework} -> {destination}")
-        shutil.copytree(source_framework, destination, symlinks=True)
+        _copytree_keep_links(source_framework, destination)
 
         # Ensure site-packages directory exists so relative symlinks remain valid even if source omitted it
         version_dir = destination / "Versions" / python_info.get('version_str', f"{sys.version_info.major}.{sys.version_info.minor}")
-        site_packages = version_dir / "lib" / f"python{python_info.get('version_str', f'{sys.version_info.major}.{sys.version_info.minor}')}" / "site-packages"
+        stdlib_dir = version_dir / "lib" / f"python{python_info.get('version_str', f'{sys.version_info.major}.{sys.version_info.minor}')}"
+        site_packages = stdlib_dir / "site-packages"
         site_packages.mkdir(parents=True, exist_ok=True)
 
+        # Drop stdlib parts the app never imports before they are signed and archived
+        for name in FRAMEWORK_PRUNED_STDLIB:
+            pruned = stdlib_dir / name
+            if pruned.is_dir() and not pruned.is_symlink():
+                shutil.rmtree(pruned)
+
     def _solidify_python_binaries(self, venv_path: Path):
         """Replace symlinked python binaries with physical copies for relocation safety"""
         if os.name == 'nt':
             return  # Windows virtualenv already copies executables
 
         bin_dir = venv_path / 'bin'
-        if not bin_dir.exists():
+        try:
+            with os.scandir(bin_dir) as entries:
+                # DirEntry.is_symlink comes from the directory listing, with no extra lstat
+                symlinked = [entry.name for entry in entries
+                             if entry.name in ('python', 'python3') and entry.is_symlink()]
+        except FileNotFoundError:
             return
 
-        binaries = ['python', 'python3']
-        for name in binaries:
+        for name in symlinked:
             bin_path = bin_dir / name
-            if not bin_path.exists() or not bin_path.is_symlink():
+            if not bin_path.exists():
                 continue
 
             target = bin_path.resolve()
@@ -1211,112 +2040,24 @@ pathlib2==2.3.7; python_version < "3.4"
     
     def _create_distribution_readme(self, resources_dir, repo_url):
         """Create README for the distribution"""
-        readme_content = f'''# WordGlobalReplace
-
-A lightweight application for finding and replacing text across multiple Word documents.
-
-## Features
-
-- Web-based interface for easy use
-- Support for multiple Word document formats (.doc, .docx)
-- Advanced search with context preview
-- Batch replacement capabilities
-- Auto-updating from GitHub (if repository URL is configured)
-- Backup creation before replacements
-
-## Installation
-
-1. Extract the archive and copy `WordGlobalReplace.app` to your Applications folder (or preferred location)
-2. Double-click the app to launch it
-3. Optionally run `./install.sh` for quick usage instructions
-
-## Usage
-
-1. Launch the application by opening `WordGlobalReplace.app`
-2. Open your browser to: {DEFAULT_LOCAL_URL}
-3. Select a directory containing Word documents
-4. Enter search and replacement text
-5. Review matches and apply replacements
-
-## Auto-Updates
-
-{f"Auto-updates are configured from: {repo_url}" if repo_url else "Auto-updates are not configured. To enable, run with --repo-url parameter."}
-
-The application will automatically check for updates when launched and update itself if new versions are available.
-
-## Requirements
-
-- macOS (tested on macOS 10.14+)
-- Internet connection (for auto-updates)
-
-## Troubleshooting
-
-If you encounter issues:
-
-1. Verify the app bundle has write permissions (needed for backups/updates)
-2. Check the console output for error messages (`open -a Terminal WordGlobalReplace.app`)
-3. Ensure you have an active internet connection for auto-updates
-
-## Support
-
-For issues and support, please check the GitHub repository or contact the developer.
-'''
+        auto_update_note = (f"Auto-updates are configured from: {repo_url}" if repo_url
+                            else "Auto-updates are not configured. To enable, run with --repo-url parameter.")
+        readme_content = _README_TEMPLATE.substitute(self._format_ctx, auto_update_note=auto_update_note)
         
         readme_path = os.path.join(resources_dir, "README.md")
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
+        self._write_generated_file(readme_path, readme_content)
         logger.info("Created distribution README")
     
     def _create_installer_script(self, resources_dir):
         """Create an installer script for easy setup"""
-        installer_content = f'''#!/bin/bash
-# WordGlobalReplace Quick Launch Script
-
-echo "WordGlobalReplace"
-echo "=================="
-
-cd "$(dirname "$0")"
-
-echo "All dependencies are bundled with the application."
-echo ""
-echo "To launch the app now, run:"
-echo "  open ../.."
-echo ""
-echo "When running, open your browser to: {DEFAULT_LOCAL_URL}"
-echo ""
-echo "Tip: You can place WordGlobalReplace.app in /Applications for easy access."
-'''
-        
         installer_path = os.path.join(resources_dir, "install.sh")
-        with open(installer_path, 'w') as f:
-            f.write(installer_content)
-        
-        # Make it executable
-        os.chmod(installer_path, 0o755)
+        self._write_generated_file(installer_path, _INSTALLER_BYTES, executable=True)
         logger.info("Created installer script")
     
     def _create_cli_launcher_script(self, resources_dir: str):
         """Create a CLI helper script that runs the bundled Python interpreter directly."""
-        script_content = """#!/bin/bash
-# WordGlobalReplace CLI launcher
-
-set -e
-
-RESOURCE_DIR=\"$(cd \"$(dirname \"$0\")\" && pwd)\"
-PYTHON_BIN=\"$RESOURCE_DIR/venv/bin/python3\"
-RUN_SCRIPT=\"$RESOURCE_DIR/run.py\"
-
-if [ ! -x \"$PYTHON_BIN\" ]; then
-    echo \"Bundled Python interpreter not found; falling back to system python\" >&2
-    exec /usr/bin/env python3 \"$RUN_SCRIPT\" \"$@\"
-fi
-
-exec \"$PYTHON_BIN\" \"$RUN_SCRIPT\" \"$@\"
-"""
-
         script_path = Path(resources_dir) / "run_cli.sh"
-        script_path.write_text(script_content, encoding="utf-8")
-        script_path.chmod(0o755)
+        self._write_generated_file(str(script_path), _CLI_LAUNCHER_BYTES, executable=True)
         logger.info("Created CLI launcher script")
     
     def _create_zip_package(self, app_dir):
@@ -1325,15 +2066,34 @@ exec \"$PYTHON_BIN\" \"$RUN_SCRIPT\" \"$@\"
         
         app_basename = os.path.basename(app_dir.rstrip(os.sep))
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(app_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arc_path = os.path.join(app_basename, os.path.relpath(file_path, app_dir))
-                    zipf.write(file_path, arc_path)
+        prefix_len = len(os.path.join(app_dir, ''))
+        entries = (
+            (file_path, os.path.join(app_basename, file_path[prefix_len:]))
+            for file_path in iter_files(app_dir)
+        )
+        if self.zip_compresslevel == 0:
+            compression, compresslevel = zipfile.ZIP_STORED, None
+        else:
+            compression, compresslevel = zipfile.ZIP_DEFLATED, self.zip_compresslevel
+        with open(zip_path, 'wb', buffering=ZIP_WRITE_BUFFER) as raw, \
+                zipfile.ZipFile(raw, 'w', compression, compresslevel=compresslevel) as zipf:
+            write_zip_entries(zipf, entries, preloaded=self._generated_files,
+                              stored_extensions=self.zip_stored_extensions)
         
         logger.info(f"Created zip package: {zip_path}")
 
+    def _create_tar_zst_package(self, app_dir):
+        """Create a zstd-compressed tarball, using libzstd's own worker threads"""
+        archive_path = os.path.join(self.output_dir, f"{self.app_name}.tar.zst")
+        app_basename = os.path.basename(app_dir.rstrip(os.sep))
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+
+        with open(archive_path, 'wb') as raw, compressor.stream_writer(raw) as zst, \
+                tarfile.open(fileobj=zst, mode='w|') as tar:
+            tar.add(app_dir, arcname=app_basename)
+
+        logger.info(f"Created tar.zst package: {archive_path}")
+
     def _codesign_app(self, app_dir: str):
         """Apply ad-hoc signatures so bundled binaries run on other Macs."""
         if sys.platform != "darwin":
@@ -1346,10 +2106,6 @@ exec \"$PYTHON_BIN\" \"$RUN_SCRIPT\" \"$@\"
 
             self._remove_existing_signatures(Path(app_dir))
 
-            if framework_info:
-                self._codesign_path(framework_info['binary_path'])
-                self._codesign_path(framework_info['version_dir'], deep=True)
-
             venv_bin = Path(resources_dir) / "venv" / "bin"
             binaries = [
                 "python",
@@ -1357,10 +2113,25 @@ exec \"$PYTHON_BIN\" \"$RUN_SCRIPT\" \"$@\"
                 f"python{python_info.get('major', sys.version_info.major)}",
                 f"python{python_info.get('major', sys.version_info.major)}.{python_info.get('minor', sys.version_info.minor)}",
             ]
-            for name in binaries:
-                candidate = venv_bin / name
-                if candidate.exists():
-                    self._codesign_path(candidate)
+            # The framework and each interpreter copy are separate signing targets, so their
+            # codesign runs overlap; the enclosing .app is sealed last, once they are all done
+            with ThreadPoolExecutor(max_workers=len(binaries) + 1) as executor:
+                jobs = []
+                if framework_info:
+                    jobs.append(executor.submit(self._codesign_framework, framework_info))
+                signed = set()
+                for name in binaries:
+                    candidate = venv_bin / name
+                    if not candidate.exists():
+                        continue
+                    # pythonX.Y is often a link to python3; sign each real file once
+                    real_path = os.path.realpath(candidate)
+                    if real_path in signed:
+                        continue
+                    signed.add(real_path)
+                    jobs.append(executor.submit(self._codesign_path, candidate))
+                for job in jobs:
+                    job.result()
 
             self._codesign_path(Path(app_dir), deep=True)
             logger.info("Applied ad-hoc code signatures to bundled binaries")
@@ -1372,12 +2143,26 @@ exec \"$PYTHON_BIN\" \"$RUN_SCRIPT\" \"$@\"
                 exc.stderr.strip() if exc.stderr else exc,
             )
 
+    def _codesign_framework(self, framework_info: dict):
+        """Sign the framework binary, then its version directory around it"""
+        self._codesign_path(framework_info['binary_path'])
+        self._codesign_path(framework_info['version_dir'], deep=True)
+
     def _remove_existing_signatures(self, root: Path):
-        for signature_dir in root.glob("**/_CodeSignature"):
-            try:
-                shutil.rmtree(signature_dir)
-            except Exception as exc:
-                logger.debug("Failed to remove old signature directory %s: %s", signature_dir, exc)
+        # One scandir pass over the bundle, matching _CodeSignature by name from the listing
+        pending = [str(root)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name != "_CodeSignature":
+                        pending.append(entry.path)
+                        continue
+                    try:
+                        shutil.rmtree(entry.path)
+                    except Exception as exc:
+                        logger.debug("Failed to remove old signature directory %s: %s", entry.path, exc)
 
     def _codesign_path(self, target: Path, deep: bool = False):
         args = ["codesign", "--force"]
@@ -1408,17 +2193,29 @@ def main():
     parser.add_argument('--repo-url', help='GitHub repository URL for auto-updates')
     parser.add_argument('--output-dir', default='dist', help='Output directory for distribution')
     parser.add_argument('--python', dest='python_path', help='Python interpreter to use for building the bundle')
+    parser.add_argument('--fast', action='store_true', help='Compress the zip at level 1, storing compiled binaries, for quicker development builds')
+    parser.add_argument('--compress-level', type=int, choices=range(10), metavar='{0-9}',
+                        help='Zip DEFLATE level, overriding --fast; 0 stores everything uncompressed')
+    parser.add_argument('--format', dest='archive_format', choices=ARCHIVE_FORMATS, default='zip',
+                        help='Archive to produce; tar.zst requires the zstandard package')
+    parser.add_argument('--no-archive', action='store_true', help='Only build WordGlobalReplace.app, without an archive')
     
     args = parser.parse_args()
     
-    creator = DistributionCreator(output_dir=args.output_dir, python_executable=args.python_path)
+    creator = DistributionCreator(output_dir=args.output_dir, python_executable=args.python_path, fast=args.fast,
+                                  archive_format=None if args.no_archive else args.archive_format,
+                                  compresslevel=args.compress_level)
     success = creator.create_distribution(repo_url=args.repo_url)
     
     if success:
         print(f"\\nDistribution created successfully!")
         print(f"Output directory: {args.output_dir}")
         print(f"\\nTo distribute:")
-        print(f"1. Share the {args.output_dir}/WordGlobalReplace.zip file")
+        if creator.archive_format is None:
+            print(f"1. Archive and share {args.output_dir}/WordGlobalReplace.app")
+        else:
+            archive_name = "WordGlobalReplace.tar.zst" if creator.archive_format == 'tar.zst' and zstandard else "WordGlobalReplace.zip"
+            print(f"1. Share the {args.output_dir}/{archive_name} file")
         print("2. Recipients should extract and copy WordGlobalReplace.app to their Applications folder (or another preferred location)")
         print("3. Optional: run ./WordGlobalReplace.app/Contents/Resources/install.sh for quick launch instructions")
         print("4. Launch the app by double-clicking WordGlobalReplace.app or running: open WordGlobalReplace.app")
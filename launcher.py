@@ -54,7 +54,7 @@ class WordGlobalReplaceLauncher:
                 
                 if auto_update:
                     logger.info("Auto-updating application...")
-                    if self.auto_updater.update_application():
+                    if self.auto_updater.update_application(latest):
                         logger.info("Update completed successfully!")
                         # Install/update dependencies
                         self.auto_updater.install_dependencies()
@@ -214,7 +214,7 @@ def main():
                 print(f"Update available: {current} -> {latest}")
                 response = input("Do you want to update? (y/n): ")
                 if response.lower() == 'y':
-                    if launcher.auto_updater.update_application():
+                    if launcher.auto_updater.update_application(latest):
                         print("Update completed successfully!")
                         launcher.auto_updater.install_dependencies()
                     else:
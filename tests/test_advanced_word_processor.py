@@ -73,7 +73,8 @@ class TestAdvancedWordProcessor(unittest.TestCase):
             for occurrence in results['occurrences']:
                 self.assertIn('file_path', occurrence)
                 self.assertIn('match_text', occurrence)
-                self.assertIn('context', occurrence)
+                self.assertIn('context_before', occurrence)
+                self.assertIn('context_after', occurrence)
                 self.assertIn('start_pos', occurrence)
                 self.assertIn('end_pos', occurrence)
     
@@ -90,6 +91,20 @@ class TestAdvancedWordProcessor(unittest.TestCase):
         if results['success']:
             self.assertGreater(results['files_processed'], 0)
     
+    def test_scan_directory_advanced_parallel_matches_serial(self):
+        """Process-pool scanning returns the same occurrences as a serial scan"""
+        serial = AdvancedWordProcessor(max_workers=1).scan_directory_advanced(self.temp_dir, 'test', 50)
+        parallel = AdvancedWordProcessor(max_workers=2, parallel_threshold=1).scan_directory_advanced(
+            self.temp_dir, 'test', 50
+        )
+
+        self.assertTrue(parallel['success'])
+        self.assertEqual(parallel['total_occurrences'], serial['total_occurrences'])
+        self.assertEqual(
+            [(occ['file_path'], occ['start_pos']) for occ in parallel['occurrences']],
+            [(occ['file_path'], occ['start_pos']) for occ in serial['occurrences']]
+        )
+    
     def test_replace_text_advanced(self):
         """Test advanced text replacement"""
         if not hasattr(self, 'test_doc_path'):
@@ -106,6 +121,25 @@ class TestAdvancedWordProcessor(unittest.TestCase):
         self.assertIn('success', result)
         self.assertIn('replacements_made', result)
     
+    def test_replace_many_applies_pairs_in_document_order(self):
+        """Test batched replacement of several occurrences in one save"""
+        if not hasattr(self, 'test_doc_path'):
+            self.skipTest("Test document not created")
+
+        result = self.processor.replace_many(
+            self.test_doc_path, [('test', 'alpha'), ('test', 'beta'), ('missing', 'gamma')]
+        )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['replacements_made'], 2)
+        self.assertEqual(result['applied'], [True, True, False])
+
+        from docx import Document
+        texts = [p.text for p in Document(self.test_doc_path).paragraphs]
+        self.assertEqual(texts[1], 'This is alpha document 1 with sample text.')
+        self.assertEqual(texts[2], 'It contains the word "beta" multiple times.')
+        self.assertEqual(texts[3], 'Another paragraph with test content.')
+    
     def test_replace_text_advanced_with_occurrence_id(self):
         """Test advanced text replacement with occurrence ID"""
         if not hasattr(self, 'test_doc_path'):
@@ -139,9 +173,13 @@ class TestAdvancedWordProcessor(unittest.TestCase):
         
         if results['success'] and results['occurrences']:
             occurrence = results['occurrences'][0]
-            self.assertIn('context', occurrence)
-            self.assertIsInstance(occurrence['context'], str)
-            self.assertGreater(len(occurrence['context']), 0)
+            context = self.processor.get_context(
+                self.test_doc_path, occurrence['start_pos'], occurrence['end_pos'], 20
+            )
+            self.assertEqual(context['match_text'], occurrence['match_text'])
+            self.assertEqual(context['context_before'], occurrence['context_before'])
+            self.assertEqual(context['context_after'], occurrence['context_after'])
+            self.assertGreater(len(context['full_context']), len(occurrence['match_text']))
 
     def test_case_sensitive_search(self):
         """Ensure case sensitivity flag alters search results"""
@@ -169,5 +207,200 @@ class TestAdvancedWordProcessor(unittest.TestCase):
                 "Insensitive search should capture lowercase variants"
             )
 
+    def test_extraction_cache_reused_until_file_changes(self):
+        """Repeated extraction hits the cache; a replacement invalidates it"""
+        if not hasattr(self, 'test_doc_path'):
+            self.skipTest("Test document not created")
+
+        first = self.processor.extract_text_with_structure(self.test_doc_path)
+        second = self.processor.extract_text_with_structure(self.test_doc_path)
+        self.assertIs(first, second)
+
+        result = self.processor.replace_text_advanced(self.test_doc_path, 'sample', 'example')
+        self.assertTrue(result['success'])
+
+        third = self.processor.extract_text_with_structure(self.test_doc_path)
+        self.assertIsNot(first, third)
+        self.assertIn('example', third['full_text'])
+
+    def test_location_detection_for_tables_and_paragraphs(self):
+        """Matches resolve to the paragraph or table that contains them"""
+        from docx import Document
+
+        doc = Document()
+        doc.add_paragraph('First paragraph mentions needle.')
+        doc.add_paragraph('Second paragraph mentions needle too.')
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = 'plain cell'
+        table.cell(0, 1).text = 'needle in a cell'
+        doc_path = os.path.join(self.temp_dir, 'locations.docx')
+        doc.save(doc_path)
+
+        occurrences = self.processor.find_occurrences_with_context(doc_path, 'needle', 10)
+        locations = [(occ['location_type'], occ['location_index']) for occ in occurrences]
+        self.assertEqual(locations, [('paragraph', 0), ('paragraph', 1), ('table', 0)])
+
+    def test_block_scan_context_matches_full_text(self):
+        """Per-block scanning reports the same offsets and context as full_text slicing"""
+        if not hasattr(self, 'test_doc_path'):
+            self.skipTest("Test document not created")
+
+        occurrences = self.processor.find_occurrences_with_context(self.test_doc_path, 'test', 30)
+        full_text = self.processor.extract_text_with_structure(self.test_doc_path)['full_text']
+
+        self.assertGreater(len(occurrences), 0)
+        for occ in occurrences:
+            start, end = occ['start_pos'], occ['end_pos']
+            self.assertEqual(full_text[start:end], occ['match_text'])
+            self.assertEqual(full_text[max(0, start - 30):start], occ['context_before'])
+            self.assertEqual(full_text[end:end + 30], occ['context_after'])
+
+    def test_replace_preserves_run_formatting(self):
+        """Replacements edit runs in place instead of flattening the paragraph"""
+        from docx import Document
+
+        doc = Document()
+        paragraph = doc.add_paragraph()
+        paragraph.add_run('Keep ').bold = True
+        paragraph.add_run('old')
+        paragraph.add_run('er text').italic = True
+        doc_path = os.path.join(self.temp_dir, 'runs.docx')
+        doc.save(doc_path)
+
+        self.assertTrue(self.processor.replace_text_advanced(doc_path, 'Keep', 'Retain')['success'])
+        self.assertTrue(self.processor.replace_text_advanced(doc_path, 'older', 'newer')['success'])
+
+        runs = Document(doc_path).paragraphs[0].runs
+        self.assertEqual([run.text for run in runs], ['Retain ', 'newer', ' text'])
+        self.assertTrue(runs[0].bold)
+        self.assertTrue(runs[2].italic)
+
+    def test_block_contains_across_window_boundaries(self):
+        """Windowed prefiltering finds terms straddling a window edge"""
+        text = 'x' * 14 + 'NeedLE' + 'y' * 20
+        for window in (4, 8, 16, 1000):
+            self.assertTrue(AdvancedWordProcessor._block_contains(text, 'needle', False, window=window))
+            self.assertFalse(AdvancedWordProcessor._block_contains(text, 'needles', False, window=window))
+        self.assertFalse(AdvancedWordProcessor._block_contains(text, 'needle', True, window=4))
+
+    def test_prefilter_never_hides_ignorecase_matches(self):
+        """The literal prefilter admits every block re.IGNORECASE would match"""
+        import re
+        for term, text in (('İ', 'i'), ('in', 'İn'), ('list', 'LıST')):
+            self.assertTrue(re.search(re.escape(term), text, re.IGNORECASE))
+            needle = AdvancedWordProcessor._prefilter_needle(term, False)
+            self.assertTrue(needle is None or AdvancedWordProcessor._block_contains(text, needle, False))
+
+    def test_list_word_files_cached_until_directory_changes(self):
+        """Directory listings are reused until the directory is modified"""
+        nested = os.path.join(self.temp_dir, 'nested')
+        os.makedirs(nested)
+        shutil.copy2(self.test_doc_path, os.path.join(nested, 'copy.DOCX'))
+        Path(self.temp_dir, 'notes.txt').write_text('not a word file')
+
+        files = self.processor.list_word_files(self.temp_dir)
+        self.assertEqual(len(files), 4)
+        self.assertIn(os.path.join(nested, 'copy.DOCX'), files)
+
+        # A change below the top level is only picked up once the listing expires
+        shutil.copy2(self.test_doc_path, os.path.join(nested, 'later.docx'))
+        self.assertEqual(self.processor.list_word_files(self.temp_dir), files)
+
+        os.utime(self.temp_dir, ns=(0, 0))
+        self.assertEqual(len(self.processor.list_word_files(self.temp_dir)), 5)
+
+    def test_export_results_ndjson(self):
+        """NDJSON export writes a summary line followed by one line per occurrence"""
+        import json
+
+        results = self.processor.scan_directory_advanced(self.temp_dir, 'test', 20)
+        output_file = os.path.join(self.temp_dir, 'results.ndjson')
+        self.processor.export_results(results, output_file, ndjson=True)
+
+        with open(output_file, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertNotIn('occurrences', lines[0])
+        self.assertEqual(lines[0]['total_occurrences'], results['total_occurrences'])
+        self.assertEqual(lines[1:], results['occurrences'])
+
+    def test_fast_extraction_matches_python_docx(self):
+        """Streaming XML extraction yields the same structure as python-docx"""
+        from docx import Document
+
+        doc = Document()
+        doc.add_heading('Heading text', 1)
+        paragraph = doc.add_paragraph('plain ')
+        run = paragraph.add_run('tab\there')
+        run.add_break()
+        paragraph.add_run('after break')
+        doc.add_paragraph('')
+        table = doc.add_table(rows=3, cols=3)
+        for row in range(3):
+            for col in range(3):
+                table.cell(row, col).text = f'cell {row}{col}'
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        table.cell(2, 0).add_paragraph('second line')
+        doc_path = os.path.join(self.temp_dir, 'structure.docx')
+        doc.save(doc_path)
+
+        fast = self.processor._fast_extract_structure(doc_path, doc_path)
+        reference = AdvancedWordProcessor._docx_extract_structure(Document(doc_path), doc_path)
+        self.assertEqual(fast, reference)
+
+    def test_scan_results_cached_until_replacement(self):
+        """Repeat directory scans are served from cache until a document is edited"""
+        from unittest import mock
+
+        first = self.processor.scan_directory_advanced(self.temp_dir, 'sample', 20)
+        with mock.patch.object(self.processor, '_scan_files', side_effect=AssertionError('rescanned')):
+            second = self.processor.scan_directory_advanced(self.temp_dir, 'sample', 20)
+        self.assertEqual(first, second)
+        self.assertIsNot(first['occurrences'][0], second['occurrences'][0])
+
+        self.assertTrue(self.processor.replace_text_advanced(self.test_doc_path, 'sample', 'example')['success'])
+        third = self.processor.scan_directory_advanced(self.temp_dir, 'sample', 20)
+        self.assertEqual(third['total_occurrences'], first['total_occurrences'] - 1)
+
+    def test_doc_files_converted_in_one_batch(self):
+        """Directory scans convert every .doc file with a single textutil run"""
+        from unittest import mock
+
+        doc_dir = os.path.join(self.temp_dir, 'legacy')
+        os.makedirs(doc_dir)
+        doc_paths = [os.path.join(doc_dir, 'a.doc'), os.path.join(doc_dir, 'b.doc')]
+        for doc_path in doc_paths:
+            Path(doc_path).write_bytes(b'legacy')
+
+        calls = []
+
+        def fake_textutil(command, check=False):
+            calls.append(command)
+            output_dir = command[command.index('-outputdir') + 1]
+            for doc_path in command[3:command.index('-outputdir')]:
+                shutil.copy2(self.test_doc_path, os.path.join(output_dir, Path(doc_path).stem + '.docx'))
+
+        with mock.patch.object(self.processor, '_is_macos', return_value=True), \
+                mock.patch.object(self.processor, '_has_textutil', return_value=True), \
+                mock.patch('advanced_word_processor.subprocess.run', side_effect=fake_textutil):
+            results = self.processor.scan_directory_advanced(doc_dir, 'sample', 20)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results['files_with_matches'], 2)
+        self.assertEqual(sorted({occ['file_path'] for occ in results['occurrences']}), doc_paths)
+
+    def test_backup_survives_replacement(self):
+        """Backups are independent copies, unaffected by saving the original"""
+        with open(self.test_doc_path, 'rb') as f:
+            original = f.read()
+
+        result = self.processor.replace_text_advanced(self.test_doc_path, 'sample', 'example')
+        self.assertTrue(result['success'])
+        try:
+            with open(result['backup_path'], 'rb') as f:
+                self.assertEqual(f.read(), original)
+        finally:
+            os.remove(result['backup_path'])
+
 if __name__ == '__main__':
     unittest.main()
@@ -118,6 +118,35 @@ class TestFlaskApp(unittest.TestCase):
         self.assertFalse(result['success'])
         self.assertIn('error', result)
     
+    def test_get_context_success(self):
+        """Test fetching the context of an occurrence on demand"""
+        data = {
+            'file_path': os.path.join(self.temp_dir, 'test_document.docx'),
+            'start_pos': 24,
+            'end_pos': 28,
+            'context_chars': 5
+        }
+        
+        response = self.app.post('/api/context',
+                               data=json.dumps(data),
+                               content_type='application/json')
+        
+        self.assertEqual(response.status_code, 200)
+        result = json.loads(response.data)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['match_text'], 'test')
+        self.assertEqual(result['full_context'], 'is a test docu')
+    
+    def test_get_context_missing_parameters(self):
+        """Test context lookup with missing parameters"""
+        response = self.app.post('/api/context',
+                               data=json.dumps({'file_path': 'x.docx'}),
+                               content_type='application/json')
+        
+        self.assertEqual(response.status_code, 400)
+        result = json.loads(response.data)
+        self.assertFalse(result['success'])
+    
     def test_replace_text_success(self):
         """Test successful text replacement"""
         data = {
@@ -205,6 +234,27 @@ class TestFlaskApp(unittest.TestCase):
         self.assertTrue(result['valid'])
         self.assertIn('word_files_count', result)
     
+    def test_validate_directory_preview_only(self):
+        """Test directory validation without the full file count"""
+        for i in range(12):
+            shutil.copy2(os.path.join(self.temp_dir, 'test_document.docx'),
+                         os.path.join(self.temp_dir, f'copy_{i}.docx'))
+        data = {
+            'directory': self.temp_dir,
+            'count': False
+        }
+        
+        response = self.app.post('/api/validate_directory',
+                               data=json.dumps(data),
+                               content_type='application/json')
+        
+        self.assertEqual(response.status_code, 200)
+        result = json.loads(response.data)
+        self.assertTrue(result['valid'])
+        self.assertNotIn('word_files_count', result)
+        self.assertEqual(len(result['word_files']), 10)
+        self.assertTrue(result['has_more'])
+    
     def test_validate_directory_missing_path(self):
         """Test directory validation with missing path"""
         data = {}
@@ -14,7 +14,26 @@ from unittest.mock import patch, MagicMock
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from auto_updater import AutoUpdater
+from auto_updater import AutoUpdater, _compare_semver, _fastcopy, _hardlink_tree
+
+def _fake_git_clone(mock_popen, stdout=(), files=None):
+    """Make a mocked Popen act like a successful git clone into the command's last argument"""
+    clone_targets = []
+
+    def popen(cmd, *args, **kwargs):
+        target = cmd[-1]
+        clone_targets.append((target, os.path.exists(target) and bool(os.listdir(target))))
+        os.makedirs(target, exist_ok=True)
+        for name, data in (files or {}).items():
+            with open(os.path.join(target, name), 'w') as f:
+                f.write(data)
+        proc = MagicMock()
+        proc.__enter__.return_value.stdout = iter(stdout)
+        proc.__enter__.return_value.wait.return_value = 0
+        return proc
+
+    mock_popen.side_effect = popen
+    return clone_targets
 
 class TestAutoUpdater(unittest.TestCase):
     def setUp(self):
@@ -62,6 +81,25 @@ class TestAutoUpdater(unittest.TestCase):
         
         version = self.updater.get_latest_version()
         self.assertEqual(version, "1.2.3")
+        mock_response.read.assert_called_once_with(256)
+        self.assertEqual(mock_urlopen.call_args[1]['timeout'], 3)
+        self.assertEqual(mock_urlopen.call_args[0][0].get_header('Accept-encoding'), 'identity')
+    
+    @patch('auto_updater.urllib.request.urlopen')
+    def test_get_latest_version_not_modified(self, mock_urlopen):
+        """Test that a 304 reply reuses the cached version"""
+        import urllib.error
+
+        mock_response = MagicMock()
+        mock_response.read.return_value = b'1.2.3'
+        mock_response.headers = {'ETag': '"abc"'}
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+        self.assertEqual(self.updater.get_latest_version(), "1.2.3")
+
+        mock_urlopen.side_effect = urllib.error.HTTPError('url', 304, 'Not Modified', {}, None)
+        self.assertEqual(self.updater.get_latest_version(), "1.2.3")
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual(request.get_header('If-none-match'), '"abc"')
     
     def test_get_latest_version_via_git(self):
         """Test git fallback when raw URL fetch fails"""
@@ -100,15 +138,88 @@ class TestAutoUpdater(unittest.TestCase):
             self.assertIsNone(current)
             self.assertIsNone(latest)
     
-    @patch('auto_updater.subprocess.run')
+    def test_check_for_updates_skips_network_without_push(self):
+        """Test that recent webhook traffic without a push avoids polling"""
+        self.updater.record_webhook()
+        with patch.object(self.updater, 'get_current_version', return_value="1.2.3"):
+            with patch.object(self.updater, 'get_latest_version') as latest_mock:
+                has_update, current, latest = self.updater.check_for_updates()
+                latest_mock.assert_not_called()
+                self.assertFalse(has_update)
+
+            self.updater.record_webhook("abc123")
+            with patch.object(self.updater, '_get_remote_version_url', return_value="1.3.0") as url_mock, \
+                    patch.object(self.updater, 'get_latest_version') as latest_mock:
+                has_update, current, latest = self.updater.check_for_updates()
+                url_mock.assert_called_once_with(commit="abc123")
+                latest_mock.assert_not_called()
+                self.assertTrue(has_update)
+                self.assertEqual(latest, "1.3.0")
+        self.assertIsNone(self.updater._read_webhook_state()['pending'])
+
+    def test_pending_push_survives_stale_branch_version(self):
+        """Test that a push stays pending while the branch still serves the cached version"""
+        self.updater._write_version_cache('"etag"', "1.2.3")
+        self.updater.record_webhook("abc123")
+        with patch.object(self.updater, 'get_current_version', return_value="1.2.3"), \
+                patch.object(self.updater, '_get_remote_version_url', return_value=None):
+            with patch.object(self.updater, 'get_latest_version', return_value="1.2.3"):
+                has_update, _, _ = self.updater.check_for_updates()
+                self.assertFalse(has_update)
+            self.assertEqual(self.updater._read_webhook_state()['pending'], "abc123")
+
+            with patch.object(self.updater, 'get_latest_version', return_value="1.3.0"):
+                has_update, _, latest = self.updater.check_for_updates()
+                self.assertTrue(has_update)
+                self.assertEqual(latest, "1.3.0")
+        self.assertIsNone(self.updater._read_webhook_state()['pending'])
+    
+    def test_webhook_blueprint_verifies_signature(self):
+        """Test that the webhook endpoint rejects unsigned deliveries and records pushes"""
+        import hashlib
+        import hmac
+        import json
+        from flask import Flask
+        from auto_updater import create_webhook_blueprint
+
+        app = Flask(__name__)
+        app.register_blueprint(create_webhook_blueprint(self.updater, 'secret'))
+        client = app.test_client()
+        body = json.dumps({'ref': 'refs/heads/main', 'after': 'abc123'}).encode()
+        signature = 'sha256=' + hmac.new(b'secret', body, hashlib.sha256).hexdigest()
+
+        response = client.post('/github-webhook', data=body, headers={'X-GitHub-Event': 'push'})
+        self.assertEqual(response.status_code, 403)
+
+        response = client.post('/github-webhook', data=body, headers={
+            'X-GitHub-Event': 'push',
+            'X-Hub-Signature-256': signature
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.updater._read_webhook_state()['pending'], 'abc123')
+
+        # GitHub's default form-encoded delivery, and a malformed body
+        from urllib.parse import urlencode
+        form_body = urlencode({'payload': json.dumps({'ref': 'refs/heads/main', 'after': 'def456'})}).encode()
+        for data, status in ((form_body, 200), (b'not json', 400)):
+            response = client.post('/github-webhook', data=data, headers={
+                'X-GitHub-Event': 'push',
+                'Content-Type': 'application/x-www-form-urlencoded' if data is form_body else 'application/json',
+                'X-Hub-Signature-256': 'sha256=' + hmac.new(b'secret', data, hashlib.sha256).hexdigest()
+            })
+            self.assertEqual(response.status_code, status)
+        self.assertEqual(self.updater._read_webhook_state()['pending'], 'def456')
+    
+    @patch('auto_updater.subprocess.Popen')
     @patch('auto_updater.shutil')
-    def test_update_application(self, mock_shutil, mock_run):
+    def test_update_application(self, mock_shutil, mock_popen):
         """Test application update process"""
         # Mock successful git clone
-        mock_run.return_value.returncode = 0
+        _fake_git_clone(mock_popen, stdout=["Cloning into '...'\n"])
         
-        # Mock get_latest_version
-        with patch.object(self.updater, 'get_latest_version', return_value="def456"):
+        # Mock get_latest_version; the tarball download is unavailable so git clone is used
+        with patch.object(self.updater, 'get_latest_version', return_value="def456"), \
+                patch.object(self.updater, '_extract_tarball', return_value=False):
             result = self.updater.update_application()
             
             self.assertTrue(result)
@@ -118,8 +229,144 @@ class TestAutoUpdater(unittest.TestCase):
             with open(self.updater.version_file, 'r') as f:
                 self.assertEqual(f.read().strip(), "def456")
     
-    @patch('auto_updater.subprocess.run')
-    def test_install_dependencies(self, mock_run):
+    @patch('auto_updater.subprocess.Popen')
+    @patch('auto_updater.shutil')
+    def test_update_application_reuses_checked_version(self, mock_shutil, mock_popen):
+        """Test the version from check_for_updates is written without a second lookup"""
+        _fake_git_clone(mock_popen)
+        
+        with patch.object(self.updater, '_get_remote_version_url', return_value="2.0.0") as mock_remote, \
+                patch.object(self.updater, '_extract_tarball', return_value=False):
+            has_update, _, latest = self.updater.check_for_updates()
+            self.assertTrue(has_update)
+            self.assertTrue(self.updater.update_application(latest))
+            
+            self.assertEqual(mock_remote.call_count, 1)
+            with open(self.updater.version_file, 'r') as f:
+                self.assertEqual(f.read().strip(), "2.0.0")
+            self.assertIsNone(self.updater._cached_latest)
+    
+    @patch('auto_updater.subprocess.Popen')
+    @patch('auto_updater.urllib.request.urlopen')
+    def test_update_application_from_tarball(self, mock_urlopen, mock_popen):
+        """Test updating from the codeload tarball without running git"""
+        import io
+        import tarfile
+
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode='w:gz') as tar:
+            for name, data in [('test-repo-main/app.py', b'print("new")\n'),
+                               ('test-repo-main/.version', b'1.4.0\n'),
+                               ('test-repo-main/backups/old.docx', b'skip')]:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        mock_urlopen.side_effect = lambda *args, **kwargs: io.BytesIO(archive.getvalue())
+        with open(os.path.join(self.temp_dir, 'app.py'), 'w') as f:
+            f.write('print("old")\n')
+
+        self.assertEqual(self.updater._get_latest_via_git(), "1.4.0")
+        with patch.object(self.updater, 'get_latest_version', return_value="1.4.0"):
+            self.assertTrue(self.updater.update_application())
+
+        mock_popen.assert_not_called()
+        with open(os.path.join(self.temp_dir, 'app.py')) as f:
+            self.assertEqual(f.read(), 'print("new")\n')
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, 'backups', 'old.docx')))
+        # The hard-linked backup keeps the old contents
+        backup_root = os.path.join(self.temp_dir, 'backups')
+        backup_app = os.path.join(backup_root, os.listdir(backup_root)[0], 'app.py')
+        with open(backup_app) as f:
+            self.assertEqual(f.read(), 'print("old")\n')
+    
+    @patch('auto_updater.subprocess.Popen')
+    def test_update_application_clones_after_partial_tarball(self, mock_popen):
+        """Test a tarball download failing part way falls back to cloning into an empty directory"""
+        import io
+        import tarfile
+
+        data = b'print("partial")\n'
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode='w') as tar:
+            info = tarfile.TarInfo('partial.py')
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+        archive.seek(0)
+
+        def broken_tarball():
+            with tarfile.open(fileobj=archive) as tar:
+                member = tar.getmember('partial.py')
+                yield 'partial.py', member, tar
+                raise ConnectionResetError("connection reset")
+
+        clone_targets = _fake_git_clone(mock_popen, files={'app.py': 'print("cloned")\n'})
+        with patch.object(self.updater, '_iter_tarball_files', side_effect=broken_tarball), \
+                patch.object(self.updater, 'get_latest_version', return_value="1.5.0"):
+            self.assertTrue(self.updater.update_application())
+
+        self.assertEqual(len(clone_targets), 1)
+        _, target_had_files = clone_targets[0]
+        self.assertFalse(target_had_files)
+        with open(os.path.join(self.temp_dir, 'app.py')) as f:
+            self.assertEqual(f.read(), 'print("cloned")\n')
+        # Only the successful source is installed
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, 'partial.py')))
+
+    def test_hardlink_tree(self):
+        """Test the backup snapshot links files instead of copying them"""
+        src = os.path.join(self.temp_dir, 'static')
+        os.makedirs(os.path.join(src, 'css'))
+        with open(os.path.join(src, 'css', 'style.css'), 'w') as f:
+            f.write('body {}')
+        dst = os.path.join(self.temp_dir, 'snapshot')
+
+        _hardlink_tree(src, dst)
+
+        self.assertTrue(os.path.samefile(os.path.join(src, 'css', 'style.css'),
+                                         os.path.join(dst, 'css', 'style.css')))
+    
+    def test_compare_semver(self):
+        """Test version ordering for plain and prerelease versions"""
+        self.assertEqual(_compare_semver("1.10.0", "1.9.9"), 1)
+        self.assertEqual(_compare_semver(" 2.0.0\n", "2.0.0"), 0)
+        self.assertEqual(_compare_semver("2.0.0-rc.1", "2.0.0"), -1)
+        self.assertEqual(_compare_semver("2.0.0-rc.2", "2.0.0-rc.10"), -1)
+        self.assertEqual(_compare_semver("2.0.0+build.5", "2.0.0"), 0)
+    
+    def test_walk_update_tree_prunes_excluded_names(self):
+        """Test the update tree walk skips excluded directories and files"""
+        root = os.path.join(self.temp_dir, 'tree')
+        for rel in ('app.py', 'static/script.js', '.git/HEAD', 'sub/__pycache__/x.pyc', 'sub/.DS_Store'):
+            path = os.path.join(root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write('x')
+
+        found = sorted(os.path.relpath(p, root) for p in self.updater._walk_update_tree(
+            root, {'.git', '__pycache__'}, {'.DS_Store'}))
+
+        self.assertEqual(found, ['app.py', os.path.join('static', 'script.js')])
+    
+    def test_fastcopy_copies_data_and_metadata(self):
+        """Test the kernel-side copy helper"""
+        src = os.path.join(self.temp_dir, 'src.bin')
+        dst = os.path.join(self.temp_dir, 'dst.bin')
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        with open(src, 'wb') as f:
+            f.write(data)
+        os.chmod(src, 0o640)
+        os.utime(src, (1000000000, 1000000000))
+
+        _fastcopy(src, dst)
+
+        with open(dst, 'rb') as f:
+            self.assertEqual(f.read(), data)
+        self.assertEqual(os.stat(dst).st_mode & 0o777, 0o640)
+        self.assertEqual(int(os.stat(dst).st_mtime), 1000000000)
+    
+    @patch('auto_updater.subprocess.Popen')
+    def test_install_dependencies(self, mock_popen):
         """Test dependency installation"""
         # Create a requirements file
         req_file = os.path.join(self.temp_dir, "requirements.txt")
@@ -127,20 +374,25 @@ class TestAutoUpdater(unittest.TestCase):
             f.write("requests==2.31.0\n")
         
         # Mock successful pip install
-        mock_run.return_value.returncode = 0
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout = iter(["Collecting requests==2.31.0\n", "Successfully installed requests\n"])
+        proc.wait.return_value = 0
         
-        result = self.updater.install_dependencies()
+        with self.assertLogs('auto_updater', level='INFO') as logs:
+            result = self.updater.install_dependencies()
         self.assertTrue(result)
+        # pip's output is logged as it arrives
+        self.assertTrue(any(line.endswith(':Collecting requests==2.31.0') for line in logs.output))
         
         # Verify pip install was called
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
         self.assertIn("pip", args)
         self.assertIn("install", args)
         self.assertIn("-r", args)
     
-    @patch('auto_updater.subprocess.run')
-    def test_install_dependencies_failure(self, mock_run):
+    @patch('auto_updater.subprocess.Popen')
+    def test_install_dependencies_failure(self, mock_popen):
         """Test dependency installation failure"""
         # Create a requirements file
         req_file = os.path.join(self.temp_dir, "requirements.txt")
@@ -148,8 +400,9 @@ class TestAutoUpdater(unittest.TestCase):
             f.write("requests==2.31.0\n")
         
         # Mock failed pip install
-        mock_run.return_value.returncode = 1
-        mock_run.return_value.stderr = "Package not found"
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout = iter(["ERROR: Package not found\n"])
+        proc.wait.return_value = 1
         
         result = self.updater.install_dependencies()
         self.assertFalse(result)
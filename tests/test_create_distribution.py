@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the zip writer in create_distribution.py
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+import json
+import time
+import zipfile
+import sys
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import create_distribution
+from create_distribution import ZIP_PREFETCH_MAX_BYTES, iter_files, write_release_zip, write_zip_entries
+
+class TestZipWriter(unittest.TestCase):
+    def setUp(self):
+        """Build a small tree covering every way an entry can be written"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tree = os.path.join(self.temp_dir, 'Example.app')
+        big = ZIP_PREFETCH_MAX_BYTES + (512 << 10)
+        self.contents = {
+            'Contents/Info.plist': b'<plist>example</plist>\n' * 50,
+            'Contents/Resources/icon.png': os.urandom(4096),
+            'Contents/Resources/empty.txt': b'',
+            # Larger than the prefetch limit: streamed through zipf.open when deflated,
+            # copied straight from the file when stored
+            'Contents/Resources/big.log': b'line of compressible log text\n' * (big // 30),
+            'Contents/Resources/big.zip': os.urandom(big),
+        }
+        for rel_path, data in self.contents.items():
+            path = os.path.join(self.tree, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(data)
+        os.symlink('Info.plist', os.path.join(self.tree, 'Contents', 'link.plist'))
+        self.contents['Contents/link.plist'] = self.contents['Contents/Info.plist']
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+
+    def assert_round_trip(self, zip_path, expected):
+        with zipfile.ZipFile(zip_path) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(sorted(zipf.namelist()), sorted(expected))
+            for name, data in expected.items():
+                self.assertEqual(zipf.read(name), data, name)
+
+    def test_write_zip_entries_round_trip(self):
+        """Precompressed, copied and streamed entries read back intact at every level"""
+        generated_path = os.path.join(self.tree, 'Contents', 'Info.plist')
+        generated = b'<plist>generated</plist>\n'
+        expected = dict(self.contents)
+        expected['Contents/Info.plist'] = generated
+        preloaded = {os.path.normpath(generated_path): (generated, 0o100644, time.time())}
+        prefix_len = len(os.path.join(self.tree, ''))
+
+        for level in (0, 1, 6, 9):
+            with self.subTest(level=level):
+                zip_path = os.path.join(self.temp_dir, f'level{level}.zip')
+                entries = ((path, path[prefix_len:]) for path in iter_files(self.tree))
+                with patch.object(create_distribution, '_append_precompressed',
+                                  wraps=create_distribution._append_precompressed) as append, \
+                        zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=level) as zipf:
+                    write_zip_entries(zipf, entries, preloaded=preloaded)
+
+                self.assert_round_trip(zip_path, expected)
+                copied = [call for call in append.call_args_list if call.kwargs.get('source_path')]
+                self.assertEqual(len(copied), 1)
+                self.assertGreater(append.call_count, len(copied))
+                with zipfile.ZipFile(zip_path) as zipf:
+                    self.assertEqual(zipf.getinfo('Contents/Resources/big.log').compress_type,
+                                     zipfile.ZIP_DEFLATED)
+                    self.assertEqual(zipf.getinfo('Contents/Resources/big.zip').compress_type,
+                                     zipfile.ZIP_STORED)
+
+    def test_write_release_zip(self):
+        """Release zips hold the app's contents, following symlinks, plus version.json"""
+        version_info = {'version': '1.2.3'}
+        zip_path = os.path.join(self.temp_dir, 'release.zip')
+
+        write_release_zip(self.tree, zip_path, version_info)
+
+        expected = dict(self.contents)
+        expected['version.json'] = json.dumps(version_info, indent=2).encode('utf-8')
+        self.assert_round_trip(zip_path, expected)
+
+if __name__ == '__main__':
+    unittest.main()
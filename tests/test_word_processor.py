@@ -92,6 +92,37 @@ class TestWordProcessor(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertIn('success', result)
     
+    def test_replace_text_counts_every_occurrence(self):
+        """replacements_made counts occurrences, not paragraphs touched"""
+        from docx import Document
+
+        doc = Document()
+        doc.add_paragraph('test once, test twice')
+        doc.add_paragraph('no match here')
+        doc_path = os.path.join(self.temp_dir, 'counts.docx')
+        doc.save(doc_path)
+
+        result = self.processor.replace_text(doc_path, 'test', 'example')
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['replacements_made'], 2)
+        self.assertEqual(Document(doc_path).paragraphs[0].text, 'example once, example twice')
+    
+    def test_replace_many_single_pass(self):
+        """Several replacements are applied together, longest key first"""
+        from docx import Document
+
+        doc = Document()
+        doc.add_paragraph('test tests tested')
+        doc_path = os.path.join(self.temp_dir, 'many.docx')
+        doc.save(doc_path)
+
+        result = self.processor.replace_many(doc_path, {'test': 'exam', 'tests': 'quizzes'})
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['replacements_made'], 3)
+        self.assertEqual(Document(doc_path).paragraphs[0].text, 'exam quizzes examed')
+    
     def test_scan_directory(self):
         """Test directory scanning"""
         results = self.processor.scan_directory(self.temp_dir, 'test')
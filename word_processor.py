@@ -6,7 +6,7 @@ Handles reading, searching, and modifying Microsoft Word documents
 
 import os
 import re
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from pathlib import Path
 import logging
 
@@ -22,6 +22,13 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _count_replace(text: str, old_text: str, new_text: str) -> Tuple[str, int]:
+    """Replace every occurrence of old_text in text, returning the new text and the count."""
+    count = text.count(old_text)
+    if not count:
+        return text, 0
+    return text.replace(old_text, new_text), count
+
 class WordProcessor:
     """Handles Word document operations for find and replace functionality"""
     
@@ -71,6 +78,8 @@ class WordProcessor:
         
         occurrences = []
         search_pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+        paragraph_index = 0
+        counted_to = 0
         
         for match in search_pattern.finditer(text):
             start_pos = match.start()
@@ -83,8 +92,9 @@ class WordProcessor:
             context_before = text[context_start:start_pos]
             context_after = text[end_pos:context_end]
             full_context = text[context_start:context_end]
-            # Find which paragraph this occurs in
-            paragraph_index = text[:start_pos].count('\n')
+            # Find which paragraph this occurs in, counting only the newlines since the last match
+            paragraph_index += text.count('\n', counted_to, start_pos)
+            counted_to = start_pos
             
             occurrences.append({
                 'file_path': file_path,
@@ -149,16 +159,18 @@ class WordProcessor:
             doc = Document(file_path)
 
             for paragraph in doc.paragraphs:
-                if old_text in paragraph.text:
-                    paragraph.text = paragraph.text.replace(old_text, new_text)
-                    replacements_made += 1
+                text, count = _count_replace(paragraph.text, old_text, new_text)
+                if count:
+                    paragraph.text = text
+                    replacements_made += count
 
             for table in doc.tables:
                 for row in table.rows:
                     for cell in row.cells:
-                        if old_text in cell.text:
-                            cell.text = cell.text.replace(old_text, new_text)
-                            replacements_made += 1
+                        text, count = _count_replace(cell.text, old_text, new_text)
+                        if count:
+                            cell.text = text
+                            replacements_made += count
 
             if replacements_made > 0:
                 doc.save(file_path)
@@ -172,6 +184,65 @@ class WordProcessor:
             result['error'] = str(exc)
             return result
 
+    def replace_many(self, file_path: str, mapping: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Apply several replacements to a document in one pass over each paragraph and cell
+        
+        All keys are combined into one longest-first alternation, so each text is scanned
+        once regardless of how many replacements are requested, and a key never loses to
+        one of its own prefixes.
+        """
+        result = {
+            'success': False,
+            'file_path': file_path,
+            'replacements_made': 0,
+            'error': None
+        }
+
+        try:
+            if not Path(file_path).exists():
+                result['error'] = f"File {file_path} does not exist"
+                return result
+
+            mapping = {old_text: new_text for old_text, new_text in mapping.items() if old_text}
+            if not mapping:
+                result['error'] = "No replacements provided"
+                return result
+
+            pattern = re.compile('|'.join(re.escape(old_text) for old_text in sorted(mapping, key=len, reverse=True)))
+
+            def substitute(match) -> str:
+                return mapping[match.group()]
+
+            replacements_made = 0
+            doc = Document(file_path)
+
+            for paragraph in doc.paragraphs:
+                text, count = pattern.subn(substitute, paragraph.text)
+                if count:
+                    paragraph.text = text
+                    replacements_made += count
+
+            for table in doc.tables:
+                for row in table.rows:
+                    for cell in row.cells:
+                        text, count = pattern.subn(substitute, cell.text)
+                        if count:
+                            cell.text = text
+                            replacements_made += count
+
+            if replacements_made > 0:
+                doc.save(file_path)
+                result['success'] = True
+                result['replacements_made'] = replacements_made
+            else:
+                result['error'] = "No occurrences of the requested text found"
+            return result
+        except Exception as exc:
+            logger.error(f"Error replacing text in {file_path}: {exc}")
+            result['error'] = str(exc)
+            return result
+
     def scan_directory(self, directory_path: str, search_term: str, context_chars: int = 100) -> Dict[str, Any]:
         """
         Scan a directory for Word files and find all occurrences of search_term